@@ -0,0 +1,262 @@
+import os
+import json
+import socket
+import tempfile
+import argparse
+import threading
+import socketserver
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "sappho-analysis-%d.sock" % os.getuid())
+DEFAULT_METRICS = ["rsquared", "pearson"]
+
+# Protocol: one JSON object per line in each direction, any number of requests per connection.
+#   {"command": "analyse", "files": [path, ...] | "profiles": [[...], ...], "names": [...],
+#    "metrics": ["rsquared", ...], "k": 1, "pixels": null, "normalized": false}
+#   -> {"ok": true, "samples": [...], "templates": [...],
+#       "results": {metric: {"values": samples x templates, "best": {sample: [[template, value], ...]}}}}
+#   {"command": "templates"} -> {"ok": true, "templates": [...], "pixels": n}
+#   {"command": "ping"} / {"command": "shutdown"}
+# Errors come back as {"ok": false, "error": "..."} and leave the connection open.
+# The client side only needs socket and json, the analysis modules are imported by the worker when it starts.
+
+
+class AnalysisWorker:
+    # Everything that does not depend on the capture is prepared once: normalized templates, their segment
+    # spectra (kept in spectral's memory cache), the cluster model and the imports of the heavy libraries.
+
+    def __init__(self, template_set="default", model_file=None, nperseg=None, band=None, log_scale=True):
+        from clustering import ClusterModel
+        from pipeline import load_prepared_templates
+        from similarity import pairwise_similarity, ks_matrix
+        from spectral import coherence_matrix, cross_correlation_summary
+
+        self.template_set = template_set
+        self.templates = load_prepared_templates(template_set, log_scale)
+        self.nperseg = nperseg or (750 if template_set == "sap" else 64)
+        self.band = band
+        self.models = {}
+        if model_file:
+            model = ClusterModel.load(model_file)
+            self.models[model.n_features] = model
+
+        # DTW keeps the templates of the current call in module globals, calls are serialised
+        self._dtw_lock = threading.Lock()
+        self._model_lock = threading.Lock()
+
+        self.metrics = {
+            "rsquared": lambda t, s: pairwise_similarity(t, s, ("r2",))["r2"],
+            "pearson": lambda t, s: pairwise_similarity(t, s, ("pearson",))["pearson"],
+            "euclidean": lambda t, s: pairwise_similarity(t, s, ("euclidean",))["euclidean"],
+            "coherence": lambda t, s: coherence_matrix(t, s, self.nperseg, cache_dir=None),
+            "xcorr": lambda t, s: cross_correlation_summary(t, s, normalize=True)["peak"],
+            "ks": lambda t, s: ks_matrix(t, s)["statistic"],
+            "dtw": self._dtw,
+            "cluster": self._clusters,
+        }
+
+    def _dtw(self, templates, samples):
+        from dtw import dtw_matrix
+
+        with self._dtw_lock:
+            return dtw_matrix(templates, samples, self.band, workers=1)
+
+    def model(self, templates):
+        # One model per profile length, seeded with and fitted on the templates the first time it is needed
+        from clustering import ClusterModel
+
+        with self._model_lock:
+            width = templates.shape[1]
+            if width not in self.models:
+                self.models[width] = ClusterModel(seeds=templates).fit(templates)
+
+            return self.models[width]
+
+    def _clusters(self, templates, samples):
+        # One-hot matrix of the cluster every sample falls in, with seeded clusters named after their template
+        import numpy as np
+        from sample_set import LabelledMatrix
+
+        model = self.model(templates)
+        labels = model.predict(samples)
+        names = model.seed_names or [str(cluster) for cluster in range(model.n_clusters)]
+        membership = (np.arange(len(names))[:, None] == labels[None, :]).astype(np.float64)
+
+        return LabelledMatrix(membership, names, samples.names, "cluster", True)
+
+    def warm_up(self):
+        # Runs every metric once on the templates themselves, after that requests only pay for their samples
+        self.analyse(self.templates.copy(), list(self.metrics))
+        return self
+
+    def load_captures(self, files, pixels=None):
+        # Averaged profile of every capture file, normalized like sanitised data. Captures of different
+        # sensors cannot share a matrix, there is one SampleSet per pixel count.
+        from generate_sanitised_data import parse_sample_file, split_data_into_arrays, calculate_element_averages
+        from pipeline import prepare_samples
+        from sample_set import SampleSet, capture_pixels
+
+        groups = {}
+        for file_path in files:
+            numbers = parse_sample_file(file_path)
+            split = split_data_into_arrays({os.path.basename(file_path): numbers}, pixels or capture_pixels(file_path))
+            groups.setdefault(split.shape[1], []).append(calculate_element_averages(split))
+
+        return [prepare_samples(SampleSet.concatenate(averages)) for averages in groups.values()]
+
+    def analyse(self, samples, metrics=DEFAULT_METRICS, k=1):
+        import numpy as np
+        from pipeline import align
+
+        unknown = [metric for metric in metrics if metric not in self.metrics]
+        if unknown:
+            raise ValueError("Unknown metrics %s, available: %s" % (unknown, sorted(self.metrics)))
+
+        templates, samples = align(self.templates, samples)
+        results = {}
+        for metric in metrics:
+            matrix = self.metrics[metric](templates, samples)
+            results[metric] = {"values": np.asarray(matrix.values).T.tolist(), "best": matrix.best_matches(k)}
+
+        return {"samples": samples.names, "templates": templates.names, "results": results}
+
+    def handle(self, request):
+        import numpy as np
+        from pipeline import prepare_samples
+        from sample_set import SampleSet
+
+        command = request.get("command", "analyse")
+
+        if command == "ping":
+            return {}
+        if command == "templates":
+            return {"templates": self.templates.names, "pixels": int(self.templates.shape[1])}
+        if command != "analyse":
+            raise ValueError("Unknown command %r" % command)
+
+        if "files" in request:
+            groups = self.load_captures(request["files"], request.get("pixels"))
+        elif "profiles" in request:
+            samples = SampleSet(np.array(request["profiles"], dtype=np.float32), request.get("names"))
+            groups = [samples if request.get("normalized", False) else prepare_samples(samples)]
+        else:
+            raise ValueError("An analyse request needs files or profiles")
+
+        metrics = request.get("metrics", DEFAULT_METRICS)
+        responses = [self.analyse(samples, metrics, request.get("k", 1)) for samples in groups]
+
+        # Samples of all groups in one response, in the order the groups were built
+        response = {"samples": [], "templates": self.templates.names,
+                    "results": {metric: {"values": [], "best": {}} for metric in metrics}}
+        for group in responses:
+            response["samples"].extend(group["samples"])
+            for metric, result in group["results"].items():
+                response["results"][metric]["values"].extend(result["values"])
+                response["results"][metric]["best"].update(result["best"])
+
+        return response
+
+
+class AnalysisRequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            shutdown = False
+            try:
+                request = json.loads(line)
+                shutdown = request.get("command") == "shutdown"
+                response = {"ok": True} if shutdown else dict(self.server.worker.handle(request), ok=True)
+            except Exception as error:
+                response = {"ok": False, "error": "%s: %s" % (type(error).__name__, error)}
+
+            self.wfile.write((json.dumps(response) + "\n").encode())
+            self.wfile.flush()
+
+            if shutdown:
+                # Only once the reply is sent, the process exits with the server. shutdown() waits for
+                # serve_forever to return, so it cannot run on this thread.
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+
+class AnalysisServer(socketserver.ThreadingUnixStreamServer):
+    # Every client connection gets its own thread, the worker and its caches are shared
+    daemon_threads = True
+
+    def __init__(self, socket_path, worker):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)  # Left behind by a worker that did not shut down cleanly
+
+        self.worker = worker
+        self.socket_path = socket_path
+        super().__init__(socket_path, AnalysisRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def serve(socket_path=DEFAULT_SOCKET, template_set="default", model_file=None, nperseg=None, band=None):
+    worker = AnalysisWorker(template_set, model_file, nperseg, band).warm_up()
+
+    with AnalysisServer(socket_path, worker) as server:
+        print("Analysis worker listening on %s" % socket_path, flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def send_request(request, socket_path=DEFAULT_SOCKET):
+    # One request and its response over a new connection
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall((json.dumps(request) + "\n").encode())
+
+        with connection.makefile("rb") as reader:
+            response = json.loads(reader.readline())
+
+    if not response.pop("ok"):
+        raise RuntimeError(response["error"])
+
+    return response
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Long-running analysis worker on a Unix socket, and its client")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="socket path (default: %s)" % DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_command = commands.add_parser("serve", help="start the worker")
+    serve_command.add_argument("--templates", default="default",
+                               help="'default', 'sap', a template bank, a .bin file or a directory")
+    serve_command.add_argument("--model", default=None, help="saved cluster model (default: fitted on the templates)")
+    serve_command.add_argument("--nperseg", type=int, default=None, help="coherence segment length")
+    serve_command.add_argument("--band", type=int, default=None, help="DTW band (default: 10%% of the length)")
+
+    analyse_command = commands.add_parser("analyse", help="send capture files to a running worker")
+    analyse_command.add_argument("files", nargs="+", help="capture .txt files")
+    analyse_command.add_argument("--metrics", nargs="+", default=DEFAULT_METRICS, help="metrics to compute")
+    analyse_command.add_argument("-k", type=int, default=1, help="best templates per sample")
+    analyse_command.add_argument("--pixels", type=int, default=None, help="pixels per frame")
+
+    commands.add_parser("shutdown", help="stop a running worker")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket, args.templates, args.model, args.nperseg, args.band)
+    elif args.command == "shutdown":
+        send_request({"command": "shutdown"}, args.socket)
+    else:
+        response = send_request({"command": "analyse", "files": [os.path.abspath(path) for path in args.files],
+                                 "metrics": args.metrics, "k": args.k, "pixels": args.pixels}, args.socket)
+        for metric, result in response["results"].items():
+            for sample, matches in result["best"].items():
+                print("%-10s %-20s %s" % (metric, sample, ", ".join("%s (%.4g)" % tuple(match) for match in matches)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import tracemalloc
+import subprocess
+
+import numpy as np
+
+import data_analysis
+import data_analysis_sap
+import spectral
+from generate_sanitised_data import read_text_files, split_data_into_arrays, calculate_element_averages, \
+    write_averages_to_file
+from resampling import resample_to_common_grid
+from sample_set import SampleSet, SAPPHO_GEOMETRY, SAMPLE_GEOMETRY
+from synthetic_data import generate_captures
+
+BENCHMARK_FILE = "benchmark_results.json"
+DEFAULT_SIZES = ["4x67", "16x67", "64x67"]  # files x frames per file
+
+# Every metric is called with (templates, samples) like in the analysis scripts
+METRICS = {
+    "coherence": data_analysis.coherence,
+    "cross_correlation": data_analysis.cross_correlation,
+    "rsquared": data_analysis.rsquared,
+    "pearsoncalc": data_analysis.pearsoncalc,
+    "dynamic_time_warping": data_analysis.dynamic_time_warping,
+    "kolmogorov_smirnov_test": data_analysis.kolmogorov_smirnov_test,
+    "kmeans_clustering": data_analysis.kmeans_clustering,
+    "fourier_transform": lambda templates, samples: data_analysis.fourier_transform(samples, "fourier_results.txt"),
+    "wavelet_transform": lambda templates, samples: data_analysis.wavelet_transform(samples, "wavelet_results.npz"),
+}
+
+
+def parse_size(size):
+    files, frames = size.lower().split("x")
+    return int(files), int(frames)
+
+
+def measure(function, repeat=3, setup=None):
+    # Best and mean wall time over repeat calls, then the peak Python/numpy allocation of one more call.
+    # Tracing slows allocations down, so the traced call is never one of the timed ones.
+    # setup runs before every call and is not timed.
+    times = []
+
+    for _ in range(repeat):
+        arguments = setup() if setup else ()
+        start = time.perf_counter()
+        result = function(*arguments)
+        times.append(time.perf_counter() - start)
+
+    arguments = setup() if setup else ()
+    tracing = tracemalloc.is_tracing()  # Already on when the benchmark itself is profiled
+    if tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    traced_start = tracemalloc.get_traced_memory()[0]
+
+    function(*arguments)
+    peak = tracemalloc.get_traced_memory()[1] - traced_start
+    if not tracing:
+        tracemalloc.stop()
+
+    return result, {"best_seconds": min(times), "mean_seconds": sum(times) / len(times), "peak_bytes": peak}
+
+
+def templates_for(pixels):
+    # Templates of the script that matches the sensor, resampled when the lengths still differ
+    if pixels == len(data_analysis_sap.THEORETICAL_DATA[0]):
+        templates = SampleSet.from_rows(data_analysis_sap.THEORETICAL_DATA, names=data_analysis_sap.THEORETICAL_NAMES)
+    else:
+        templates = SampleSet.from_rows(data_analysis.THEORETICAL_DATA, names=data_analysis.THEORETICAL_NAMES)
+
+    return data_analysis.normalize_data(data_analysis.log_transform(templates))
+
+
+def benchmark_size(work_dir, files, frames, pixels, prefix, metrics, repeat):
+    samples_dir = os.path.join(work_dir, "Samples")
+    generate_captures(samples_dir, files, frames, pixels, prefix)
+    input_bytes = sum(os.path.getsize(os.path.join(samples_dir, name)) for name in os.listdir(samples_dir))
+    records = []
+
+    def record(stage, stats, items=None):
+        stats = dict(stats, stage=stage, files=files, frames=frames, pixels=pixels)
+        if items is not None:
+            stats["items_per_second"] = items / stats["best_seconds"] if stats["best_seconds"] else None
+        if stage.startswith("read_text_files"):
+            stats["bytes_per_second"] = input_bytes / stats["best_seconds"] if stats["best_seconds"] else None
+        records.append(stats)
+        print("%-28s %5d files x %5d frames  %10.4f s  %12s peak bytes"
+              % (stage, files, frames, stats["best_seconds"], stats["peak_bytes"]), file=sys.stderr)
+
+    # Cold ingest parses every file, a fresh cache directory per run (the timed ones and the traced one);
+    # warm ingest only maps the cache
+    cache_dirs = iter(os.path.join(work_dir, "cache_%d" % run) for run in range(repeat + 1))
+    _, stats = measure(read_text_files, repeat, lambda: (samples_dir, None, next(cache_dirs)))
+    record("read_text_files", stats, files)
+    data, stats = measure(read_text_files, repeat, lambda: (samples_dir, None, os.path.join(work_dir, "cache_0")))
+    record("read_text_files_cached", stats, files)
+
+    split_data, stats = measure(split_data_into_arrays, repeat, lambda: (data, pixels))
+    record("split_data_into_arrays", stats, files * frames)
+    averages, stats = measure(calculate_element_averages, repeat, lambda: (split_data,))
+    record("calculate_element_averages", stats, files * frames)
+
+    sanitised_file = os.path.join(work_dir, "sanitised_data.bin")
+    write_averages_to_file(averages, sanitised_file)
+    samples, stats = measure(data_analysis.import_sanitised_data, repeat, lambda: (sanitised_file,))
+    record("import_sanitised_data", stats, files)
+    samples, stats = measure(data_analysis.normalize_data, repeat, lambda: (samples.copy(),))
+    record("normalize_data", stats, files)
+
+    templates = templates_for(pixels)
+    if templates.shape[1] != samples.shape[1]:
+        _, (templates, samples) = resample_to_common_grid([templates, samples])
+
+    for name in metrics:
+        # Every run starts from an empty results directory and spectra cache so appends and cache hits do
+        # not skew the timings
+        def setup():
+            shutil.rmtree("results", ignore_errors=True)
+            shutil.rmtree(spectral.SPECTRA_CACHE_DIRECTORY, ignore_errors=True)
+            spectral._memory_cache.clear()
+            return templates, samples
+
+        _, stats = measure(METRICS[name], repeat, setup)
+        record(name, stats, len(templates) * len(samples))
+
+    return records
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {"commit": commit, "python": platform.python_version(), "numpy": np.__version__,
+            "machine": platform.machine(), "processor": platform.processor(), "cpus": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, pixels=None, prefix="Sappho_", metrics=None, repeat=3,
+                   output_file=BENCHMARK_FILE):
+    # Every size runs in its own temporary directory, also the working directory for the results/ files
+    metrics = metrics or list(METRICS)
+    output_file = os.path.abspath(output_file)
+    records = []
+    previous_directory = os.getcwd()
+
+    for size in sizes:
+        files, frames = parse_size(size)
+        work_dir = tempfile.mkdtemp(prefix="sappho_benchmark_")
+        try:
+            os.chdir(work_dir)
+            capture_pixels = pixels or (SAMPLE_GEOMETRY if prefix == "Sample_" else SAPPHO_GEOMETRY).pixels
+            records.extend(benchmark_size(work_dir, files, frames, capture_pixels, prefix, metrics, repeat))
+        finally:
+            os.chdir(previous_directory)
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {"environment": environment(), "repeat": repeat, "results": records}
+    with open(output_file, "w") as file:
+        json.dump(report, file, indent=1)
+
+    return report
+
+
+def compare(baseline_file, current_file, threshold=1.1):
+    # Time and memory ratios current / baseline of every stage and size, flags the ones over threshold
+    with open(baseline_file) as file:
+        baseline = {(r["stage"], r["files"], r["frames"], r["pixels"]): r for r in json.load(file)["results"]}
+    with open(current_file) as file:
+        current = json.load(file)["results"]
+
+    regressions = []
+    for record in current:
+        key = (record["stage"], record["files"], record["frames"], record["pixels"])
+        if key not in baseline:
+            continue
+
+        old = baseline[key]
+        time_ratio = record["best_seconds"] / old["best_seconds"] if old["best_seconds"] else np.nan
+        memory_ratio = record["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] else np.nan
+        flag = "  <-- regression" if time_ratio > threshold or memory_ratio > threshold else ""
+        if flag:
+            regressions.append(key)
+
+        print("%-28s %5d x %5d  time x%6.2f  memory x%6.2f%s" % (key[0], key[1], key[2], time_ratio, memory_ratio, flag))
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time ingest and every metric on synthetic captures")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="dataset sizes as FILESxFRAMES")
+    parser.add_argument("--pixels", type=int, default=None, help="pixels per frame (default: from the prefix)")
+    parser.add_argument("--prefix", choices=("Sappho_", "Sample_"), default="Sappho_", help="capture file prefix")
+    parser.add_argument("--metrics", nargs="+", choices=sorted(METRICS), default=None, help="metrics to time")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, the best time is kept")
+    parser.add_argument("-o", "--output", default=BENCHMARK_FILE, help="JSON results file")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the new results with an earlier JSON file")
+    args = parser.parse_args()
+
+    run_benchmarks(args.sizes, args.pixels, args.prefix, args.metrics, args.repeat, args.output)
+
+    if args.compare:
+        sys.exit(1 if compare(args.compare, args.output) else 0)
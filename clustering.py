@@ -0,0 +1,185 @@
+import os
+
+import numpy as np
+
+from sample_set import as_sample_set
+from results_store import fingerprint
+
+DEFAULT_BATCH_SIZE = 1024
+
+
+def gen_batches(num_rows, batch_size, min_batch_size=0):
+    # scikit-learn's batching (the last batch is merged into the previous one when too small), imported on use
+    from sklearn.utils import gen_batches
+    return gen_batches(num_rows, batch_size, min_batch_size=min_batch_size)
+
+
+class ClusterModel:
+    # k-means over profiles, optionally after an incremental PCA, that only ever holds one batch of rows.
+    # fit runs Lloyd iterations to convergence, every pass accumulating the centroid sums batch by batch, so
+    # it gives the same clusters as KMeans with the same seeds. partial_fit then updates a fitted model with
+    # more profiles one mini-batch step at a time. Centroids can be seeded from any subset of the template
+    # bank, and a fitted model can be saved and later updated or used to assign new captures without refitting.
+
+    def __init__(self, n_clusters=3, seeds=None, n_components=None, batch_size=DEFAULT_BATCH_SIZE, random_state=0,
+                 max_iter=300, tol=1e-4):
+        self.seeds = None if seeds is None else as_sample_set(seeds)
+        self.n_clusters = len(self.seeds) if self.seeds is not None else n_clusters
+        self.n_components = n_components
+        self.batch_size = batch_size
+        self.random_state = random_state
+        self.max_iter = max_iter
+        self.tol = tol
+        self.seed_names = self.seeds.names if self.seeds is not None else None
+        self.seed_fingerprint = fingerprint(self.seeds.values) if self.seeds is not None else None
+
+        self.pca = None
+        self.centers = None
+        self.counts = None  # Profiles every centroid has seen, the weight of its current position
+        self.inertia = None
+        self.n_iter = 0
+
+    @property
+    def n_features(self):
+        # Width of the profiles the model was fitted on
+        return self.pca.n_features_in_ if self.pca is not None else self.centers.shape[1]
+
+    def _batches(self, data):
+        # Each batch must hold at least as many rows as there are PCA components
+        return gen_batches(len(data), self.batch_size, min_batch_size=self.n_components or 0)
+
+    def transform(self, data):
+        values = np.asarray(as_sample_set(data).values, dtype=np.float64)
+
+        return self.pca.transform(values) if self.pca is not None else values
+
+    def _nearest(self, values):
+        # Closest centroid of every row and the squared distance to it
+        distances = (values ** 2).sum(axis=1)[:, None] - 2 * values @ self.centers.T + \
+            (self.centers ** 2).sum(axis=1)[None, :]
+        labels = distances.argmin(axis=1)
+        return labels, np.maximum(distances[np.arange(len(values)), labels], 0)
+
+    def _initialise(self, data):
+        # PCA (if any) fitted on the data, centroids from the seeds or k-means++ on the first batch
+        if self.n_components:
+            from sklearn.decomposition import IncrementalPCA
+
+            self.pca = IncrementalPCA(self.n_components)
+            for batch in self._batches(data):
+                self.pca.partial_fit(np.asarray(data.values[batch], dtype=np.float64))
+
+        if self.seeds is not None:
+            self.centers = self.transform(self.seeds).copy()
+        else:
+            from sklearn.cluster import kmeans_plusplus
+
+            first = self.transform(data[next(iter(self._batches(data)))])
+            self.centers, _ = kmeans_plusplus(first, self.n_clusters, random_state=self.random_state)
+
+        self.counts = np.zeros(self.n_clusters)
+
+    def fit(self, data):
+        data = as_sample_set(data)
+        self._initialise(data)
+
+        # Like KMeans, the tolerance is relative to the mean variance of the features
+        total, squares = 0, 0
+        for batch in self._batches(data):
+            values = self.transform(data[batch])
+            total = total + values.sum(axis=0)
+            squares = squares + (values ** 2).sum(axis=0)
+        tolerance = self.tol * np.mean(squares / len(data) - (total / len(data)) ** 2)
+
+        for self.n_iter in range(1, self.max_iter + 1):
+            sums = np.zeros_like(self.centers)
+            counts = np.zeros(self.n_clusters)
+            inertia = 0.0
+            for batch in self._batches(data):
+                values = self.transform(data[batch])
+                labels, distances = self._nearest(values)
+                np.add.at(sums, labels, values)
+                counts += np.bincount(labels, minlength=self.n_clusters)
+                inertia += distances.sum()
+
+            # A centroid left without profiles stays where it is
+            centers = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], self.centers)
+            shift = ((centers - self.centers) ** 2).sum()
+            self.centers, self.counts, self.inertia = centers, counts, inertia
+            if shift <= tolerance:
+                break
+
+        return self
+
+    def partial_fit(self, data):
+        # Update the clusters with more profiles, one mini-batch step per batch. Each centroid moves towards
+        # the mean of its new profiles in proportion to how many it gets compared to all it has seen.
+        # On an unfitted model the PCA (if any) and the centroids are first initialised from these profiles.
+        data = as_sample_set(data)
+
+        if self.centers is None:
+            self._initialise(data)
+
+        for batch in self._batches(data):
+            values = self.transform(data[batch])
+            labels, _ = self._nearest(values)
+            sums = np.zeros_like(self.centers)
+            np.add.at(sums, labels, values)
+            counts = np.bincount(labels, minlength=self.n_clusters)
+
+            seen = self.counts + counts
+            moved = counts > 0
+            self.centers[moved] = (self.centers[moved] * self.counts[moved, None] + sums[moved]) / seen[moved, None]
+            self.counts = seen
+
+        return self
+
+    def predict(self, data):
+        data = as_sample_set(data)
+        labels = np.empty(len(data), dtype=np.int64)
+
+        for batch in gen_batches(len(data), self.batch_size):
+            labels[batch] = self._nearest(self.transform(data[batch]))[0]
+
+        return labels
+
+    def save(self, file_path):
+        # The seed profiles are not needed once the model is fitted
+        seeds, self.seeds = self.seeds, None
+        import joblib
+        try:
+            joblib.dump(self, file_path)
+        finally:
+            self.seeds = seeds
+
+    @staticmethod
+    def load(file_path):
+        import joblib
+        return joblib.load(file_path)
+
+
+def load_or_fit(data, model_file, seeds=None, n_components=None, refit=False, update=None):
+    # The model saved in model_file if it was fitted from the same seeds and settings on profiles as wide as data,
+    # otherwise (or with refit) a model fitted on data from the seeds and saved there. New profiles given as
+    # update move the centroids of a loaded model with partial_fit instead of refitting it.
+    data = as_sample_set(data)
+    seed_fingerprint = fingerprint(as_sample_set(seeds).values) if seeds is not None else None
+
+    if not refit and os.path.exists(model_file):
+        model = ClusterModel.load(model_file)
+        if getattr(model, "seed_fingerprint", None) == seed_fingerprint and \
+                model.n_components == n_components and model.n_features == data.shape[1]:
+            if update is not None:
+                model.partial_fit(update)
+                model.save(model_file)
+            return model
+
+    model = ClusterModel(seeds=seeds, n_components=n_components).fit(data)
+    model.save(model_file)
+
+    return model
+
+
+def assign_clusters(data, model_file):
+    # Cluster labels of new captures from a saved model, without refitting
+    return ClusterModel.load(model_file).predict(data)
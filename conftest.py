@@ -0,0 +1,11 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def profiles():
+    # profiles(rows, points, seed): reproducible random profiles in [0, 1)
+    def make(rows, points, seed):
+        return np.random.default_rng(seed).random((rows, points))
+
+    return make
@@ -1,44 +1,51 @@
 import numpy as np
-from scipy import signal
 import os
-from scipy.spatial.distance import euclidean
-from scipy.fft import fft
-import pywt
-from sklearn.cluster import KMeans
-from scipy.stats import ks_2samp, linregress, pearsonr
-from sklearn.metrics import r2_score
-import math
 
+from instrumentation import stage, rows, result_rows, pairs
+from sample_set import SampleSet, as_sample_set
+from sanitised_store import load_sanitised_data
+from similarity import pairwise_similarity, ks_matrix
+from spectral import coherence_matrix, cross_correlation_summary
+from dtw import dtw_matrix
+from clustering import load_or_fit
+from wavelets import wavelet_decompose, threshold_coefficients, save_coefficients
+from results_store import store_results
 
-def import_sanitised_data(file_path="sanitised_data.txt"):
-    data = []
+# Pair metrics are kept as labelled binary matrices, one row per sample, see results_store.py
+RESULTS_STORE = os.path.join("results", "store_sap")
 
-    with open(file_path, "r") as file:
-        lines = file.readlines()
 
-    for line in lines:
-        # Remove leading/trailing whitespace and brackets
-        line = line.strip().strip("[]")
-        elements = line.split(", ")
+@stage(items=result_rows)
+def import_sanitised_data(file_path="sanitised_data.bin"):
+    # Binary files are memory-mapped, text files from older runs are still parsed
+    return load_sanitised_data(file_path)
 
-        # Convert elements to floats and append them to the data list
-        data.append([float(element) for element in elements])
 
-    return data
+@stage(items=rows)
+def normalize_data(data):
+    # Min-max normalize every row in place, all rows at once
+    data = as_sample_set(data)
+    values = data.writable()
 
+    min_values = values.min(axis=1, keepdims=True)
+    max_values = values.max(axis=1, keepdims=True)
+    values -= min_values
+    values /= max_values - min_values
 
-def normalize_data(data):
-    normalized_data = []
+    return data
 
-    for arr in data:
-        min_value = min(arr)
-        max_value = max(arr)
-        normalized_array = [(x - min_value) / (max_value - min_value) for x in arr]
-        normalized_data.append(normalized_array)
 
-    return normalized_data
+@stage(items=rows)
+def log_transform(data):
+    # Natural logarithm of every element, in place
+    data = as_sample_set(data)
+    values = data.writable()
+    np.log(values, out=values)
+
+    return data
 
 
+@stage(items=rows)
 def write_results_to_file(results, filename):
     # Create "results" directory if it doesn't exist
     if not os.path.exists("results"):
@@ -52,152 +59,146 @@ def write_results_to_file(results, filename):
             file.write(str(result) + '\n')
 
 
-def coherence(theoretical_data, experimental_data):
-    coherences = []
+@stage(items=pairs)
+def coherence(theoretical_data, experimental_data, nperseg=750, window="hann", noverlap=None, store=RESULTS_STORE,
+              replace=False):
+    # Segment spectra of every signal are computed once (and cached on disk), all pairs come from batched products
+    coherences = coherence_matrix(theoretical_data, experimental_data, nperseg, window, noverlap)
 
-    for theoretical_array in theoretical_data:
-        for experimental_array in experimental_data:
-            f, Pxy = signal.csd(theoretical_array, experimental_array, fs=1, nperseg=750)
-            f, Pxx = signal.csd(theoretical_array, theoretical_array, fs=1, nperseg=750)
-            f, Pyy = signal.csd(experimental_array, experimental_array, fs=1, nperseg=750)
+    store_results("coherence", coherences, {"nperseg": nperseg, "window": window, "noverlap": noverlap},
+                  replace, store, (theoretical_data, experimental_data))
 
-            coherence = np.abs(Pxy) ** 2 / (Pxx * Pyy)
-            mean_coherence = np.mean(coherence)
+    return coherences
 
-            coherences.append(mean_coherence)
 
-    write_results_to_file(coherences, "coherence_results.txt")
+@stage(items=pairs)
+def cross_correlation(theoretical_data, experimental_data, normalize=False, max_lag=None, full_output=False,
+                      store=RESULTS_STORE, replace=False):
+    # Peak value, lag of the peak and zero-lag value of every pair, stored as xcorr_peak, xcorr_lag and
+    # xcorr_zero_lag. The full curves are only written (as a binary theoretical x experimental x lags
+    # array) when full_output is set.
+    curves_file = None
+    if full_output:
+        os.makedirs("results", exist_ok=True)
+        curves_file = os.path.join("results", "xcorr_curves.npy")
 
+    summary = cross_correlation_summary(theoretical_data, experimental_data, normalize, max_lag, curves_file)
 
-def cross_correlation(theoretical_data, experimental_data):
-    cross_correlations = []
+    for name, matrix in summary.items():
+        store_results("xcorr_" + name, matrix, {"normalize": normalize, "max_lag": max_lag}, replace, store,
+                      (theoretical_data, experimental_data))
 
-    for theoretical_array in theoretical_data:
-        for experimental_array in experimental_data:
-            result = signal.correlate(theoretical_array, experimental_array, mode="full")
+    return summary
 
-            cross_correlations.append(result.tolist())
+@stage(items=pairs)
+def rsquared(theoretical_data, experimental_data, store=RESULTS_STORE, replace=False):
+    # R² of every theoretical x experimental pair in one batched pass
+    r_squared = pairwise_similarity(theoretical_data, experimental_data, ("r2",))["r2"]
 
-    write_results_to_file(cross_correlations, "xcorr_results.txt")
+    store_results("rsquared", r_squared, replace=replace, directory=store, inputs=(theoretical_data, experimental_data))
 
-def rsquared(theoretical_data, experimental_data):
-    r_squared_arr = []
-    for theoretical_array in theoretical_data:
-        for experimental_array in experimental_data: 
-            r_value = r2_score(theoretical_array, experimental_array)
-            r_squared_arr.append(r_value)
-    write_results_to_file(r_squared_arr, "rsquare_results.txt")
+    return r_squared
 
-def pearsoncalc(theoretical_data, experimental_data):
-    pearson_arr = []
-    for theoretical_array in theoretical_data:
-        for experimental_array in experimental_data:
-            r, p_value = pearsonr(theoretical_array, experimental_array)
-            pearson_arr.append(r)
-    write_results_to_file(pearson_arr, "pearson_results.txt")
+@stage(items=pairs)
+def pearsoncalc(theoretical_data, experimental_data, store=RESULTS_STORE, replace=False):
+    # Pearson r of every theoretical x experimental pair in one batched pass
+    pearson = pairwise_similarity(theoretical_data, experimental_data, ("pearson",))["pearson"]
 
-def dynamic_time_warping(theoretical_data, experimental_data):
-    dtw_results = []
+    store_results("pearson", pearson, replace=replace, directory=store, inputs=(theoretical_data, experimental_data))
 
-    for theoretical_array in theoretical_data:
-        for experimental_array in experimental_data:
-            # Convert lists to NumPy arrays and ensure they are 1D
-            theoretical_array = np.array(theoretical_array, dtype=float).ravel()
-            experimental_array = np.array(experimental_array, dtype=float).ravel()
+    return pearson
 
-            # Calculate DTW distance using the Euclidean distance function
-            dtw_distance = euclidean(theoretical_array, experimental_array)
+@stage(items=pairs)
+def dynamic_time_warping(theoretical_data, experimental_data, band=None, workers=None, store=RESULTS_STORE,
+                         replace=False):
+    # Banded DTW distance of every theoretical x experimental pair, samples spread over all CPU cores
+    distances = dtw_matrix(theoretical_data, experimental_data, band, workers)
 
-            # Append DTW distance to the results list
-            dtw_results.append(dtw_distance)
+    store_results("dtw", distances, {"band": band}, replace, store, (theoretical_data, experimental_data))
 
-    write_results_to_file(dtw_results, "dtw_results.txt")
+    return distances
 
 
+@stage(items=rows)
 def fourier_transform(data, filename):
-    data_fft = np.abs(fft(data))
+    from scipy.fft import fft
+    data_fft = np.abs(fft(np.asarray(data), axis=1))
 
     write_results_to_file(data_fft.tolist(), filename)
 
 
-def wavelet_transform(data, filename):
-    wavelet_results = []
-    formatted_wavelet_results = []
+@stage(items=rows)
+def wavelet_transform(data, filename, wavelet="haar", level=1, denoise=False):
+    # Decompose every profile in one batched call, coefficients are stored per level in a binary .npz file
+    coeffs = wavelet_decompose(data, wavelet, level)
+    if denoise:
+        coeffs = threshold_coefficients(coeffs)
 
-    for data_array in data:
-        # Choose a wavelet family and level for the transform
-        wavelet = "haar"
-        level = 1
+    os.makedirs("results", exist_ok=True)
+    save_coefficients(coeffs, os.path.join("results", os.path.splitext(filename)[0] + ".npz"),
+                      as_sample_set(data).names, wavelet)
 
-        # Perform the discrete wavelet transform
-        coeffs = pywt.wavedec(data_array, wavelet, level=level)
+    return coeffs
 
-        # Append the wavelet coefficients to the results list
-        wavelet_results.append(coeffs)
 
-        # Flatten the structure
-        flattened_wavelet_results = [item for sublist in wavelet_results for item in sublist]
+@stage(items=result_rows)
+def kmeans_clustering(theoretical_data, experimental_data, seeds=None, n_components=None, model_file="cluster_model.joblib",
+                      refit=False, update=False):
+    # Batched k-means seeded from a subset of the templates (by default theoretical_data). The model saved in results/
+    # is reused while it was fitted from the same seeds, so later runs assign their captures without refitting;
+    # update moves its centroids towards the new captures and refit fits it from the seeds again.
+    if seeds is None:
+        seeds = theoretical_data
 
-        # Convert the NumPy arrays to lists
-        formatted_wavelet_results = [item.tolist() for item in flattened_wavelet_results]
+    data_array = SampleSet.concatenate([experimental_data, theoretical_data])
 
-    write_results_to_file(formatted_wavelet_results, filename)
+    model = load_or_fit(data_array, os.path.join("results", model_file), seeds, n_components, refit,
+                        experimental_data if update else None)
+    cluster_labels = model.predict(data_array)
 
+    write_results_to_file(cluster_labels.tolist(), "cluster_results.txt")
 
-def kmeans_clustering(theoretical_data, experimental_data):
-    combined_data = theoretical_data + experimental_data
-    kmeans_results = []
-    num_clusters = 3
+    return cluster_labels
 
-    # Convert the data to a NumPy array
-    data_array = experimental_data + theoretical_data
-    # Perform K-means clustering
-    kmeans = KMeans(n_clusters=num_clusters, init=theoretical_data, n_init=1, random_state=0)
-    kmeans.fit(data_array)                                        
 
-    # Get the cluster labels for each data point
-    cluster_labels = kmeans.labels_
+@stage(items=pairs)
+def kolmogorov_smirnov_test(theoretical_data, experimental_data, pvalues=True, store=RESULTS_STORE, replace=False):
+    # Statistic (and p-value) matrices of every theoretical x experimental pair, stored as ks_statistic and ks_pvalue
+    ks_results = ks_matrix(theoretical_data, experimental_data, pvalues)
 
-    for label in cluster_labels:
-        kmeans_results.append(label)
+    for name, matrix in ks_results.items():
+        store_results("ks_" + name, matrix, replace=replace, directory=store, inputs=(theoretical_data, experimental_data))
 
-    write_results_to_file(kmeans_results, "cluster_results.txt")
+    return ks_results
 
 
-def kolmogorov_smirnov_test(theoretical_data, experimental_data):
-    ks_results = []
-
-    for theoretical_array in theoretical_data:
-        for experimental_array in experimental_data:
-            ks_statistic, ks_p_value = ks_2samp(theoretical_array, experimental_array)
-            ks_results.append((ks_statistic, ks_p_value))
+# Replace with actual theoretical data (2um 22.5dg, 4.8um 22.5dg, 9.6um 22.5dg)
+THEORETICAL_NAMES = ["2um 22.5dg", "4.8um 22.5dg", "9.6um 22.5dg"]
+THEORETICAL_DATA = [[507.4142813, 501.3576904, 495.3644089, 489.4373216, 483.5793157, 477.7932805, 472.0821061, 466.4486834, 460.8959027, 455.4266533, 450.0438226, 444.7502954, 439.5489533, 434.4426735, 429.4343285, 424.5267852, 419.7229036, 415.0255371, 410.4375307, 405.9617206, 401.6009337, 397.3579861, 393.2356831, 389.2368179, 385.364171, 381.6205092, 378.008585, 374.5311359, 371.1908833, 367.9905318, 364.9327684, 362.0202619, 359.2556618, 356.6415975, 354.1806777, 351.8754896, 349.7285977, 347.7425435, 345.9198445, 344.2629931, 342.7744564, 341.4566746, 340.3120612, 339.3430011, 338.5518507, 337.9409367, 337.5125552, 337.2689711, 337.2124175, 337.3450944, 337.6691682, 338.1867711, 338.9000001, 339.810916, 340.9215431, 342.2338683, 343.7498401, 345.471368, 347.4003217, 349.5385306, 351.8877827, 354.4498239, 357.2263575, 360.2190433, 363.4294971, 366.8592894, 370.5099456, 374.3829443, 378.4797174, 382.801649, 387.3500749, 392.1262817, 397.1315064, 402.3669355, 407.8337046, 413.5328976, 419.465546, 425.6326282, 432.0350695, 438.6737407, 445.5494578, 452.6629815, 460.0150167, 467.6062117, 475.4371576, 483.508388, 491.8203784, 500.3735456, 509.168247, 518.2047805, 527.4833837, 537.0042335, 546.7674457, 556.7730745, 567.021112, 577.5114876, 588.2440682, 599.218657, 610.4349937, 621.8927536, 633.5915479, 645.5309227, 657.710359, 670.1292723, 682.7870122, 695.6828623, 708.8160398, 722.1856951, 735.7909118, 749.6307062, 763.7040273, 778.0097565, 792.5467073, 807.3136255, 822.3091883, 837.5320051, 852.9806166, 868.6534949, 884.5490439, 900.6655983, 917.0014244, 933.5547194, 950.323612, 967.3061617, 984.5003594, 1001.904127, 1019.515318, 1037.331717, 1055.351039, 1073.570932, 1091.988975, 1110.602678, 1129.409485, 1148.406769, 1167.591836, 1186.961927, 1206.514213, 1226.245799, 1246.153722, 1266.234954, 1286.4864, 1306.904898, 1327.487223, 1348.230082, 1369.13012, 1390.183914, 1411.38798, 1432.73877, 1454.232671, 1475.866009, 1497.635047, 1519.535988, 1541.564972, 1563.718079, 1585.991329, 1608.380684, 1630.882045, 1653.491257, 1676.204107, 1699.016323, 1721.923581, 1744.921498, 1768.005639, 1791.171514, 1814.414579, 1837.730241, 1861.113851, 1884.560714, 1908.066082, 1931.625159, 1955.233103, 1978.885022, 2002.575979, 2026.300993, 2050.055038, 2073.833045, 2097.629902, 2121.440458, 2145.259519, 2169.081855, 2192.902196, 2216.715236, 2240.515635, 2264.298015, 2288.056968, 2311.787052, 2335.482794, 2359.138694, 2382.74922, 2406.308814, 2429.811894, 2453.25285, 2476.626052, 2499.925845, 2523.146557, 2546.282492, 2569.32794, 2592.277174, 2615.124449, 2637.86401, 2660.490087, 2682.996901, 2705.378663, 2727.629576, 2749.743837, 2771.715638, 2793.539167, 2815.208611, 2836.718158, 2858.061994, 2879.234312, 2900.229307, 2921.04118, 2941.664142, 2962.09241, 2982.320214, 3002.341798, 3022.151417, 3041.743346, 3061.111874, 3080.251311, 3099.155989, 3117.820261, 3136.238505, 3154.405126, 3172.314556, 3189.961258, 3207.339726, 3224.444485, 3241.270098, 3257.811164, 3274.062319, 3290.018241, 3305.67365, 3321.023308, 3336.062025, 3350.784657, 3365.186109, 3379.261339, 3393.005355, 3406.413223, 3419.480063, 3432.201053, 3444.571433, 3456.586503, 3468.241629, 3479.53224, 3490.453833, 3501.001976, 3511.172305, 3520.960531, 3530.362438, 3539.373887, 3547.990817, 3556.209246, 3564.025277, 3571.435091, 3578.434959, 3585.021236, 3591.190366, 3596.938886, 3602.263422, 3607.160695, 3611.627522, 3615.660817, 3619.257594, 3622.414965, 3625.130148, 3627.400462, 3629.223332, 3630.596294, 3631.516988, 3631.983167, 3631.992697, 3631.543555, 3630.633837, 3629.261753, 3627.425631, 3625.123922, 3622.355197, 3619.118147, 3615.411593, 3611.234477, 3606.585871, 3601.464974, 3595.871117, 3589.80376, 3583.262497, 3576.247057, 3568.757303, 3560.793236, 3552.354992, 3543.442851, 3534.057229, 3524.198685, 3513.867922, 3503.065785, 3491.793265, 3480.051499, 3467.84177, 3455.16551, 3442.024301, 3428.419873, 3414.354108, 3399.82904, 3384.846856, 3369.409896, 3353.520654, 3337.181782, 3320.396084, 3303.166524, 3285.496221, 3267.388453, 3248.846657, 3229.874429, 3210.475525, 3190.653861, 3170.413513, 3149.75872, 3128.693881, 3107.223559, 3085.352477, 3063.085522, 3040.427744, 3017.384356, 2993.960734, 2970.162418, 2945.995112, 2921.464683, 2896.577161, 2871.338742, 2845.755783, 2819.834806, 2793.582498, 2767.005706, 2740.111442, 2712.906881, 2685.399361, 2657.596381, 2629.505602, 2601.134847, 2572.4921, 2543.585505, 2514.423367, 2485.01415, 2455.366475, 2425.489124, 2395.391035, 2365.081302, 2334.569175, 2303.864061, 2272.975518, 2241.91326, 2210.687151, 2179.307208, 2147.783597, 2116.126632, 2084.346779, 2052.454646, 2020.460988, 1988.376706, 1956.212842, 1923.98058, 1891.691243, 1859.356295, 1826.987336, 1794.5961, 1762.194457, 1729.79441, 1697.40809, 1665.047759, 1632.725806, 1600.454745, 1568.247214, 1536.115973, 1504.0739, 1472.133994, 1440.309367, 1408.613245, 1377.058968, 1345.659983, 1314.429845, 1283.382215, 1252.530856, 1221.889632, 1191.472504, 1161.293532, 1131.366866, 1101.706748, 1072.32751, 1043.243568, 1014.469422, 986.0196534, 957.9089209, 930.151959, 902.763575, 875.7586459, 849.1521161, 822.9589943, 797.1943506, 771.8733137, 747.0110682, 722.622851, 698.7239491, 675.329696, 652.4554689, 630.1166855, 608.328801, 587.1073048, 566.4677174, 546.4255874, 526.9964879, 508.1960134, 490.0397766, 472.5434051, 455.7225377, 439.5928218, 424.169909, 409.4694526, 395.5071036, 382.2985076, 369.859301, 358.2051077, 347.3515358, 337.3141733, 328.1085857, 319.7503113, 312.2548583, 305.6377011, 299.9142764, 295.0999798, 291.2101623, 288.2601261, 286.2651217, 285.2403434, 285.2009262, 286.161942, 288.1383954, 291.1452209, 295.1972782, 300.3093491, 306.4961336, 313.772246, 322.1522115, 331.6504619, 342.2813324, 354.0590577, 366.9977681, 381.1114856, 396.4141209, 412.9194686, 430.6412043, 449.5928805, 469.7879228, 491.2396265, 513.9611526, 537.965524, 563.2656223, 589.8741834, 617.8037945, 647.06689, 677.675748, 709.6424865, 742.9790602, 777.6972564, 813.8086915, 851.3248078, 890.2568694, 930.6159592, 972.412975, 1015.658626, 1060.36343, 1106.537708, 1154.191584, 1203.334978, 1253.977606, 1306.128975, 1359.798378, 1414.994894, 1471.727382, 1530.004481, 1589.834603, 1651.225932, 1714.18642, 1778.723786, 1844.845509, 1912.558829, 1981.870742, 2052.787998, 2125.317095, 2199.464281, 2275.235548, 2352.63663, 2431.672999, 2512.349867, 2594.672175, 2678.6446, 2764.271544, 2851.557137, 2940.505232, 3031.119405, 3123.402947, 3217.358871, 3312.989899, 3410.298468, 3509.286725, 3609.956524, 3712.309425, 3816.346691, 3922.069288, 4029.477881, 4138.572834, 4249.354205, 4361.821749, 4475.974913, 4591.812835, 4709.334344, 4828.537954, 4949.421869, 5071.983978, 5196.221853, 5322.132749, 5449.713603, 5578.961034, 5709.871338, 5842.440491, 5976.664146, 6112.537635, 6250.055963, 6389.213812, 6530.005538, 6672.425172, 6816.466417, 6962.122652, 7109.386925, 7258.251959, 7408.710149, 7560.753561, 7714.373934, 7869.562678, 8026.310876, 8184.609282, 8344.448323, 8505.818099, 8668.708381, 8833.108616, 8999.007923, 9166.395094, 9335.2586, 9505.586584, 9677.366867, 9850.586946, 10025.234, 10201.29488, 10378.75612, 10557.60395, 10737.82425, 10919.40261, 11102.32431, 11286.57429, 11472.13721, 11658.99738, 11847.13884, 12036.5453, 12227.20018, 12419.08659, 12612.18732, 12806.4849, 13001.96152, 13198.59911, 13396.37929, 13595.28339, 13795.29246, 13996.38725, 14198.54824, 14401.75563, 14605.98932, 14811.22896, 15017.45392, 15224.6433, 15432.77592, 15641.83037, 15851.78493, 16062.61767, 16274.30638, 16486.8286, 16700.16163, 16914.28252, 17129.16808, 17344.79488, 17561.13926, 17778.17734, 17995.88498, 18214.23786, 18433.2114, 18652.78084, 18872.92119, 19093.60725, 19314.81362, 19536.51471, 19758.68473, 19981.2977, 20204.32743, 20427.74759, 20651.53164, 20875.65288, 21100.08444, 21324.79928, 21549.7702, 21774.96985, 22000.37073, 22225.94518, 22451.66543, 22677.50354, 22903.43145, 23129.42098, 23355.44383, 23581.47156, 23807.47564, 24033.42743, 24259.29818, 24485.05906, 24710.68113, 24936.13537, 25161.39268, 25386.42388, 25611.19973, 25835.69091, 26059.86806, 26283.70173, 26507.16246, 26730.22073, 26952.84696, 27175.01158, 27396.68496, 27617.83746, 27838.43941, 28058.46115, 28277.873, 28496.64528, 28714.74832, 28932.15246, 29148.82805, 29364.74548, 29579.87514, 29794.18748, 30007.65297, 30220.24213, 30431.92555, 30642.67383, 30852.45768, 31061.24784, 31269.01516, 31475.73052, 31681.36492, 31885.88945, 32089.27527, 32291.49366, 32492.516, 32692.31378, 32890.85861, 33088.12222, 33284.07647, 33478.69335, 33671.945, 33863.8037, 34054.24186, 34243.23208, 34430.74709, 34616.75981, 34801.24331, 34984.17086, 35165.51589, 35345.25202, 35523.35309, 35699.7931, 35874.54628, 36047.58705, 36218.89006, 36388.43017, 36556.18245, 36722.12223, 36886.22504, 37048.46666, 37208.82313, 37367.27072, 37523.78594, 37678.34559, 37830.92671, 37981.5066, 38130.06286, 38276.57334, 38421.01617, 38563.36979, 38703.61289, 38841.72449, 38977.68389, 39111.47069, 39243.0648, 39372.44644, 39499.59614, 39624.49475, 39747.12345, 39867.46373, 39985.49742, 40101.20668, 40214.57402, 40325.58226, 40434.21458, 40540.45452, 40644.28596, 40745.69312, 40844.6606, 40941.17335, 41035.21668, 41126.77628, 41215.83818, 41302.38882, 41386.41498, 41467.90385, 41546.84297, 41623.22029, 41697.02412, 41768.24319, 41836.86658, 41902.88379, 41966.28471, 42027.05963, 42085.19922, 42140.69457, 42193.53716, 42243.71888, 42291.23203, 42336.06932, 42378.22384, 42417.68913, 42454.45912, 42488.52816, 42519.891, 42548.54282, 42574.47921, 42597.69619, 42618.19017, 42635.95801, 42650.99696, 42663.30472, 42672.87939, 42679.71949, 42683.82398, 42685.19221, 42685.19221, 42683.82398, 42679.71949, 42672.87939, 42663.30472, 42650.99696, 42635.95801, 42618.19017, 42597.69619, 42574.47921, 42548.54282, 42519.891, 42488.52816, 42454.45912, 42417.68913, 42378.22384, 42336.06932, 42291.23203, 42243.71888, 42193.53716, 42140.69457, 42085.19922, 42027.05963, 41966.28471, 41902.88379, 41836.86658, 41768.24319, 41697.02412, 41623.22029, 41546.84297, 41467.90385, 41386.41498, 41302.38882, 41215.83818, 41126.77628, 41035.21668, 40941.17335, 40844.6606, 40745.69312, 40644.28596, 40540.45452, 40434.21458, 40325.58226, 40214.57402, 40101.20668, 39985.49742, 39867.46373, 39747.12345, 39624.49475, 39499.59614, 39372.44644, 39243.0648, 39111.47069, 38977.68389, 38841.72449, 38703.61289, 38563.36979, 38421.01617, 38276.57334, 38130.06286, 37981.5066, 37830.92671, 37678.34559, 37523.78594, 37367.27072, 37208.82313, 37048.46666, 36886.22504, 36722.12223, 36556.18245, 36388.43017, 36218.89006, 36047.58705, 35874.54628, 35699.7931, 35523.35309, 35345.25202, 35165.51589, 34984.17086, 34801.24331, 34616.75981, 34430.74709, 34243.23208, 34054.24186, 33863.8037, 33671.945, 33478.69335, 33284.07647, 33088.12222, 32890.85861, 32692.31378, 32492.516, 32291.49366, 32089.27527, 31885.88945, 31681.36492, 31475.73052, 31269.01516, 31061.24784, 30852.45768, 30642.67383, 30431.92555, 30220.24213, 30007.65297, 29794.18748, 29579.87514, 29364.74548, 29148.82805, 28932.15246, 28714.74832, 28496.64528, 28277.873, 28058.46115, 27838.43941, 27617.83746, 27396.68496, 27175.01158, 26952.84696, 26730.22073, 26507.16246, 26283.70173, 26059.86806, 25835.69091, 25611.19973, 25386.42388, 25161.39268, 24936.13537, 24710.68113, 24485.05906, 24259.29818, 24033.42743, 23807.47564, 23581.47156, 23355.44383, 23129.42098, 22903.43145, 22677.50354, 22451.66543, 22225.94518, 22000.37073, 21774.96985, 21549.7702, 21324.79928, 21100.08444, 20875.65288, 20651.53164, 20427.74759, 20204.32743, 19981.2977, 19758.68473, 19536.51471, 19314.81362, 19093.60725, 18872.92119, 18652.78084, 18433.2114, 18214.23786, 17995.88498, 17778.17734, 17561.13926, 17344.79488, 17129.16808, 16914.28252, 16700.16163, 16486.8286, 16274.30638, 16062.61767, 15851.78493, 15641.83037, 15432.77592, 15224.6433, 15017.45392, 14811.22896, 14605.98932, 14401.75563, 14198.54824, 13996.38725, 13795.29246, 13595.28339, 13396.37929, 13198.59911, 13001.96152, 12806.4849, 12612.18732, 12419.08659, 12227.20018, 12036.5453, 11847.13884, 11658.99738, 11472.13721, 11286.57429, 11102.32431, 10919.40261, 10737.82425, 10557.60395, 10378.75612, 10201.29488, 10025.234, 9850.586946, 9677.366867, 9505.586584, 9335.2586, 9166.395094, 8999.007923, 8833.108616, 8668.708381, 8505.818099, 8344.448323, 8184.609282, 8026.310876, 7869.562678, 7714.373934, 7560.753561, 7408.710149, 7258.251959, 7109.386925, 6962.122652, 6816.466417, 6672.425172, 6530.005538, 6389.213812, 6250.055963, 6112.537635, 5976.664146, 5842.440491, 5709.871338, 5578.961034, 5449.713603, 5322.132749, 5196.221853, 5071.983978, 4949.421869, 4828.537954, 4709.334344, 4591.812835, 4475.974913, 4361.821749, 4249.354205, 4138.572834, 4029.477881, 3922.069288, 3816.346691, 3712.309425, 3609.956524, 3509.286725, 3410.298468, 3312.989899, 3217.358871, 3123.402947, 3031.119405, 2940.505232, 2851.557137, 2764.271544, 2678.6446, 2594.672175, 2512.349867, 2431.672999, 2352.63663, 2275.235548, 2199.464281, 2125.317095, 2052.787998, 1981.870742, 1912.558829, 1844.845509, 1778.723786, 1714.18642, 1651.225932, 1589.834603, 1530.004481, 1471.727382, 1414.994894, 1359.798378, 1306.128975, 1253.977606, 1203.334978, 1154.191584, 1106.537708, 1060.36343, 1015.658626, 972.412975, 930.6159592, 890.2568694, 851.3248078, 813.8086915, 777.6972564, 742.9790602, 709.6424865, 677.675748, 647.06689, 617.8037945, 589.8741834, 563.2656223, 537.965524, 513.9611526, 491.2396265, 469.7879228, 449.5928805, 430.6412043, 412.9194686, 396.4141209, 381.1114856, 366.9977681, 354.0590577, 342.2813324, 331.6504619, 322.1522115, 313.772246, 306.4961336, 300.3093491, 295.1972782, 291.1452209, 288.1383954, 286.161942, 285.2009262, 285.2403434, 286.2651217, 288.2601261, 291.2101623, 295.0999798, 299.9142764, 305.6377011, 312.2548583, 319.7503113, 328.1085857, 337.3141733, 347.3515358, 358.2051077, 369.859301, 382.2985076, 395.5071036, 409.4694526, 424.169909, 439.5928218, 455.7225377, 472.5434051, 490.0397766, 508.1960134, 526.9964879, 546.4255874, 566.4677174, 587.1073048, 608.328801, 630.1166855, 652.4554689, 675.329696, 698.7239491, 722.622851, 747.0110682, 771.8733137, 797.1943506, 822.9589943, 849.1521161, 875.7586459, 902.763575, 930.151959, 957.9089209, 986.0196534, 1014.469422, 1043.243568, 1072.32751, 1101.706748, 1131.366866, 1161.293532, 1191.472504, 1221.889632, 1252.530856, 1283.382215, 1314.429845, 1345.659983, 1377.058968, 1408.613245, 1440.309367, 1472.133994, 1504.0739, 1536.115973, 1568.247214, 1600.454745, 1632.725806, 1665.047759, 1697.40809, 1729.79441, 1762.194457, 1794.5961, 1826.987336, 1859.356295, 1891.691243, 1923.98058, 1956.212842, 1988.376706, 2020.460988, 2052.454646, 2084.346779, 2116.126632, 2147.783597, 2179.307208, 2210.687151, 2241.91326, 2272.975518, 2303.864061, 2334.569175, 2365.081302, 2395.391035, 2425.489124, 2455.366475, 2485.01415, 2514.423367, 2543.585505, 2572.4921, 2601.134847, 2629.505602, 2657.596381, 2685.399361, 2712.906881, 2740.111442, 2767.005706, 2793.582498, 2819.834806, 2845.755783, 2871.338742, 2896.577161, 2921.464683, 2945.995112, 2970.162418, 2993.960734, 3017.384356, 3040.427744, 3063.085522, 3085.352477, 3107.223559, 3128.693881, 3149.75872, 3170.413513, 3190.653861, 3210.475525, 3229.874429, 3248.846657, 3267.388453, 3285.496221, 3303.166524, 3320.396084, 3337.181782, 3353.520654, 3369.409896, 3384.846856, 3399.82904, 3414.354108, 3428.419873, 3442.024301, 3455.16551, 3467.84177, 3480.051499, 3491.793265, 3503.065785, 3513.867922, 3524.198685, 3534.057229, 3543.442851, 3552.354992, 3560.793236, 3568.757303, 3576.247057, 3583.262497, 3589.80376, 3595.871117, 3601.464974, 3606.585871, 3611.234477, 3615.411593, 3619.118147, 3622.355197, 3625.123922, 3627.425631, 3629.261753, 3630.633837, 3631.543555, 3631.992697, 3631.983167, 3631.516988, 3630.596294, 3629.223332, 3627.400462, 3625.130148, 3622.414965, 3619.257594, 3615.660817, 3611.627522, 3607.160695, 3602.263422, 3596.938886, 3591.190366, 3585.021236, 3578.434959, 3571.435091, 3564.025277, 3556.209246, 3547.990817, 3539.373887, 3530.362438, 3520.960531, 3511.172305, 3501.001976, 3490.453833, 3479.53224, 3468.241629, 3456.586503, 3444.571433, 3432.201053, 3419.480063, 3406.413223, 3393.005355, 3379.261339, 3365.186109, 3350.784657, 3336.062025, 3321.023308, 3305.67365, 3290.018241, 3274.062319, 3257.811164, 3241.270098, 3224.444485, 3207.339726, 3189.961258, 3172.314556, 3154.405126, 3136.238505, 3117.820261, 3099.155989, 3080.251311, 3061.111874, 3041.743346, 3022.151417, 3002.341798, 2982.320214, 2962.09241, 2941.664142, 2921.04118, 2900.229307, 2879.234312, 2858.061994, 2836.718158, 2815.208611, 2793.539167, 2771.715638, 2749.743837, 2727.629576, 2705.378663, 2682.996901, 2660.490087, 2637.86401, 2615.124449, 2592.277174, 2569.32794, 2546.282492, 2523.146557, 2499.925845, 2476.626052, 2453.25285, 2429.811894, 2406.308814, 2382.74922, 2359.138694, 2335.482794, 2311.787052, 2288.056968, 2264.298015, 2240.515635, 2216.715236, 2192.902196, 2169.081855, 2145.259519, 2121.440458, 2097.629902, 2073.833045, 2050.055038, 2026.300993, 2002.575979, 1978.885022, 1955.233103, 1931.625159, 1908.066082, 1884.560714, 1861.113851, 1837.730241, 1814.414579, 1791.171514, 1768.005639, 1744.921498, 1721.923581, 1699.016323, 1676.204107, 1653.491257, 1630.882045, 1608.380684, 1585.991329, 1563.718079, 1541.564972, 1519.535988, 1497.635047, 1475.866009, 1454.232671, 1432.73877, 1411.38798, 1390.183914, 1369.13012, 1348.230082, 1327.487223, 1306.904898, 1286.4864, 1266.234954, 1246.153722, 1226.245799, 1206.514213, 1186.961927, 1167.591836, 1148.406769, 1129.409485, 1110.602678, 1091.988975, 1073.570932, 1055.351039, 1037.331717, 1019.515318, 1001.904127, 984.5003594, 967.3061617, 950.323612, 933.5547194, 917.0014244, 900.6655983, 884.5490439, 868.6534949, 852.9806166, 837.5320051, 822.3091883, 807.3136255, 792.5467073, 778.0097565, 763.7040273, 749.6307062, 735.7909118, 722.1856951, 708.8160398, 695.6828623, 682.7870122, 670.1292723, 657.710359, 645.5309227, 633.5915479, 621.8927536, 610.4349937, 599.218657, 588.2440682, 577.5114876, 567.021112, 556.7730745, 546.7674457, 537.0042335, 527.4833837, 518.2047805, 509.168247, 500.3735456, 491.8203784, 483.508388, 475.4371576, 467.6062117, 460.0150167, 452.6629815, 445.5494578, 438.6737407, 432.0350695, 425.6326282, 419.465546, 413.5328976, 407.8337046, 402.3669355, 397.1315064, 392.1262817, 387.3500749, 382.801649, 378.4797174, 374.3829443, 370.5099456, 366.8592894, 363.4294971, 360.2190433, 357.2263575, 354.4498239, 351.8877827, 349.5385306, 347.4003217, 345.471368, 343.7498401, 342.2338683, 340.9215431, 339.810916, 338.9000001, 338.1867711, 337.6691682, 337.3450944, 337.2124175, 337.2689711, 337.5125552, 337.9409367, 338.5518507, 339.3430011, 340.3120612, 341.4566746, 342.7744564, 344.2629931, 345.9198445, 347.7425435, 349.7285977, 351.8754896, 354.1806777, 356.6415975, 359.2556618, 362.0202619, 364.9327684, 367.9905318, 371.1908833, 374.5311359, 378.008585, 381.6205092, 385.364171, 389.2368179, 393.2356831, 397.3579861, 401.6009337, 405.9617206, 410.4375307, 415.0255371, 419.7229036, 424.5267852, 429.4343285, 434.4426735, 439.5489533, 444.7502954, 450.0438226, 455.4266533, 460.8959027, 466.4486834, 472.0821061, 477.7932805, 483.5793157, 489.4373216, 495.3644089, 501.3576904, 507.4142813],
+                    [4029.61126, 3961.397534, 3892.448363, 3822.873088, 3752.782319, 3682.287779, 3611.502158, 3540.538954, 3469.512323, 3398.536922, 3327.727752, 3257.200004, 3187.068903, 3117.44955, 3048.456766, 2980.204939, 2912.807865, 2846.378598, 2781.029293, 2716.871056, 2654.013792, 2592.566056, 2532.634904, 2474.32575, 2417.742219, 2362.986006, 2310.156738, 2259.351833, 2210.666372, 2164.19296, 2120.021604, 2078.239581, 2038.931321, 2002.178285, 1968.058849, 1936.648193, 1908.018193, 1882.237314, 1859.370514, 1839.479143, 1822.620852, 1808.849505, 1798.215098, 1790.763675, 1786.537257, 1785.57377, 1787.906982, 1793.566439, 1802.577413, 1814.96085, 1830.733325, 1849.906999, 1872.489588, 1898.48433, 1927.889961, 1960.700695, 1996.906211, 2036.491643, 2079.437578, 2125.720055, 2175.310578, 2228.176123, 2284.279161, 2343.577681, 2406.025217, 2471.570887, 2540.159431, 2611.731258, 2686.222499, 2763.56506, 2843.68669, 2926.511045, 3011.957764, 3099.942544, 3190.37723, 3283.169897, 3378.224954, 3475.443233, 3574.722102, 3675.955572, 3779.034412, 3883.846266, 3990.275784, 4098.204744, 4207.51219, 4318.07457, 4429.765878, 4542.457798, 4656.01986, 4770.319594, 4885.222683, 5000.593137, 5116.293446, 5232.184761, 5348.127061, 5463.979329, 5579.599734, 5694.845812, 5809.574649, 5923.643068, 6036.90782, 6149.225772, 6260.454103, 6370.450498, 6479.07334, 6586.181913, 6691.636594, 6795.299056, 6897.032466, 6996.70168, 7094.173451, 7189.316617, 7282.00231, 7372.104144, 7459.49842, 7544.064314, 7625.684073, 7704.243209, 7779.630686, 7851.739105, 7920.464891, 7985.708476, 8047.37447, 8105.371842, 8159.614086, 8210.019391, 8256.510799, 8299.016362, 8337.469297, 8371.808132, 8401.976841, 8427.92499, 8449.607853, 8466.986547, 8480.028139, 8488.705757, 8492.998695, 8492.892501, 8488.37907, 8479.456717, 8466.130251, 8448.411035, 8426.317037, 8399.872881, 8369.109875, 8334.066042, 8294.786132, 8251.321636, 8203.730775, 8152.078495, 8096.43644, 8036.882919, 7973.502867, 7906.387789, 7835.635696, 7761.351031, 7683.644589, 7602.633414, 7518.4407, 7431.195673, 7341.033462, 7248.094967, 7152.526706, 7054.48066, 6954.114105, 6851.589433, 6747.073963, 6640.739747, 6532.763354, 6423.325662, 6312.611625, 6200.810039, 6088.113298, 5974.71714, 5860.820385, 5746.624666, 5632.334153, 5518.155264, 5404.296379, 5290.967536, 5178.380131, 5066.746603, 4956.28012, 4847.194259, 4739.702678, 4634.018787, 4530.355414, 4428.924469, 4329.936603, 4233.600869, 4140.124375, 4049.711944, 3962.565766, 3878.885053, 3798.865698, 3722.699927, 3650.575964, 3582.677686, 3519.184288, 3460.269953, 3406.103524, 3356.848173, 3312.661094, 3273.693178, 3240.088718, 3211.985102, 3189.512526, 3172.793709, 3161.94362, 3157.069212, 3158.269169, 3165.63366, 3179.244107, 3199.172963, 3225.483503, 3258.229628, 3297.455678, 3343.196267, 3395.476123, 3454.30995, 3519.7023, 3591.647458, 3670.129354, 3755.121479, 3846.586821, 3944.477821, 4048.736342, 4159.293659, 4276.070461, 4398.976874, 4527.912503, 4662.766491, 4803.417592, 4949.734269, 5101.574803, 5258.787427, 5421.21047, 5588.672531, 5760.992654, 5937.98054, 6119.43676, 6305.152996, 6494.912294, 6688.489337, 6885.650733, 7086.155318, 7289.75448, 7496.192493, 7705.206867, 7916.528718, 8129.883145, 8344.989624, 8561.562416, 8779.310989, 8997.940443, 9217.151959, 9436.643249, 9656.109019, 9875.241444, 10093.73064, 10311.26518, 10527.53253, 10742.21962, 10955.01332, 11165.60092, 11373.67069, 11578.91239, 11781.01775, 11979.68105, 12174.59957, 12365.47416, 12552.00975, 12733.91581, 12910.90694, 13082.7033, 13249.03115, 13409.62334, 13564.21976, 13712.56784, 13854.42303, 13989.5492, 14117.71913, 14238.71494, 14352.32846, 14458.36168, 14556.62712, 14646.94818, 14729.15955, 14803.10748, 14868.65013, 14925.65789, 14974.01361, 15013.61292, 15044.36441, 15066.18989, 15079.02456, 15082.81718, 15077.53024, 15063.14009, 15039.637, 15007.02527, 14965.32327, 14914.56349, 14854.79251, 14786.07099, 14708.47362, 14622.08906, 14527.01982, 14423.38214, 14311.30585, 14190.93419, 14062.42357, 13925.94342, 13781.67589, 13629.81555, 13470.56915, 13304.15527, 13130.80397, 12950.7564, 12764.26448, 12571.5904, 12373.00625, 12168.79356, 11959.24279, 11744.65289, 11525.33075, 11301.59072, 11073.75402, 10842.14824, 10607.10673, 10368.96803, 10128.0753, 9884.7757, 9639.419769, 9392.360826, 9143.954338, 8894.557283, 8644.52752, 8394.223147, 8144.001862, 7894.220322, 7645.2335, 7397.394052, 7151.051676, 6906.552486, 6664.238388, 6424.446462, 6187.508355, 5953.749683, 5723.489446, 5497.039451, 5274.703756, 5056.778122, 4843.549487, 4635.295454, 4432.283797, 4234.771991, 4043.00676, 3857.223647, 3677.646606, 3504.487623, 3337.946356, 3178.209801, 3025.451991, 2879.833719, 2741.502281, 2610.591263, 2487.220349, 2371.495153, 2263.507098, 2163.333308, 2071.036547, 1986.665175, 1910.253149, 1841.820048, 1781.371132, 1728.897436, 1684.37589, 1647.769478, 1619.027424, 1598.085413, 1584.865839, 1579.278089, 1581.218851, 1590.572459, 1607.211262, 1630.996023, 1661.776346, 1699.39113, 1743.669046, 1794.429046, 1851.480886, 1914.625683, 1983.656482, 2058.358854, 2138.511506, 2223.886911, 2314.251955, 2409.368599, 2508.994554, 2612.883966, 2720.788114, 2832.456117, 2947.635642, 3066.07363, 3187.51701, 3311.713425, 3438.411955, 3567.363842, 3698.3232, 3831.047736, 3965.299451, 4100.845336, 4237.458059, 4374.916635, 4513.007089, 4651.523091, 4790.266585, 4929.048389, 5067.688781, 5206.018053, 5343.877046, 5481.117659, 5617.603326, 5753.209464, 5887.823892, 6021.347215, 6153.693177, 6284.788973, 6414.575529, 6543.007743, 6670.05469, 6795.699777, 6919.940873, 7042.790382, 7164.275283, 7284.437121, 7403.331964, 7521.030302, 7637.616911, 7753.190672, 7867.86434, 7981.764271, 8095.030106, 8207.814404, 8320.282239, 8432.610744, 8544.988618, 8657.615583, 8770.70181, 8884.467289, 8999.14117, 9114.961058, 9232.172271, 9351.027064, 9471.783812, 9594.706162, 9720.062152, 9848.1233, 9979.16366, 10113.45885, 10251.28508, 10392.9181, 10538.63219, 10688.69908, 10843.38692, 11002.95913, 11167.67338, 11337.7804, 11513.52294, 11695.13462, 11882.83881, 12076.84753, 12277.36037, 12484.56331, 12698.62773, 12919.70927, 13147.9468, 13383.46138, 13626.35526, 13876.71088, 14134.58993, 14400.0324, 14673.05573, 14953.65397, 15241.79691, 15537.4294, 15840.4706, 16150.81333, 16468.32345, 16792.83933, 17124.17136, 17462.1015, 17806.38295, 18156.73984, 18512.86699, 18874.4298, 19241.06411, 19612.37626, 19987.94311, 20367.31226, 20750.0022, 21135.50274, 21523.27532, 21912.75355, 22303.34378, 22694.42579, 23085.3535, 23475.45586, 23864.03778, 24250.38112, 24633.74586, 25013.37129, 25388.4773, 25758.26578, 26121.92209, 26478.61664, 26827.50653, 27167.7373, 27498.44476, 27818.75688, 28127.79581, 28424.67992, 28708.52598, 28978.45132, 29233.57622, 29473.02619, 29695.93443, 29901.44432, 30088.71201, 30256.90895, 30405.22463, 30532.86926, 30639.07653, 30723.10638, 30784.24788, 30821.82207, 30835.18486, 30823.72992, 30786.89164, 30724.14807, 30635.02385, 30519.09317, 30375.98275, 30205.37472, 30007.00958, 29780.68911, 29526.2792, 29243.71277, 28932.99249, 28594.19361, 28227.4666, 27833.0399, 27411.22242, 26962.40611, 26487.0684, 25985.7746, 25459.18011, 24908.03269, 24333.17452, 23735.54416, 23116.1785, 22476.21446, 21816.89069, 21139.54903, 20445.63595, 19736.70378, 19014.41182, 18280.52731, 17536.92622, 16785.59396, 16028.62581, 15268.22732, 14506.71442, 13746.51345, 12990.16096, 12240.30337, 11499.6964, 10771.20438, 10057.79932, 9362.559789, 8688.669662, 8039.416612, 7418.190437, 6828.481186, 6273.877092, 5758.0623, 5284.814412, 4858.001821, 4481.580859, 4159.592747, 3896.160348, 3695.484732, 3561.841544, 3499.57719, 3513.10483, 3606.900193, 3785.497207, 4053.483451, 4415.495441, 4876.213739, 5440.357896, 6112.681245, 6897.965524, 7801.015366, 8826.652627, 9979.710591, 11265.02803, 12687.44317, 14251.78746, 15962.87934, 17825.51783, 19844.47602, 22024.49452, 24370.27481, 26886.47245, 29577.69038, 32448.472, 35503.2943, 38746.56095, 42182.5953, 45815.63346, 49649.8173, 53689.18745, 57937.67636, 62399.10133, 67077.15765, 71975.41166, 77097.29398, 82446.09276, 88024.94696, 93836.83978, 99884.59218, 106170.8564, 112698.1098, 119468.6486, 126484.5818, 133747.8256, 141260.0972, 149022.9096, 157037.5663, 165305.1555, 173826.5459, 182602.3814, 191633.0763, 200918.8117, 210459.5305, 220254.934, 230304.4782, 240607.3703, 251162.5652, 261968.7635, 273024.408, 284327.6819, 295876.5064, 307668.5394, 319701.1736, 331971.5358, 344476.4855, 357212.6151, 370176.249, 383363.4441, 396769.9902, 410391.4107, 424222.9638, 438259.6438, 452496.1828, 466927.053, 481546.4689, 496348.3903, 511326.5252, 526474.3332, 541785.0293, 557251.5881, 572866.7479, 588623.0157, 604512.672, 620527.7766, 636660.1735, 652901.4976, 669243.1807, 685676.4578, 702192.3744, 718781.7934, 735435.4025, 752143.7219, 768897.1123, 785685.783, 802499.8003, 819329.0964, 836163.4781, 852992.6356, 869806.1525, 886593.5149, 903344.1208, 920047.2906, 936692.2766, 953268.2734, 969764.4281, 986169.8508, 1002473.625, 1018664.819, 1034732.494, 1050665.719, 1066453.579, 1082085.186, 1097549.691, 1112836.292, 1127934.25, 1142832.897, 1157521.645, 1171990, 1186227.574, 1200224.091, 1213969.4, 1227453.488, 1240666.489, 1253598.69, 1266240.549, 1278582.7, 1290615.963, 1302331.357, 1313720.106, 1324773.652, 1335483.658, 1345842.027, 1355840.9, 1365472.672, 1374729.997, 1383605.797, 1392093.268, 1400185.891, 1407877.436, 1415161.968, 1422033.858, 1428487.785, 1434518.743, 1440122.048, 1445293.339, 1450028.591, 1454324.109, 1458176.539, 1461582.872, 1464540.442, 1467046.934, 1469100.386, 1470699.187, 1471842.085, 1472528.182, 1472756.941, 1472756.941, 1472528.182, 1471842.085, 1470699.187, 1469100.386, 1467046.934, 1464540.442, 1461582.872, 1458176.539, 1454324.109, 1450028.591, 1445293.339, 1440122.048, 1434518.743, 1428487.785, 1422033.858, 1415161.968, 1407877.436, 1400185.891, 1392093.268, 1383605.797, 1374729.997, 1365472.672, 1355840.9, 1345842.027, 1335483.658, 1324773.652, 1313720.106, 1302331.357, 1290615.963, 1278582.7, 1266240.549, 1253598.69, 1240666.489, 1227453.488, 1213969.4, 1200224.091, 1186227.574, 1171990, 1157521.645, 1142832.897, 1127934.25, 1112836.292, 1097549.691, 1082085.186, 1066453.579, 1050665.719, 1034732.494, 1018664.819, 1002473.625, 986169.8508, 969764.4281, 953268.2734, 936692.2766, 920047.2906, 903344.1208, 886593.5149, 869806.1525, 852992.6356, 836163.4781, 819329.0964, 802499.8003, 785685.783, 768897.1123, 752143.7219, 735435.4025, 718781.7934, 702192.3744, 685676.4578, 669243.1807, 652901.4976, 636660.1735, 620527.7766, 604512.672, 588623.0157, 572866.7479, 557251.5881, 541785.0293, 526474.3332, 511326.5252, 496348.3903, 481546.4689, 466927.053, 452496.1828, 438259.6438, 424222.9638, 410391.4107, 396769.9902, 383363.4441, 370176.249, 357212.6151, 344476.4855, 331971.5358, 319701.1736, 307668.5394, 295876.5064, 284327.6819, 273024.408, 261968.7635, 251162.5652, 240607.3703, 230304.4782, 220254.934, 210459.5305, 200918.8117, 191633.0763, 182602.3814, 173826.5459, 165305.1555, 157037.5663, 149022.9096, 141260.0972, 133747.8256, 126484.5818, 119468.6486, 112698.1098, 106170.8564, 99884.59218, 93836.83978, 88024.94696, 82446.09276, 77097.29398, 71975.41166, 67077.15765, 62399.10133, 57937.67636, 53689.18745, 49649.8173, 45815.63346, 42182.5953, 38746.56095, 35503.2943, 32448.472, 29577.69038, 26886.47245, 24370.27481, 22024.49452, 19844.47602, 17825.51783, 15962.87934, 14251.78746, 12687.44317, 11265.02803, 9979.710591, 8826.652627, 7801.015366, 6897.965524, 6112.681245, 5440.357896, 4876.213739, 4415.495441, 4053.483451, 3785.497207, 3606.900193, 3513.10483, 3499.57719, 3561.841544, 3695.484732, 3896.160348, 4159.592747, 4481.580859, 4858.001821, 5284.814412, 5758.0623, 6273.877092, 6828.481186, 7418.190437, 8039.416612, 8688.669662, 9362.559789, 10057.79932, 10771.20438, 11499.6964, 12240.30337, 12990.16096, 13746.51345, 14506.71442, 15268.22732, 16028.62581, 16785.59396, 17536.92622, 18280.52731, 19014.41182, 19736.70378, 20445.63595, 21139.54903, 21816.89069, 22476.21446, 23116.1785, 23735.54416, 24333.17452, 24908.03269, 25459.18011, 25985.7746, 26487.0684, 26962.40611, 27411.22242, 27833.0399, 28227.4666, 28594.19361, 28932.99249, 29243.71277, 29526.2792, 29780.68911, 30007.00958, 30205.37472, 30375.98275, 30519.09317, 30635.02385, 30724.14807, 30786.89164, 30823.72992, 30835.18486, 30821.82207, 30784.24788, 30723.10638, 30639.07653, 30532.86926, 30405.22463, 30256.90895, 30088.71201, 29901.44432, 29695.93443, 29473.02619, 29233.57622, 28978.45132, 28708.52598, 28424.67992, 28127.79581, 27818.75688, 27498.44476, 27167.7373, 26827.50653, 26478.61664, 26121.92209, 25758.26578, 25388.4773, 25013.37129, 24633.74586, 24250.38112, 23864.03778, 23475.45586, 23085.3535, 22694.42579, 22303.34378, 21912.75355, 21523.27532, 21135.50274, 20750.0022, 20367.31226, 19987.94311, 19612.37626, 19241.06411, 18874.4298, 18512.86699, 18156.73984, 17806.38295, 17462.1015, 17124.17136, 16792.83933, 16468.32345, 16150.81333, 15840.4706, 15537.4294, 15241.79691, 14953.65397, 14673.05573, 14400.0324, 14134.58993, 13876.71088, 13626.35526, 13383.46138, 13147.9468, 12919.70927, 12698.62773, 12484.56331, 12277.36037, 12076.84753, 11882.83881, 11695.13462, 11513.52294, 11337.7804, 11167.67338, 11002.95913, 10843.38692, 10688.69908, 10538.63219, 10392.9181, 10251.28508, 10113.45885, 9979.16366, 9848.1233, 9720.062152, 9594.706162, 9471.783812, 9351.027064, 9232.172271, 9114.961058, 8999.14117, 8884.467289, 8770.70181, 8657.615583, 8544.988618, 8432.610744, 8320.282239, 8207.814404, 8095.030106, 7981.764271, 7867.86434, 7753.190672, 7637.616911, 7521.030302, 7403.331964, 7284.437121, 7164.275283, 7042.790382, 6919.940873, 6795.699777, 6670.05469, 6543.007743, 6414.575529, 6284.788973, 6153.693177, 6021.347215, 5887.823892, 5753.209464, 5617.603326, 5481.117659, 5343.877046, 5206.018053, 5067.688781, 4929.048389, 4790.266585, 4651.523091, 4513.007089, 4374.916635, 4237.458059, 4100.845336, 3965.299451, 3831.047736, 3698.3232, 3567.363842, 3438.411955, 3311.713425, 3187.51701, 3066.07363, 2947.635642, 2832.456117, 2720.788114, 2612.883966, 2508.994554, 2409.368599, 2314.251955, 2223.886911, 2138.511506, 2058.358854, 1983.656482, 1914.625683, 1851.480886, 1794.429046, 1743.669046, 1699.39113, 1661.776346, 1630.996023, 1607.211262, 1590.572459, 1581.218851, 1579.278089, 1584.865839, 1598.085413, 1619.027424, 1647.769478, 1684.37589, 1728.897436, 1781.371132, 1841.820048, 1910.253149, 1986.665175, 2071.036547, 2163.333308, 2263.507098, 2371.495153, 2487.220349, 2610.591263, 2741.502281, 2879.833719, 3025.451991, 3178.209801, 3337.946356, 3504.487623, 3677.646606, 3857.223647, 4043.00676, 4234.771991, 4432.283797, 4635.295454, 4843.549487, 5056.778122, 5274.703756, 5497.039451, 5723.489446, 5953.749683, 6187.508355, 6424.446462, 6664.238388, 6906.552486, 7151.051676, 7397.394052, 7645.2335, 7894.220322, 8144.001862, 8394.223147, 8644.52752, 8894.557283, 9143.954338, 9392.360826, 9639.419769, 9884.7757, 10128.0753, 10368.96803, 10607.10673, 10842.14824, 11073.75402, 11301.59072, 11525.33075, 11744.65289, 11959.24279, 12168.79356, 12373.00625, 12571.5904, 12764.26448, 12950.7564, 13130.80397, 13304.15527, 13470.56915, 13629.81555, 13781.67589, 13925.94342, 14062.42357, 14190.93419, 14311.30585, 14423.38214, 14527.01982, 14622.08906, 14708.47362, 14786.07099, 14854.79251, 14914.56349, 14965.32327, 15007.02527, 15039.637, 15063.14009, 15077.53024, 15082.81718, 15079.02456, 15066.18989, 15044.36441, 15013.61292, 14974.01361, 14925.65789, 14868.65013, 14803.10748, 14729.15955, 14646.94818, 14556.62712, 14458.36168, 14352.32846, 14238.71494, 14117.71913, 13989.5492, 13854.42303, 13712.56784, 13564.21976, 13409.62334, 13249.03115, 13082.7033, 12910.90694, 12733.91581, 12552.00975, 12365.47416, 12174.59957, 11979.68105, 11781.01775, 11578.91239, 11373.67069, 11165.60092, 10955.01332, 10742.21962, 10527.53253, 10311.26518, 10093.73064, 9875.241444, 9656.109019, 9436.643249, 9217.151959, 8997.940443, 8779.310989, 8561.562416, 8344.989624, 8129.883145, 7916.528718, 7705.206867, 7496.192493, 7289.75448, 7086.155318, 6885.650733, 6688.489337, 6494.912294, 6305.152996, 6119.43676, 5937.98054, 5760.992654, 5588.672531, 5421.21047, 5258.787427, 5101.574803, 4949.734269, 4803.417592, 4662.766491, 4527.912503, 4398.976874, 4276.070461, 4159.293659, 4048.736342, 3944.477821, 3846.586821, 3755.121479, 3670.129354, 3591.647458, 3519.7023, 3454.30995, 3395.476123, 3343.196267, 3297.455678, 3258.229628, 3225.483503, 3199.172963, 3179.244107, 3165.63366, 3158.269169, 3157.069212, 3161.94362, 3172.793709, 3189.512526, 3211.985102, 3240.088718, 3273.693178, 3312.661094, 3356.848173, 3406.103524, 3460.269953, 3519.184288, 3582.677686, 3650.575964, 3722.699927, 3798.865698, 3878.885053, 3962.565766, 4049.711944, 4140.124375, 4233.600869, 4329.936603, 4428.924469, 4530.355414, 4634.018787, 4739.702678, 4847.194259, 4956.28012, 5066.746603, 5178.380131, 5290.967536, 5404.296379, 5518.155264, 5632.334153, 5746.624666, 5860.820385, 5974.71714, 6088.113298, 6200.810039, 6312.611625, 6423.325662, 6532.763354, 6640.739747, 6747.073963, 6851.589433, 6954.114105, 7054.48066, 7152.526706, 7248.094967, 7341.033462, 7431.195673, 7518.4407, 7602.633414, 7683.644589, 7761.351031, 7835.635696, 7906.387789, 7973.502867, 8036.882919, 8096.43644, 8152.078495, 8203.730775, 8251.321636, 8294.786132, 8334.066042, 8369.109875, 8399.872881, 8426.317037, 8448.411035, 8466.130251, 8479.456717, 8488.37907, 8492.892501, 8492.998695, 8488.705757, 8480.028139, 8466.986547, 8449.607853, 8427.92499, 8401.976841, 8371.808132, 8337.469297, 8299.016362, 8256.510799, 8210.019391, 8159.614086, 8105.371842, 8047.37447, 7985.708476, 7920.464891, 7851.739105, 7779.630686, 7704.243209, 7625.684073, 7544.064314, 7459.49842, 7372.104144, 7282.00231, 7189.316617, 7094.173451, 6996.70168, 6897.032466, 6795.299056, 6691.636594, 6586.181913, 6479.07334, 6370.450498, 6260.454103, 6149.225772, 6036.90782, 5923.643068, 5809.574649, 5694.845812, 5579.599734, 5463.979329, 5348.127061, 5232.184761, 5116.293446, 5000.593137, 4885.222683, 4770.319594, 4656.01986, 4542.457798, 4429.765878, 4318.07457, 4207.51219, 4098.204744, 3990.275784, 3883.846266, 3779.034412, 3675.955572, 3574.722102, 3475.443233, 3378.224954, 3283.169897, 3190.37723, 3099.942544, 3011.957764, 2926.511045, 2843.68669, 2763.56506, 2686.222499, 2611.731258, 2540.159431, 2471.570887, 2406.025217, 2343.577681, 2284.279161, 2228.176123, 2175.310578, 2125.720055, 2079.437578, 2036.491643, 1996.906211, 1960.700695, 1927.889961, 1898.48433, 1872.489588, 1849.906999, 1830.733325, 1814.96085, 1802.577413, 1793.566439, 1787.906982, 1785.57377, 1786.537257, 1790.763675, 1798.215098, 1808.849505, 1822.620852, 1839.479143, 1859.370514, 1882.237314, 1908.018193, 1936.648193, 1968.058849, 2002.178285, 2038.931321, 2078.239581, 2120.021604, 2164.19296, 2210.666372, 2259.351833, 2310.156738, 2362.986006, 2417.742219, 2474.32575, 2532.634904, 2592.566056, 2654.013792, 2716.871056, 2781.029293, 2846.378598, 2912.807865, 2980.204939, 3048.456766, 3117.44955, 3187.068903, 3257.200004, 3327.727752, 3398.536922, 3469.512323, 3540.538954, 3611.502158, 3682.287779, 3752.782319, 3822.873088, 3892.448363, 3961.397534, 4029.61126],
+                    [11671.71466, 11490.02408, 11330.66853, 11194.89784, 11083.82769, 10998.4327, 10939.54022, 10907.82508, 10903.80508, 10927.83745, 10980.11624, 11060.67058, 11169.36393, 11305.89426, 11469.79518, 11660.43798, 11877.03469, 12118.64198, 12384.16596, 12672.36792, 12981.87086, 13311.16682, 13658.62509, 14022.50098, 14400.94547, 14792.01535, 15193.684, 15603.85272, 16020.36248, 16441.00612, 16863.54088, 17285.70117, 17705.21159, 18119.80006, 18527.21106, 18925.21877, 19311.64023, 19684.34829, 20041.28434, 20380.47076, 20700.02299, 20998.16117, 21273.22124, 21523.66554, 21748.0927, 21945.24687, 22114.02618, 22253.49043, 22362.86788, 22441.56113, 22489.1521, 22505.40598, 22490.27417, 22443.89622, 22366.60063, 22258.90463, 22121.51283, 21955.3148, 21761.38149, 21540.96069, 21295.47124, 21026.49634, 20735.77574, 20425.19695, 20096.78553, 19752.6944, 19395.19232, 19026.65159, 18649.53495, 18266.38183, 17879.79399, 17492.4206, 17106.94294, 16726.05864, 16352.46572, 15988.84639, 15637.85079, 15302.0807, 14984.07341, 14686.28571, 14411.0782, 14160.70005, 13937.27418, 13742.78305, 13579.05517, 13447.7523, 13350.3576, 13288.16465, 13262.26757, 13273.55217, 13322.68829, 13410.12339, 13536.07741, 13700.53895, 13903.26286, 14143.76922, 14421.34374, 14735.03963, 15083.68092, 15465.86727, 15879.98014, 16324.19045, 16796.46763, 17294.59001, 17816.1565, 18358.59956, 18919.19927, 19495.09863, 20083.31976, 20680.78109, 21284.31539, 21890.68851, 22496.6187, 23098.79653, 23693.90507, 24278.64037, 24849.73213, 25403.96422, 25938.19518, 26449.37839, 26934.58184, 27391.00734, 27816.00911, 28207.11148, 28562.0258, 28878.66615, 29155.16402, 29389.88168, 29581.42415, 29728.64981, 29830.67937, 29886.90334, 29896.98771, 29860.87798, 29778.80145, 29651.26762, 29479.06687, 29263.26726, 29005.20955, 28706.50042, 28369.00392, 27994.83122, 27586.32867, 27146.0643, 26676.81275, 26181.53885, 25663.37981, 25125.62622, 24571.70193, 24005.14303, 23429.57588, 22848.69458, 22266.23775, 21685.96509, 21111.6335, 20546.9733, 19995.66444, 19461.31293, 18947.42771, 18457.39809, 17994.47185, 17561.73419, 17162.08775, 16798.23367, 16472.65403, 16187.59555, 15945.05492, 15746.76561, 15594.18649, 15488.49212, 15430.56494, 15420.98938, 15460.04779, 15547.71848, 15683.67563, 15867.29122, 16097.63894, 16373.49999, 16693.37079, 17055.47261, 17457.76283, 17897.948, 18373.49849, 18881.66459, 19419.49408, 19983.85097, 20571.43546, 21178.80483, 21802.39523, 22438.54416, 23083.51345, 23733.51272, 24384.72298, 25033.32032, 25675.49959, 26307.49767, 26925.6165, 27526.24544, 28105.88298, 28661.15758, 29188.84755, 29685.89981, 30149.44746, 30576.82598, 30965.58803, 31313.51681, 31618.63768, 31879.22834, 32093.82716, 32261.23989, 32380.54457, 32451.0947, 32472.52069, 32444.72952, 32367.90273, 32242.49273, 32069.21754, 31849.05385, 31583.22878, 31273.2101, 30920.69518, 30527.59881, 30096.03977, 29628.32657, 29126.94217, 28594.5281, 28033.86777, 27447.86947, 26839.5488, 26212.01101, 25568.4331, 24912.04598, 24246.11666, 23573.93075, 22898.77526, 22223.92176, 21552.61024, 20888.03336, 20233.32163, 19591.52918, 18965.62045, 18358.45778, 17772.78983, 17211.24113, 16676.30246, 16170.32232, 15695.49943, 15253.87621, 14847.33327, 14477.58487, 14146.17538, 13854.47665, 13603.68623, 13394.8265, 13228.7445, 13106.11262, 13027.42984, 12993.02368, 13003.05267, 13057.50933, 13156.22357, 13298.86649, 13484.95445, 13713.85346, 13984.78368, 14296.82421, 14648.91782, 15039.87592, 15468.38341, 15933.00367, 16432.18342, 16964.25762, 17527.45433, 18119.89942, 18739.62141, 19384.55611, 20052.55136, 20741.37172, 21448.70318, 22172.15796, 22909.27941, 23657.54704, 24414.38169, 25177.15094, 25943.17485, 26709.73189, 27474.06529, 28233.38979, 28984.89878, 29725.77193, 30453.18332, 31164.31009, 31856.34163, 32526.48929, 33171.99676, 33790.15088, 34378.29305, 34933.8312, 35454.25221, 35937.13478, 36380.16275, 36781.13872, 37137.99796, 37448.82253, 37711.85547, 37925.51503, 38088.40882, 38199.34766, 38257.35921, 38261.70106, 38211.87328, 38107.63022, 37948.99145, 37736.25173, 37469.98984, 37151.0761, 36780.67853, 36360.2675, 35891.6187, 35376.81433, 34818.24249, 34218.59455, 33580.86053, 32908.32234, 32204.5449, 31473.36502, 30718.8781, 29945.42261, 29157.56239, 28360.0667, 27557.88829, 26756.13933, 25960.06546, 25175.01799, 24406.42441, 23659.75735, 22940.50223, 22254.12366, 21606.03093, 21001.54267, 20445.8511, 19943.98588, 19500.77812, 19120.82444, 18808.45171, 18567.68254, 18402.20184, 18315.32478, 18309.96629, 18388.61264, 18553.29503, 18805.56568, 19146.4766, 19576.56125, 20095.81929, 20703.70465, 21399.11706, 22180.39721, 23045.32568, 23991.12562, 25014.46943, 26111.48933, 27277.79188, 28508.47647, 29798.15761, 31140.99107, 32530.70367, 33960.62652, 35423.73173, 36912.67206, 38419.82366, 39937.33124, 41457.15567, 42971.12353, 44470.97839, 45948.4333, 47395.22432, 48803.1645, 50164.19805, 51470.45429, 52714.30082, 53888.39572, 54985.73821, 55999.71739, 56924.15873, 57753.36791, 58482.17157, 59105.95474, 59620.69458, 60022.99006, 60310.08746, 60479.90138, 60531.03102, 60462.7716, 60275.12089, 59968.78058, 59545.15259, 59006.33026, 58355.08446, 57594.84472, 56729.6755, 55764.24775, 54703.80592, 53554.13087, 52321.49862, 51012.63563, 49634.67066, 48195.0838, 46701.65296, 45162.3983, 43585.52507, 41979.36529, 40352.31879, 38712.79409, 37069.1496, 35429.63569, 33802.33807, 32195.12294, 30615.5845, 29070.99508, 27568.25858, 26113.86729, 24713.86279, 23373.80103, 22098.72202, 20893.12433, 19760.9446, 18705.54236, 17729.69006, 16835.56856, 16024.76806, 15298.29439, 14656.58064, 14099.50391, 13626.40712, 13236.12556, 12927.01787, 12697.00124, 12543.59036, 12463.93972, 12454.88888, 12513.01017, 12634.65834, 12816.02165, 13053.1738, 13342.12618, 13678.87994, 14059.47713, 14480.05056, 14936.87166, 15426.39591, 15945.30521, 16490.54687, 17059.36852, 17649.34876, 18258.423, 18884.90417, 19527.49817, 20185.31356, 20857.86555, 21545.0741, 22247.25598, 22965.11095, 23699.70207, 24452.43022, 25225.00316, 26019.39929, 26837.82649, 27682.67648, 28556.47502, 29461.82861, 30401.36811, 31377.68998, 32393.29574, 33450.53031, 34551.51997, 35698.11062, 36891.80716, 38133.71466, 39424.4821, 40764.24938, 42152.59851, 43588.50933, 45070.32084, 46595.69849, 48161.60811, 49764.29703, 51399.28287, 53061.35042, 54744.55684, 56442.2456, 58147.06931, 59851.02136, 61545.47666, 63221.24113, 64868.60995, 66477.43417, 68037.19538, 69537.08799, 70966.10844, 72313.15094, 73567.1087, 74716.98018, 75751.97913, 76661.64783, 77435.97218, 78065.49786, 78541.44619, 78855.82883, 79001.55989, 78972.56442, 78763.88205, 78371.76462, 77793.76658, 77028.82713, 76077.34289, 74941.23019, 73623.97592, 72130.67607, 70468.06121, 68644.50806, 66670.03676, 64556.29313, 62316.51568, 59965.48714, 57519.47035, 54996.12858, 52414.43046, 49794.5399, 47157.69144, 44526.05156, 41922.56702, 39370.8008, 36894.75698, 34518.6956, 32266.93888, 30163.6703, 28232.72796, 26497.39407, 24980.18205, 23702.62341, 22685.05593, 21946.41529, 21504.03205, 21373.43594, 21568.16935, 22099.6121, 22976.81927, 24206.37396, 25792.25676, 27735.73362, 30035.26356, 32686.42778, 35681.88143, 39011.32903, 42661.52467, 46616.29758, 50856.60374, 55360.60382, 60103.7675, 65059.00426, 70196.82002, 75485.49927, 80891.3118, 86378.74287, 91910.74563, 97449.01429, 102954.276, 108386.6, 113705.7211, 118871.3756, 123843.6476, 128583.3212, 133052.2381, 137213.6555, 141032.6025, 144476.2314, 147514.1606, 150118.8059, 152265.6969, 153933.7759, 155105.6747, 155767.9679, 155911.3986, 155531.074, 154626.6284, 153202.3512, 151267.2769, 148835.2368, 145924.8687, 142559.5848, 138767.4961, 134581.2922, 130038.0773, 125179.161, 120049.8057, 114698.9299, 109178.7702, 103544.5022, 97853.82333, 92166.49926, 86543.8771, 81048.36852, 75742.90619, 70690.37755, 65953.04003, 61591.9223, 57666.21635, 54232.66545, 51344.95315, 49053.09896, 47402.86614, 46435.18729, 46185.61362, 46683.79349, 47952.98609, 50009.61586, 52862.87315, 56514.36656, 60957.83211, 66178.90394, 72154.95144, 78854.98665, 86239.64603, 94261.24982, 102863.9418, 111983.9122, 121549.7047, 131482.6099, 141697.1448, 152101.6191, 162598.7867, 173086.5815, 183458.9361, 193606.6793, 203418.5095, 212782.0406, 221584.9139, 229715.9723, 237066.489, 243531.4456, 249010.8503, 253411.0895, 256646.3048, 258639.7842, 259325.3609, 258648.8079, 256569.2193, 253060.3674, 248112.0258, 241731.247, 233943.5841, 224794.2465, 214349.1779, 202696.0474, 189945.1416, 176230.1509, 161708.837, 146563.5751, 131001.7617, 115256.0791, 99584.61116, 84270.80272, 69623.25717, 55975.36787, 43684.77937, 33132.67554, 24722.89284, 18880.85804, 16052.3505, 16702.09076, 21312.15758, 30380.23753, 44417.71166, 63947.5854, 89502.26875, 121621.2149, 160848.4267, 207729.8412, 262810.6039, 326632.2442, 399729.7666, 482628.6705, 575841.9142, 679866.8377, 795182.0617, 922244.3786, 1061485.653, 1213309.747, 1378089.494, 1556163.732, 1747834.415, 1953363.826, 2172971.905, 2406833.708, 2655077.014, 2917780.104, 3194969.716, 3486619.201, 3792646.885, 4112914.658, 4447226.806, 4795329.078, 5156908.021, 5531590.577, 5918943.958, 6318475.793, 6729634.572, 7151810.362, 7584335.829, 8026487.533, 8477487.524, 8936505.216, 9402659.536, 9875021.357, 10352616.19, 10834427.12, 11319398.02, 11806436.95, 12294419.84, 12782194.28, 13268583.6, 13752391.03, 14232404.12, 14707399.13, 15176145.69, 15637411.47, 16089966.89, 16532589.95, 16964071.02, 17383217.68, 17788859.43, 18179852.51, 18555084.49, 18913478.87, 19253999.5, 19575654.91, 19877502.4, 20158652.05, 20418270.41, 20655584.08, 20869882.94, 21060523.21, 21226930.18, 21368600.67, 21485105.19, 21576089.81, 21641277.63, 21680470.01, 21693547.44, 21693547.44, 21680470.01, 21641277.63, 21576089.81, 21485105.19, 21368600.67, 21226930.18, 21060523.21, 20869882.94, 20655584.08, 20418270.41, 20158652.05, 19877502.4, 19575654.91, 19253999.5, 18913478.87, 18555084.49, 18179852.51, 17788859.43, 17383217.68, 16964071.02, 16532589.95, 16089966.89, 15637411.47, 15176145.69, 14707399.13, 14232404.12, 13752391.03, 13268583.6, 12782194.28, 12294419.84, 11806436.95, 11319398.02, 10834427.12, 10352616.19, 9875021.357, 9402659.536, 8936505.216, 8477487.524, 8026487.533, 7584335.829, 7151810.362, 6729634.572, 6318475.793, 5918943.958, 5531590.577, 5156908.021, 4795329.078, 4447226.806, 4112914.658, 3792646.885, 3486619.201, 3194969.716, 2917780.104, 2655077.014, 2406833.708, 2172971.905, 1953363.826, 1747834.415, 1556163.732, 1378089.494, 1213309.747, 1061485.653, 922244.3786, 795182.0617, 679866.8377, 575841.9142, 482628.6705, 399729.7666, 326632.2442, 262810.6039, 207729.8412, 160848.4267, 121621.2149, 89502.26875, 63947.5854, 44417.71166, 30380.23753, 21312.15758, 16702.09076, 16052.3505, 18880.85804, 24722.89284, 33132.67554, 43684.77937, 55975.36787, 69623.25717, 84270.80272, 99584.61116, 115256.0791, 131001.7617, 146563.5751, 161708.837, 176230.1509, 189945.1416, 202696.0474, 214349.1779, 224794.2465, 233943.5841, 241731.247, 248112.0258, 253060.3674, 256569.2193, 258648.8079, 259325.3609, 258639.7842, 256646.3048, 253411.0895, 249010.8503, 243531.4456, 237066.489, 229715.9723, 221584.9139, 212782.0406, 203418.5095, 193606.6793, 183458.9361, 173086.5815, 162598.7867, 152101.6191, 141697.1448, 131482.6099, 121549.7047, 111983.9122, 102863.9418, 94261.24982, 86239.64603, 78854.98665, 72154.95144, 66178.90394, 60957.83211, 56514.36656, 52862.87315, 50009.61586, 47952.98609, 46683.79349, 46185.61362, 46435.18729, 47402.86614, 49053.09896, 51344.95315, 54232.66545, 57666.21635, 61591.9223, 65953.04003, 70690.37755, 75742.90619, 81048.36852, 86543.8771, 92166.49926, 97853.82333, 103544.5022, 109178.7702, 114698.9299, 120049.8057, 125179.161, 130038.0773, 134581.2922, 138767.4961, 142559.5848, 145924.8687, 148835.2368, 151267.2769, 153202.3512, 154626.6284, 155531.074, 155911.3986, 155767.9679, 155105.6747, 153933.7759, 152265.6969, 150118.8059, 147514.1606, 144476.2314, 141032.6025, 137213.6555, 133052.2381, 128583.3212, 123843.6476, 118871.3756, 113705.7211, 108386.6, 102954.276, 97449.01429, 91910.74563, 86378.74287, 80891.3118, 75485.49927, 70196.82002, 65059.00426, 60103.7675, 55360.60382, 50856.60374, 46616.29758, 42661.52467, 39011.32903, 35681.88143, 32686.42778, 30035.26356, 27735.73362, 25792.25676, 24206.37396, 22976.81927, 22099.6121, 21568.16935, 21373.43594, 21504.03205, 21946.41529, 22685.05593, 23702.62341, 24980.18205, 26497.39407, 28232.72796, 30163.6703, 32266.93888, 34518.6956, 36894.75698, 39370.8008, 41922.56702, 44526.05156, 47157.69144, 49794.5399, 52414.43046, 54996.12858, 57519.47035, 59965.48714, 62316.51568, 64556.29313, 66670.03676, 68644.50806, 70468.06121, 72130.67607, 73623.97592, 74941.23019, 76077.34289, 77028.82713, 77793.76658, 78371.76462, 78763.88205, 78972.56442, 79001.55989, 78855.82883, 78541.44619, 78065.49786, 77435.97218, 76661.64783, 75751.97913, 74716.98018, 73567.1087, 72313.15094, 70966.10844, 69537.08799, 68037.19538, 66477.43417, 64868.60995, 63221.24113, 61545.47666, 59851.02136, 58147.06931, 56442.2456, 54744.55684, 53061.35042, 51399.28287, 49764.29703, 48161.60811, 46595.69849, 45070.32084, 43588.50933, 42152.59851, 40764.24938, 39424.4821, 38133.71466, 36891.80716, 35698.11062, 34551.51997, 33450.53031, 32393.29574, 31377.68998, 30401.36811, 29461.82861, 28556.47502, 27682.67648, 26837.82649, 26019.39929, 25225.00316, 24452.43022, 23699.70207, 22965.11095, 22247.25598, 21545.0741, 20857.86555, 20185.31356, 19527.49817, 18884.90417, 18258.423, 17649.34876, 17059.36852, 16490.54687, 15945.30521, 15426.39591, 14936.87166, 14480.05056, 14059.47713, 13678.87994, 13342.12618, 13053.1738, 12816.02165, 12634.65834, 12513.01017, 12454.88888, 12463.93972, 12543.59036, 12697.00124, 12927.01787, 13236.12556, 13626.40712, 14099.50391, 14656.58064, 15298.29439, 16024.76806, 16835.56856, 17729.69006, 18705.54236, 19760.9446, 20893.12433, 22098.72202, 23373.80103, 24713.86279, 26113.86729, 27568.25858, 29070.99508, 30615.5845, 32195.12294, 33802.33807, 35429.63569, 37069.1496, 38712.79409, 40352.31879, 41979.36529, 43585.52507, 45162.3983, 46701.65296, 48195.0838, 49634.67066, 51012.63563, 52321.49862, 53554.13087, 54703.80592, 55764.24775, 56729.6755, 57594.84472, 58355.08446, 59006.33026, 59545.15259, 59968.78058, 60275.12089, 60462.7716, 60531.03102, 60479.90138, 60310.08746, 60022.99006, 59620.69458, 59105.95474, 58482.17157, 57753.36791, 56924.15873, 55999.71739, 54985.73821, 53888.39572, 52714.30082, 51470.45429, 50164.19805, 48803.1645, 47395.22432, 45948.4333, 44470.97839, 42971.12353, 41457.15567, 39937.33124, 38419.82366, 36912.67206, 35423.73173, 33960.62652, 32530.70367, 31140.99107, 29798.15761, 28508.47647, 27277.79188, 26111.48933, 25014.46943, 23991.12562, 23045.32568, 22180.39721, 21399.11706, 20703.70465, 20095.81929, 19576.56125, 19146.4766, 18805.56568, 18553.29503, 18388.61264, 18309.96629, 18315.32478, 18402.20184, 18567.68254, 18808.45171, 19120.82444, 19500.77812, 19943.98588, 20445.8511, 21001.54267, 21606.03093, 22254.12366, 22940.50223, 23659.75735, 24406.42441, 25175.01799, 25960.06546, 26756.13933, 27557.88829, 28360.0667, 29157.56239, 29945.42261, 30718.8781, 31473.36502, 32204.5449, 32908.32234, 33580.86053, 34218.59455, 34818.24249, 35376.81433, 35891.6187, 36360.2675, 36780.67853, 37151.0761, 37469.98984, 37736.25173, 37948.99145, 38107.63022, 38211.87328, 38261.70106, 38257.35921, 38199.34766, 38088.40882, 37925.51503, 37711.85547, 37448.82253, 37137.99796, 36781.13872, 36380.16275, 35937.13478, 35454.25221, 34933.8312, 34378.29305, 33790.15088, 33171.99676, 32526.48929, 31856.34163, 31164.31009, 30453.18332, 29725.77193, 28984.89878, 28233.38979, 27474.06529, 26709.73189, 25943.17485, 25177.15094, 24414.38169, 23657.54704, 22909.27941, 22172.15796, 21448.70318, 20741.37172, 20052.55136, 19384.55611, 18739.62141, 18119.89942, 17527.45433, 16964.25762, 16432.18342, 15933.00367, 15468.38341, 15039.87592, 14648.91782, 14296.82421, 13984.78368, 13713.85346, 13484.95445, 13298.86649, 13156.22357, 13057.50933, 13003.05267, 12993.02368, 13027.42984, 13106.11262, 13228.7445, 13394.8265, 13603.68623, 13854.47665, 14146.17538, 14477.58487, 14847.33327, 15253.87621, 15695.49943, 16170.32232, 16676.30246, 17211.24113, 17772.78983, 18358.45778, 18965.62045, 19591.52918, 20233.32163, 20888.03336, 21552.61024, 22223.92176, 22898.77526, 23573.93075, 24246.11666, 24912.04598, 25568.4331, 26212.01101, 26839.5488, 27447.86947, 28033.86777, 28594.5281, 29126.94217, 29628.32657, 30096.03977, 30527.59881, 30920.69518, 31273.2101, 31583.22878, 31849.05385, 32069.21754, 32242.49273, 32367.90273, 32444.72952, 32472.52069, 32451.0947, 32380.54457, 32261.23989, 32093.82716, 31879.22834, 31618.63768, 31313.51681, 30965.58803, 30576.82598, 30149.44746, 29685.89981, 29188.84755, 28661.15758, 28105.88298, 27526.24544, 26925.6165, 26307.49767, 25675.49959, 25033.32032, 24384.72298, 23733.51272, 23083.51345, 22438.54416, 21802.39523, 21178.80483, 20571.43546, 19983.85097, 19419.49408, 18881.66459, 18373.49849, 17897.948, 17457.76283, 17055.47261, 16693.37079, 16373.49999, 16097.63894, 15867.29122, 15683.67563, 15547.71848, 15460.04779, 15420.98938, 15430.56494, 15488.49212, 15594.18649, 15746.76561, 15945.05492, 16187.59555, 16472.65403, 16798.23367, 17162.08775, 17561.73419, 17994.47185, 18457.39809, 18947.42771, 19461.31293, 19995.66444, 20546.9733, 21111.6335, 21685.96509, 22266.23775, 22848.69458, 23429.57588, 24005.14303, 24571.70193, 25125.62622, 25663.37981, 26181.53885, 26676.81275, 27146.0643, 27586.32867, 27994.83122, 28369.00392, 28706.50042, 29005.20955, 29263.26726, 29479.06687, 29651.26762, 29778.80145, 29860.87798, 29896.98771, 29886.90334, 29830.67937, 29728.64981, 29581.42415, 29389.88168, 29155.16402, 28878.66615, 28562.0258, 28207.11148, 27816.00911, 27391.00734, 26934.58184, 26449.37839, 25938.19518, 25403.96422, 24849.73213, 24278.64037, 23693.90507, 23098.79653, 22496.6187, 21890.68851, 21284.31539, 20680.78109, 20083.31976, 19495.09863, 18919.19927, 18358.59956, 17816.1565, 17294.59001, 16796.46763, 16324.19045, 15879.98014, 15465.86727, 15083.68092, 14735.03963, 14421.34374, 14143.76922, 13903.26286, 13700.53895, 13536.07741, 13410.12339, 13322.68829, 13273.55217, 13262.26757, 13288.16465, 13350.3576, 13447.7523, 13579.05517, 13742.78305, 13937.27418, 14160.70005, 14411.0782, 14686.28571, 14984.07341, 15302.0807, 15637.85079, 15988.84639, 16352.46572, 16726.05864, 17106.94294, 17492.4206, 17879.79399, 18266.38183, 18649.53495, 19026.65159, 19395.19232, 19752.6944, 20096.78553, 20425.19695, 20735.77574, 21026.49634, 21295.47124, 21540.96069, 21761.38149, 21955.3148, 22121.51283, 22258.90463, 22366.60063, 22443.89622, 22490.27417, 22505.40598, 22489.1521, 22441.56113, 22362.86788, 22253.49043, 22114.02618, 21945.24687, 21748.0927, 21523.66554, 21273.22124, 20998.16117, 20700.02299, 20380.47076, 20041.28434, 19684.34829, 19311.64023, 18925.21877, 18527.21106, 18119.80006, 17705.21159, 17285.70117, 16863.54088, 16441.00612, 16020.36248, 15603.85272, 15193.684, 14792.01535, 14400.94547, 14022.50098, 13658.62509, 13311.16682, 12981.87086, 12672.36792, 12384.16596, 12118.64198, 11877.03469, 11660.43798, 11469.79518, 11305.89426, 11169.36393, 11060.67058, 10980.11624, 10927.83745, 10903.80508, 10907.82508, 10939.54022, 10998.4327, 11083.82769, 11194.89784, 11330.66853, 11490.02408, 11671.71466]
+                    ]
 
-    ks_results_formatted = [[ks_statistic, ks_p_value] for ks_statistic, ks_p_value in ks_results]
 
-    write_results_to_file(ks_results_formatted, "kstest_results.txt")
+if __name__ == "__main__":
+    # The guard lets other modules (and process pool workers) import the functions above
+    sanitised_data = import_sanitised_data()
+    normalized_sanitised_data = normalize_data(sanitised_data)
 
+    theoretical_data = SampleSet.from_rows(THEORETICAL_DATA, names=THEORETICAL_NAMES)
 
-sanitised_data = import_sanitised_data()
-normalized_sanitised_data = normalize_data(sanitised_data)
+    theoretical_data = log_transform(theoretical_data)
 
-# Replace with actual theoretical data (2um 22.5dg, 4.8um 22.5dg, 9.6um 22.5dg)
-theoretical_data = [[507.4142813, 501.3576904, 495.3644089, 489.4373216, 483.5793157, 477.7932805, 472.0821061, 466.4486834, 460.8959027, 455.4266533, 450.0438226, 444.7502954, 439.5489533, 434.4426735, 429.4343285, 424.5267852, 419.7229036, 415.0255371, 410.4375307, 405.9617206, 401.6009337, 397.3579861, 393.2356831, 389.2368179, 385.364171, 381.6205092, 378.008585, 374.5311359, 371.1908833, 367.9905318, 364.9327684, 362.0202619, 359.2556618, 356.6415975, 354.1806777, 351.8754896, 349.7285977, 347.7425435, 345.9198445, 344.2629931, 342.7744564, 341.4566746, 340.3120612, 339.3430011, 338.5518507, 337.9409367, 337.5125552, 337.2689711, 337.2124175, 337.3450944, 337.6691682, 338.1867711, 338.9000001, 339.810916, 340.9215431, 342.2338683, 343.7498401, 345.471368, 347.4003217, 349.5385306, 351.8877827, 354.4498239, 357.2263575, 360.2190433, 363.4294971, 366.8592894, 370.5099456, 374.3829443, 378.4797174, 382.801649, 387.3500749, 392.1262817, 397.1315064, 402.3669355, 407.8337046, 413.5328976, 419.465546, 425.6326282, 432.0350695, 438.6737407, 445.5494578, 452.6629815, 460.0150167, 467.6062117, 475.4371576, 483.508388, 491.8203784, 500.3735456, 509.168247, 518.2047805, 527.4833837, 537.0042335, 546.7674457, 556.7730745, 567.021112, 577.5114876, 588.2440682, 599.218657, 610.4349937, 621.8927536, 633.5915479, 645.5309227, 657.710359, 670.1292723, 682.7870122, 695.6828623, 708.8160398, 722.1856951, 735.7909118, 749.6307062, 763.7040273, 778.0097565, 792.5467073, 807.3136255, 822.3091883, 837.5320051, 852.9806166, 868.6534949, 884.5490439, 900.6655983, 917.0014244, 933.5547194, 950.323612, 967.3061617, 984.5003594, 1001.904127, 1019.515318, 1037.331717, 1055.351039, 1073.570932, 1091.988975, 1110.602678, 1129.409485, 1148.406769, 1167.591836, 1186.961927, 1206.514213, 1226.245799, 1246.153722, 1266.234954, 1286.4864, 1306.904898, 1327.487223, 1348.230082, 1369.13012, 1390.183914, 1411.38798, 1432.73877, 1454.232671, 1475.866009, 1497.635047, 1519.535988, 1541.564972, 1563.718079, 1585.991329, 1608.380684, 1630.882045, 1653.491257, 1676.204107, 1699.016323, 1721.923581, 1744.921498, 1768.005639, 1791.171514, 1814.414579, 1837.730241, 1861.113851, 1884.560714, 1908.066082, 1931.625159, 1955.233103, 1978.885022, 2002.575979, 2026.300993, 2050.055038, 2073.833045, 2097.629902, 2121.440458, 2145.259519, 2169.081855, 2192.902196, 2216.715236, 2240.515635, 2264.298015, 2288.056968, 2311.787052, 2335.482794, 2359.138694, 2382.74922, 2406.308814, 2429.811894, 2453.25285, 2476.626052, 2499.925845, 2523.146557, 2546.282492, 2569.32794, 2592.277174, 2615.124449, 2637.86401, 2660.490087, 2682.996901, 2705.378663, 2727.629576, 2749.743837, 2771.715638, 2793.539167, 2815.208611, 2836.718158, 2858.061994, 2879.234312, 2900.229307, 2921.04118, 2941.664142, 2962.09241, 2982.320214, 3002.341798, 3022.151417, 3041.743346, 3061.111874, 3080.251311, 3099.155989, 3117.820261, 3136.238505, 3154.405126, 3172.314556, 3189.961258, 3207.339726, 3224.444485, 3241.270098, 3257.811164, 3274.062319, 3290.018241, 3305.67365, 3321.023308, 3336.062025, 3350.784657, 3365.186109, 3379.261339, 3393.005355, 3406.413223, 3419.480063, 3432.201053, 3444.571433, 3456.586503, 3468.241629, 3479.53224, 3490.453833, 3501.001976, 3511.172305, 3520.960531, 3530.362438, 3539.373887, 3547.990817, 3556.209246, 3564.025277, 3571.435091, 3578.434959, 3585.021236, 3591.190366, 3596.938886, 3602.263422, 3607.160695, 3611.627522, 3615.660817, 3619.257594, 3622.414965, 3625.130148, 3627.400462, 3629.223332, 3630.596294, 3631.516988, 3631.983167, 3631.992697, 3631.543555, 3630.633837, 3629.261753, 3627.425631, 3625.123922, 3622.355197, 3619.118147, 3615.411593, 3611.234477, 3606.585871, 3601.464974, 3595.871117, 3589.80376, 3583.262497, 3576.247057, 3568.757303, 3560.793236, 3552.354992, 3543.442851, 3534.057229, 3524.198685, 3513.867922, 3503.065785, 3491.793265, 3480.051499, 3467.84177, 3455.16551, 3442.024301, 3428.419873, 3414.354108, 3399.82904, 3384.846856, 3369.409896, 3353.520654, 3337.181782, 3320.396084, 3303.166524, 3285.496221, 3267.388453, 3248.846657, 3229.874429, 3210.475525, 3190.653861, 3170.413513, 3149.75872, 3128.693881, 3107.223559, 3085.352477, 3063.085522, 3040.427744, 3017.384356, 2993.960734, 2970.162418, 2945.995112, 2921.464683, 2896.577161, 2871.338742, 2845.755783, 2819.834806, 2793.582498, 2767.005706, 2740.111442, 2712.906881, 2685.399361, 2657.596381, 2629.505602, 2601.134847, 2572.4921, 2543.585505, 2514.423367, 2485.01415, 2455.366475, 2425.489124, 2395.391035, 2365.081302, 2334.569175, 2303.864061, 2272.975518, 2241.91326, 2210.687151, 2179.307208, 2147.783597, 2116.126632, 2084.346779, 2052.454646, 2020.460988, 1988.376706, 1956.212842, 1923.98058, 1891.691243, 1859.356295, 1826.987336, 1794.5961, 1762.194457, 1729.79441, 1697.40809, 1665.047759, 1632.725806, 1600.454745, 1568.247214, 1536.115973, 1504.0739, 1472.133994, 1440.309367, 1408.613245, 1377.058968, 1345.659983, 1314.429845, 1283.382215, 1252.530856, 1221.889632, 1191.472504, 1161.293532, 1131.366866, 1101.706748, 1072.32751, 1043.243568, 1014.469422, 986.0196534, 957.9089209, 930.151959, 902.763575, 875.7586459, 849.1521161, 822.9589943, 797.1943506, 771.8733137, 747.0110682, 722.622851, 698.7239491, 675.329696, 652.4554689, 630.1166855, 608.328801, 587.1073048, 566.4677174, 546.4255874, 526.9964879, 508.1960134, 490.0397766, 472.5434051, 455.7225377, 439.5928218, 424.169909, 409.4694526, 395.5071036, 382.2985076, 369.859301, 358.2051077, 347.3515358, 337.3141733, 328.1085857, 319.7503113, 312.2548583, 305.6377011, 299.9142764, 295.0999798, 291.2101623, 288.2601261, 286.2651217, 285.2403434, 285.2009262, 286.161942, 288.1383954, 291.1452209, 295.1972782, 300.3093491, 306.4961336, 313.772246, 322.1522115, 331.6504619, 342.2813324, 354.0590577, 366.9977681, 381.1114856, 396.4141209, 412.9194686, 430.6412043, 449.5928805, 469.7879228, 491.2396265, 513.9611526, 537.965524, 563.2656223, 589.8741834, 617.8037945, 647.06689, 677.675748, 709.6424865, 742.9790602, 777.6972564, 813.8086915, 851.3248078, 890.2568694, 930.6159592, 972.412975, 1015.658626, 1060.36343, 1106.537708, 1154.191584, 1203.334978, 1253.977606, 1306.128975, 1359.798378, 1414.994894, 1471.727382, 1530.004481, 1589.834603, 1651.225932, 1714.18642, 1778.723786, 1844.845509, 1912.558829, 1981.870742, 2052.787998, 2125.317095, 2199.464281, 2275.235548, 2352.63663, 2431.672999, 2512.349867, 2594.672175, 2678.6446, 2764.271544, 2851.557137, 2940.505232, 3031.119405, 3123.402947, 3217.358871, 3312.989899, 3410.298468, 3509.286725, 3609.956524, 3712.309425, 3816.346691, 3922.069288, 4029.477881, 4138.572834, 4249.354205, 4361.821749, 4475.974913, 4591.812835, 4709.334344, 4828.537954, 4949.421869, 5071.983978, 5196.221853, 5322.132749, 5449.713603, 5578.961034, 5709.871338, 5842.440491, 5976.664146, 6112.537635, 6250.055963, 6389.213812, 6530.005538, 6672.425172, 6816.466417, 6962.122652, 7109.386925, 7258.251959, 7408.710149, 7560.753561, 7714.373934, 7869.562678, 8026.310876, 8184.609282, 8344.448323, 8505.818099, 8668.708381, 8833.108616, 8999.007923, 9166.395094, 9335.2586, 9505.586584, 9677.366867, 9850.586946, 10025.234, 10201.29488, 10378.75612, 10557.60395, 10737.82425, 10919.40261, 11102.32431, 11286.57429, 11472.13721, 11658.99738, 11847.13884, 12036.5453, 12227.20018, 12419.08659, 12612.18732, 12806.4849, 13001.96152, 13198.59911, 13396.37929, 13595.28339, 13795.29246, 13996.38725, 14198.54824, 14401.75563, 14605.98932, 14811.22896, 15017.45392, 15224.6433, 15432.77592, 15641.83037, 15851.78493, 16062.61767, 16274.30638, 16486.8286, 16700.16163, 16914.28252, 17129.16808, 17344.79488, 17561.13926, 17778.17734, 17995.88498, 18214.23786, 18433.2114, 18652.78084, 18872.92119, 19093.60725, 19314.81362, 19536.51471, 19758.68473, 19981.2977, 20204.32743, 20427.74759, 20651.53164, 20875.65288, 21100.08444, 21324.79928, 21549.7702, 21774.96985, 22000.37073, 22225.94518, 22451.66543, 22677.50354, 22903.43145, 23129.42098, 23355.44383, 23581.47156, 23807.47564, 24033.42743, 24259.29818, 24485.05906, 24710.68113, 24936.13537, 25161.39268, 25386.42388, 25611.19973, 25835.69091, 26059.86806, 26283.70173, 26507.16246, 26730.22073, 26952.84696, 27175.01158, 27396.68496, 27617.83746, 27838.43941, 28058.46115, 28277.873, 28496.64528, 28714.74832, 28932.15246, 29148.82805, 29364.74548, 29579.87514, 29794.18748, 30007.65297, 30220.24213, 30431.92555, 30642.67383, 30852.45768, 31061.24784, 31269.01516, 31475.73052, 31681.36492, 31885.88945, 32089.27527, 32291.49366, 32492.516, 32692.31378, 32890.85861, 33088.12222, 33284.07647, 33478.69335, 33671.945, 33863.8037, 34054.24186, 34243.23208, 34430.74709, 34616.75981, 34801.24331, 34984.17086, 35165.51589, 35345.25202, 35523.35309, 35699.7931, 35874.54628, 36047.58705, 36218.89006, 36388.43017, 36556.18245, 36722.12223, 36886.22504, 37048.46666, 37208.82313, 37367.27072, 37523.78594, 37678.34559, 37830.92671, 37981.5066, 38130.06286, 38276.57334, 38421.01617, 38563.36979, 38703.61289, 38841.72449, 38977.68389, 39111.47069, 39243.0648, 39372.44644, 39499.59614, 39624.49475, 39747.12345, 39867.46373, 39985.49742, 40101.20668, 40214.57402, 40325.58226, 40434.21458, 40540.45452, 40644.28596, 40745.69312, 40844.6606, 40941.17335, 41035.21668, 41126.77628, 41215.83818, 41302.38882, 41386.41498, 41467.90385, 41546.84297, 41623.22029, 41697.02412, 41768.24319, 41836.86658, 41902.88379, 41966.28471, 42027.05963, 42085.19922, 42140.69457, 42193.53716, 42243.71888, 42291.23203, 42336.06932, 42378.22384, 42417.68913, 42454.45912, 42488.52816, 42519.891, 42548.54282, 42574.47921, 42597.69619, 42618.19017, 42635.95801, 42650.99696, 42663.30472, 42672.87939, 42679.71949, 42683.82398, 42685.19221, 42685.19221, 42683.82398, 42679.71949, 42672.87939, 42663.30472, 42650.99696, 42635.95801, 42618.19017, 42597.69619, 42574.47921, 42548.54282, 42519.891, 42488.52816, 42454.45912, 42417.68913, 42378.22384, 42336.06932, 42291.23203, 42243.71888, 42193.53716, 42140.69457, 42085.19922, 42027.05963, 41966.28471, 41902.88379, 41836.86658, 41768.24319, 41697.02412, 41623.22029, 41546.84297, 41467.90385, 41386.41498, 41302.38882, 41215.83818, 41126.77628, 41035.21668, 40941.17335, 40844.6606, 40745.69312, 40644.28596, 40540.45452, 40434.21458, 40325.58226, 40214.57402, 40101.20668, 39985.49742, 39867.46373, 39747.12345, 39624.49475, 39499.59614, 39372.44644, 39243.0648, 39111.47069, 38977.68389, 38841.72449, 38703.61289, 38563.36979, 38421.01617, 38276.57334, 38130.06286, 37981.5066, 37830.92671, 37678.34559, 37523.78594, 37367.27072, 37208.82313, 37048.46666, 36886.22504, 36722.12223, 36556.18245, 36388.43017, 36218.89006, 36047.58705, 35874.54628, 35699.7931, 35523.35309, 35345.25202, 35165.51589, 34984.17086, 34801.24331, 34616.75981, 34430.74709, 34243.23208, 34054.24186, 33863.8037, 33671.945, 33478.69335, 33284.07647, 33088.12222, 32890.85861, 32692.31378, 32492.516, 32291.49366, 32089.27527, 31885.88945, 31681.36492, 31475.73052, 31269.01516, 31061.24784, 30852.45768, 30642.67383, 30431.92555, 30220.24213, 30007.65297, 29794.18748, 29579.87514, 29364.74548, 29148.82805, 28932.15246, 28714.74832, 28496.64528, 28277.873, 28058.46115, 27838.43941, 27617.83746, 27396.68496, 27175.01158, 26952.84696, 26730.22073, 26507.16246, 26283.70173, 26059.86806, 25835.69091, 25611.19973, 25386.42388, 25161.39268, 24936.13537, 24710.68113, 24485.05906, 24259.29818, 24033.42743, 23807.47564, 23581.47156, 23355.44383, 23129.42098, 22903.43145, 22677.50354, 22451.66543, 22225.94518, 22000.37073, 21774.96985, 21549.7702, 21324.79928, 21100.08444, 20875.65288, 20651.53164, 20427.74759, 20204.32743, 19981.2977, 19758.68473, 19536.51471, 19314.81362, 19093.60725, 18872.92119, 18652.78084, 18433.2114, 18214.23786, 17995.88498, 17778.17734, 17561.13926, 17344.79488, 17129.16808, 16914.28252, 16700.16163, 16486.8286, 16274.30638, 16062.61767, 15851.78493, 15641.83037, 15432.77592, 15224.6433, 15017.45392, 14811.22896, 14605.98932, 14401.75563, 14198.54824, 13996.38725, 13795.29246, 13595.28339, 13396.37929, 13198.59911, 13001.96152, 12806.4849, 12612.18732, 12419.08659, 12227.20018, 12036.5453, 11847.13884, 11658.99738, 11472.13721, 11286.57429, 11102.32431, 10919.40261, 10737.82425, 10557.60395, 10378.75612, 10201.29488, 10025.234, 9850.586946, 9677.366867, 9505.586584, 9335.2586, 9166.395094, 8999.007923, 8833.108616, 8668.708381, 8505.818099, 8344.448323, 8184.609282, 8026.310876, 7869.562678, 7714.373934, 7560.753561, 7408.710149, 7258.251959, 7109.386925, 6962.122652, 6816.466417, 6672.425172, 6530.005538, 6389.213812, 6250.055963, 6112.537635, 5976.664146, 5842.440491, 5709.871338, 5578.961034, 5449.713603, 5322.132749, 5196.221853, 5071.983978, 4949.421869, 4828.537954, 4709.334344, 4591.812835, 4475.974913, 4361.821749, 4249.354205, 4138.572834, 4029.477881, 3922.069288, 3816.346691, 3712.309425, 3609.956524, 3509.286725, 3410.298468, 3312.989899, 3217.358871, 3123.402947, 3031.119405, 2940.505232, 2851.557137, 2764.271544, 2678.6446, 2594.672175, 2512.349867, 2431.672999, 2352.63663, 2275.235548, 2199.464281, 2125.317095, 2052.787998, 1981.870742, 1912.558829, 1844.845509, 1778.723786, 1714.18642, 1651.225932, 1589.834603, 1530.004481, 1471.727382, 1414.994894, 1359.798378, 1306.128975, 1253.977606, 1203.334978, 1154.191584, 1106.537708, 1060.36343, 1015.658626, 972.412975, 930.6159592, 890.2568694, 851.3248078, 813.8086915, 777.6972564, 742.9790602, 709.6424865, 677.675748, 647.06689, 617.8037945, 589.8741834, 563.2656223, 537.965524, 513.9611526, 491.2396265, 469.7879228, 449.5928805, 430.6412043, 412.9194686, 396.4141209, 381.1114856, 366.9977681, 354.0590577, 342.2813324, 331.6504619, 322.1522115, 313.772246, 306.4961336, 300.3093491, 295.1972782, 291.1452209, 288.1383954, 286.161942, 285.2009262, 285.2403434, 286.2651217, 288.2601261, 291.2101623, 295.0999798, 299.9142764, 305.6377011, 312.2548583, 319.7503113, 328.1085857, 337.3141733, 347.3515358, 358.2051077, 369.859301, 382.2985076, 395.5071036, 409.4694526, 424.169909, 439.5928218, 455.7225377, 472.5434051, 490.0397766, 508.1960134, 526.9964879, 546.4255874, 566.4677174, 587.1073048, 608.328801, 630.1166855, 652.4554689, 675.329696, 698.7239491, 722.622851, 747.0110682, 771.8733137, 797.1943506, 822.9589943, 849.1521161, 875.7586459, 902.763575, 930.151959, 957.9089209, 986.0196534, 1014.469422, 1043.243568, 1072.32751, 1101.706748, 1131.366866, 1161.293532, 1191.472504, 1221.889632, 1252.530856, 1283.382215, 1314.429845, 1345.659983, 1377.058968, 1408.613245, 1440.309367, 1472.133994, 1504.0739, 1536.115973, 1568.247214, 1600.454745, 1632.725806, 1665.047759, 1697.40809, 1729.79441, 1762.194457, 1794.5961, 1826.987336, 1859.356295, 1891.691243, 1923.98058, 1956.212842, 1988.376706, 2020.460988, 2052.454646, 2084.346779, 2116.126632, 2147.783597, 2179.307208, 2210.687151, 2241.91326, 2272.975518, 2303.864061, 2334.569175, 2365.081302, 2395.391035, 2425.489124, 2455.366475, 2485.01415, 2514.423367, 2543.585505, 2572.4921, 2601.134847, 2629.505602, 2657.596381, 2685.399361, 2712.906881, 2740.111442, 2767.005706, 2793.582498, 2819.834806, 2845.755783, 2871.338742, 2896.577161, 2921.464683, 2945.995112, 2970.162418, 2993.960734, 3017.384356, 3040.427744, 3063.085522, 3085.352477, 3107.223559, 3128.693881, 3149.75872, 3170.413513, 3190.653861, 3210.475525, 3229.874429, 3248.846657, 3267.388453, 3285.496221, 3303.166524, 3320.396084, 3337.181782, 3353.520654, 3369.409896, 3384.846856, 3399.82904, 3414.354108, 3428.419873, 3442.024301, 3455.16551, 3467.84177, 3480.051499, 3491.793265, 3503.065785, 3513.867922, 3524.198685, 3534.057229, 3543.442851, 3552.354992, 3560.793236, 3568.757303, 3576.247057, 3583.262497, 3589.80376, 3595.871117, 3601.464974, 3606.585871, 3611.234477, 3615.411593, 3619.118147, 3622.355197, 3625.123922, 3627.425631, 3629.261753, 3630.633837, 3631.543555, 3631.992697, 3631.983167, 3631.516988, 3630.596294, 3629.223332, 3627.400462, 3625.130148, 3622.414965, 3619.257594, 3615.660817, 3611.627522, 3607.160695, 3602.263422, 3596.938886, 3591.190366, 3585.021236, 3578.434959, 3571.435091, 3564.025277, 3556.209246, 3547.990817, 3539.373887, 3530.362438, 3520.960531, 3511.172305, 3501.001976, 3490.453833, 3479.53224, 3468.241629, 3456.586503, 3444.571433, 3432.201053, 3419.480063, 3406.413223, 3393.005355, 3379.261339, 3365.186109, 3350.784657, 3336.062025, 3321.023308, 3305.67365, 3290.018241, 3274.062319, 3257.811164, 3241.270098, 3224.444485, 3207.339726, 3189.961258, 3172.314556, 3154.405126, 3136.238505, 3117.820261, 3099.155989, 3080.251311, 3061.111874, 3041.743346, 3022.151417, 3002.341798, 2982.320214, 2962.09241, 2941.664142, 2921.04118, 2900.229307, 2879.234312, 2858.061994, 2836.718158, 2815.208611, 2793.539167, 2771.715638, 2749.743837, 2727.629576, 2705.378663, 2682.996901, 2660.490087, 2637.86401, 2615.124449, 2592.277174, 2569.32794, 2546.282492, 2523.146557, 2499.925845, 2476.626052, 2453.25285, 2429.811894, 2406.308814, 2382.74922, 2359.138694, 2335.482794, 2311.787052, 2288.056968, 2264.298015, 2240.515635, 2216.715236, 2192.902196, 2169.081855, 2145.259519, 2121.440458, 2097.629902, 2073.833045, 2050.055038, 2026.300993, 2002.575979, 1978.885022, 1955.233103, 1931.625159, 1908.066082, 1884.560714, 1861.113851, 1837.730241, 1814.414579, 1791.171514, 1768.005639, 1744.921498, 1721.923581, 1699.016323, 1676.204107, 1653.491257, 1630.882045, 1608.380684, 1585.991329, 1563.718079, 1541.564972, 1519.535988, 1497.635047, 1475.866009, 1454.232671, 1432.73877, 1411.38798, 1390.183914, 1369.13012, 1348.230082, 1327.487223, 1306.904898, 1286.4864, 1266.234954, 1246.153722, 1226.245799, 1206.514213, 1186.961927, 1167.591836, 1148.406769, 1129.409485, 1110.602678, 1091.988975, 1073.570932, 1055.351039, 1037.331717, 1019.515318, 1001.904127, 984.5003594, 967.3061617, 950.323612, 933.5547194, 917.0014244, 900.6655983, 884.5490439, 868.6534949, 852.9806166, 837.5320051, 822.3091883, 807.3136255, 792.5467073, 778.0097565, 763.7040273, 749.6307062, 735.7909118, 722.1856951, 708.8160398, 695.6828623, 682.7870122, 670.1292723, 657.710359, 645.5309227, 633.5915479, 621.8927536, 610.4349937, 599.218657, 588.2440682, 577.5114876, 567.021112, 556.7730745, 546.7674457, 537.0042335, 527.4833837, 518.2047805, 509.168247, 500.3735456, 491.8203784, 483.508388, 475.4371576, 467.6062117, 460.0150167, 452.6629815, 445.5494578, 438.6737407, 432.0350695, 425.6326282, 419.465546, 413.5328976, 407.8337046, 402.3669355, 397.1315064, 392.1262817, 387.3500749, 382.801649, 378.4797174, 374.3829443, 370.5099456, 366.8592894, 363.4294971, 360.2190433, 357.2263575, 354.4498239, 351.8877827, 349.5385306, 347.4003217, 345.471368, 343.7498401, 342.2338683, 340.9215431, 339.810916, 338.9000001, 338.1867711, 337.6691682, 337.3450944, 337.2124175, 337.2689711, 337.5125552, 337.9409367, 338.5518507, 339.3430011, 340.3120612, 341.4566746, 342.7744564, 344.2629931, 345.9198445, 347.7425435, 349.7285977, 351.8754896, 354.1806777, 356.6415975, 359.2556618, 362.0202619, 364.9327684, 367.9905318, 371.1908833, 374.5311359, 378.008585, 381.6205092, 385.364171, 389.2368179, 393.2356831, 397.3579861, 401.6009337, 405.9617206, 410.4375307, 415.0255371, 419.7229036, 424.5267852, 429.4343285, 434.4426735, 439.5489533, 444.7502954, 450.0438226, 455.4266533, 460.8959027, 466.4486834, 472.0821061, 477.7932805, 483.5793157, 489.4373216, 495.3644089, 501.3576904, 507.4142813],
-                    [4029.61126, 3961.397534, 3892.448363, 3822.873088, 3752.782319, 3682.287779, 3611.502158, 3540.538954, 3469.512323, 3398.536922, 3327.727752, 3257.200004, 3187.068903, 3117.44955, 3048.456766, 2980.204939, 2912.807865, 2846.378598, 2781.029293, 2716.871056, 2654.013792, 2592.566056, 2532.634904, 2474.32575, 2417.742219, 2362.986006, 2310.156738, 2259.351833, 2210.666372, 2164.19296, 2120.021604, 2078.239581, 2038.931321, 2002.178285, 1968.058849, 1936.648193, 1908.018193, 1882.237314, 1859.370514, 1839.479143, 1822.620852, 1808.849505, 1798.215098, 1790.763675, 1786.537257, 1785.57377, 1787.906982, 1793.566439, 1802.577413, 1814.96085, 1830.733325, 1849.906999, 1872.489588, 1898.48433, 1927.889961, 1960.700695, 1996.906211, 2036.491643, 2079.437578, 2125.720055, 2175.310578, 2228.176123, 2284.279161, 2343.577681, 2406.025217, 2471.570887, 2540.159431, 2611.731258, 2686.222499, 2763.56506, 2843.68669, 2926.511045, 3011.957764, 3099.942544, 3190.37723, 3283.169897, 3378.224954, 3475.443233, 3574.722102, 3675.955572, 3779.034412, 3883.846266, 3990.275784, 4098.204744, 4207.51219, 4318.07457, 4429.765878, 4542.457798, 4656.01986, 4770.319594, 4885.222683, 5000.593137, 5116.293446, 5232.184761, 5348.127061, 5463.979329, 5579.599734, 5694.845812, 5809.574649, 5923.643068, 6036.90782, 6149.225772, 6260.454103, 6370.450498, 6479.07334, 6586.181913, 6691.636594, 6795.299056, 6897.032466, 6996.70168, 7094.173451, 7189.316617, 7282.00231, 7372.104144, 7459.49842, 7544.064314, 7625.684073, 7704.243209, 7779.630686, 7851.739105, 7920.464891, 7985.708476, 8047.37447, 8105.371842, 8159.614086, 8210.019391, 8256.510799, 8299.016362, 8337.469297, 8371.808132, 8401.976841, 8427.92499, 8449.607853, 8466.986547, 8480.028139, 8488.705757, 8492.998695, 8492.892501, 8488.37907, 8479.456717, 8466.130251, 8448.411035, 8426.317037, 8399.872881, 8369.109875, 8334.066042, 8294.786132, 8251.321636, 8203.730775, 8152.078495, 8096.43644, 8036.882919, 7973.502867, 7906.387789, 7835.635696, 7761.351031, 7683.644589, 7602.633414, 7518.4407, 7431.195673, 7341.033462, 7248.094967, 7152.526706, 7054.48066, 6954.114105, 6851.589433, 6747.073963, 6640.739747, 6532.763354, 6423.325662, 6312.611625, 6200.810039, 6088.113298, 5974.71714, 5860.820385, 5746.624666, 5632.334153, 5518.155264, 5404.296379, 5290.967536, 5178.380131, 5066.746603, 4956.28012, 4847.194259, 4739.702678, 4634.018787, 4530.355414, 4428.924469, 4329.936603, 4233.600869, 4140.124375, 4049.711944, 3962.565766, 3878.885053, 3798.865698, 3722.699927, 3650.575964, 3582.677686, 3519.184288, 3460.269953, 3406.103524, 3356.848173, 3312.661094, 3273.693178, 3240.088718, 3211.985102, 3189.512526, 3172.793709, 3161.94362, 3157.069212, 3158.269169, 3165.63366, 3179.244107, 3199.172963, 3225.483503, 3258.229628, 3297.455678, 3343.196267, 3395.476123, 3454.30995, 3519.7023, 3591.647458, 3670.129354, 3755.121479, 3846.586821, 3944.477821, 4048.736342, 4159.293659, 4276.070461, 4398.976874, 4527.912503, 4662.766491, 4803.417592, 4949.734269, 5101.574803, 5258.787427, 5421.21047, 5588.672531, 5760.992654, 5937.98054, 6119.43676, 6305.152996, 6494.912294, 6688.489337, 6885.650733, 7086.155318, 7289.75448, 7496.192493, 7705.206867, 7916.528718, 8129.883145, 8344.989624, 8561.562416, 8779.310989, 8997.940443, 9217.151959, 9436.643249, 9656.109019, 9875.241444, 10093.73064, 10311.26518, 10527.53253, 10742.21962, 10955.01332, 11165.60092, 11373.67069, 11578.91239, 11781.01775, 11979.68105, 12174.59957, 12365.47416, 12552.00975, 12733.91581, 12910.90694, 13082.7033, 13249.03115, 13409.62334, 13564.21976, 13712.56784, 13854.42303, 13989.5492, 14117.71913, 14238.71494, 14352.32846, 14458.36168, 14556.62712, 14646.94818, 14729.15955, 14803.10748, 14868.65013, 14925.65789, 14974.01361, 15013.61292, 15044.36441, 15066.18989, 15079.02456, 15082.81718, 15077.53024, 15063.14009, 15039.637, 15007.02527, 14965.32327, 14914.56349, 14854.79251, 14786.07099, 14708.47362, 14622.08906, 14527.01982, 14423.38214, 14311.30585, 14190.93419, 14062.42357, 13925.94342, 13781.67589, 13629.81555, 13470.56915, 13304.15527, 13130.80397, 12950.7564, 12764.26448, 12571.5904, 12373.00625, 12168.79356, 11959.24279, 11744.65289, 11525.33075, 11301.59072, 11073.75402, 10842.14824, 10607.10673, 10368.96803, 10128.0753, 9884.7757, 9639.419769, 9392.360826, 9143.954338, 8894.557283, 8644.52752, 8394.223147, 8144.001862, 7894.220322, 7645.2335, 7397.394052, 7151.051676, 6906.552486, 6664.238388, 6424.446462, 6187.508355, 5953.749683, 5723.489446, 5497.039451, 5274.703756, 5056.778122, 4843.549487, 4635.295454, 4432.283797, 4234.771991, 4043.00676, 3857.223647, 3677.646606, 3504.487623, 3337.946356, 3178.209801, 3025.451991, 2879.833719, 2741.502281, 2610.591263, 2487.220349, 2371.495153, 2263.507098, 2163.333308, 2071.036547, 1986.665175, 1910.253149, 1841.820048, 1781.371132, 1728.897436, 1684.37589, 1647.769478, 1619.027424, 1598.085413, 1584.865839, 1579.278089, 1581.218851, 1590.572459, 1607.211262, 1630.996023, 1661.776346, 1699.39113, 1743.669046, 1794.429046, 1851.480886, 1914.625683, 1983.656482, 2058.358854, 2138.511506, 2223.886911, 2314.251955, 2409.368599, 2508.994554, 2612.883966, 2720.788114, 2832.456117, 2947.635642, 3066.07363, 3187.51701, 3311.713425, 3438.411955, 3567.363842, 3698.3232, 3831.047736, 3965.299451, 4100.845336, 4237.458059, 4374.916635, 4513.007089, 4651.523091, 4790.266585, 4929.048389, 5067.688781, 5206.018053, 5343.877046, 5481.117659, 5617.603326, 5753.209464, 5887.823892, 6021.347215, 6153.693177, 6284.788973, 6414.575529, 6543.007743, 6670.05469, 6795.699777, 6919.940873, 7042.790382, 7164.275283, 7284.437121, 7403.331964, 7521.030302, 7637.616911, 7753.190672, 7867.86434, 7981.764271, 8095.030106, 8207.814404, 8320.282239, 8432.610744, 8544.988618, 8657.615583, 8770.70181, 8884.467289, 8999.14117, 9114.961058, 9232.172271, 9351.027064, 9471.783812, 9594.706162, 9720.062152, 9848.1233, 9979.16366, 10113.45885, 10251.28508, 10392.9181, 10538.63219, 10688.69908, 10843.38692, 11002.95913, 11167.67338, 11337.7804, 11513.52294, 11695.13462, 11882.83881, 12076.84753, 12277.36037, 12484.56331, 12698.62773, 12919.70927, 13147.9468, 13383.46138, 13626.35526, 13876.71088, 14134.58993, 14400.0324, 14673.05573, 14953.65397, 15241.79691, 15537.4294, 15840.4706, 16150.81333, 16468.32345, 16792.83933, 17124.17136, 17462.1015, 17806.38295, 18156.73984, 18512.86699, 18874.4298, 19241.06411, 19612.37626, 19987.94311, 20367.31226, 20750.0022, 21135.50274, 21523.27532, 21912.75355, 22303.34378, 22694.42579, 23085.3535, 23475.45586, 23864.03778, 24250.38112, 24633.74586, 25013.37129, 25388.4773, 25758.26578, 26121.92209, 26478.61664, 26827.50653, 27167.7373, 27498.44476, 27818.75688, 28127.79581, 28424.67992, 28708.52598, 28978.45132, 29233.57622, 29473.02619, 29695.93443, 29901.44432, 30088.71201, 30256.90895, 30405.22463, 30532.86926, 30639.07653, 30723.10638, 30784.24788, 30821.82207, 30835.18486, 30823.72992, 30786.89164, 30724.14807, 30635.02385, 30519.09317, 30375.98275, 30205.37472, 30007.00958, 29780.68911, 29526.2792, 29243.71277, 28932.99249, 28594.19361, 28227.4666, 27833.0399, 27411.22242, 26962.40611, 26487.0684, 25985.7746, 25459.18011, 24908.03269, 24333.17452, 23735.54416, 23116.1785, 22476.21446, 21816.89069, 21139.54903, 20445.63595, 19736.70378, 19014.41182, 18280.52731, 17536.92622, 16785.59396, 16028.62581, 15268.22732, 14506.71442, 13746.51345, 12990.16096, 12240.30337, 11499.6964, 10771.20438, 10057.79932, 9362.559789, 8688.669662, 8039.416612, 7418.190437, 6828.481186, 6273.877092, 5758.0623, 5284.814412, 4858.001821, 4481.580859, 4159.592747, 3896.160348, 3695.484732, 3561.841544, 3499.57719, 3513.10483, 3606.900193, 3785.497207, 4053.483451, 4415.495441, 4876.213739, 5440.357896, 6112.681245, 6897.965524, 7801.015366, 8826.652627, 9979.710591, 11265.02803, 12687.44317, 14251.78746, 15962.87934, 17825.51783, 19844.47602, 22024.49452, 24370.27481, 26886.47245, 29577.69038, 32448.472, 35503.2943, 38746.56095, 42182.5953, 45815.63346, 49649.8173, 53689.18745, 57937.67636, 62399.10133, 67077.15765, 71975.41166, 77097.29398, 82446.09276, 88024.94696, 93836.83978, 99884.59218, 106170.8564, 112698.1098, 119468.6486, 126484.5818, 133747.8256, 141260.0972, 149022.9096, 157037.5663, 165305.1555, 173826.5459, 182602.3814, 191633.0763, 200918.8117, 210459.5305, 220254.934, 230304.4782, 240607.3703, 251162.5652, 261968.7635, 273024.408, 284327.6819, 295876.5064, 307668.5394, 319701.1736, 331971.5358, 344476.4855, 357212.6151, 370176.249, 383363.4441, 396769.9902, 410391.4107, 424222.9638, 438259.6438, 452496.1828, 466927.053, 481546.4689, 496348.3903, 511326.5252, 526474.3332, 541785.0293, 557251.5881, 572866.7479, 588623.0157, 604512.672, 620527.7766, 636660.1735, 652901.4976, 669243.1807, 685676.4578, 702192.3744, 718781.7934, 735435.4025, 752143.7219, 768897.1123, 785685.783, 802499.8003, 819329.0964, 836163.4781, 852992.6356, 869806.1525, 886593.5149, 903344.1208, 920047.2906, 936692.2766, 953268.2734, 969764.4281, 986169.8508, 1002473.625, 1018664.819, 1034732.494, 1050665.719, 1066453.579, 1082085.186, 1097549.691, 1112836.292, 1127934.25, 1142832.897, 1157521.645, 1171990, 1186227.574, 1200224.091, 1213969.4, 1227453.488, 1240666.489, 1253598.69, 1266240.549, 1278582.7, 1290615.963, 1302331.357, 1313720.106, 1324773.652, 1335483.658, 1345842.027, 1355840.9, 1365472.672, 1374729.997, 1383605.797, 1392093.268, 1400185.891, 1407877.436, 1415161.968, 1422033.858, 1428487.785, 1434518.743, 1440122.048, 1445293.339, 1450028.591, 1454324.109, 1458176.539, 1461582.872, 1464540.442, 1467046.934, 1469100.386, 1470699.187, 1471842.085, 1472528.182, 1472756.941, 1472756.941, 1472528.182, 1471842.085, 1470699.187, 1469100.386, 1467046.934, 1464540.442, 1461582.872, 1458176.539, 1454324.109, 1450028.591, 1445293.339, 1440122.048, 1434518.743, 1428487.785, 1422033.858, 1415161.968, 1407877.436, 1400185.891, 1392093.268, 1383605.797, 1374729.997, 1365472.672, 1355840.9, 1345842.027, 1335483.658, 1324773.652, 1313720.106, 1302331.357, 1290615.963, 1278582.7, 1266240.549, 1253598.69, 1240666.489, 1227453.488, 1213969.4, 1200224.091, 1186227.574, 1171990, 1157521.645, 1142832.897, 1127934.25, 1112836.292, 1097549.691, 1082085.186, 1066453.579, 1050665.719, 1034732.494, 1018664.819, 1002473.625, 986169.8508, 969764.4281, 953268.2734, 936692.2766, 920047.2906, 903344.1208, 886593.5149, 869806.1525, 852992.6356, 836163.4781, 819329.0964, 802499.8003, 785685.783, 768897.1123, 752143.7219, 735435.4025, 718781.7934, 702192.3744, 685676.4578, 669243.1807, 652901.4976, 636660.1735, 620527.7766, 604512.672, 588623.0157, 572866.7479, 557251.5881, 541785.0293, 526474.3332, 511326.5252, 496348.3903, 481546.4689, 466927.053, 452496.1828, 438259.6438, 424222.9638, 410391.4107, 396769.9902, 383363.4441, 370176.249, 357212.6151, 344476.4855, 331971.5358, 319701.1736, 307668.5394, 295876.5064, 284327.6819, 273024.408, 261968.7635, 251162.5652, 240607.3703, 230304.4782, 220254.934, 210459.5305, 200918.8117, 191633.0763, 182602.3814, 173826.5459, 165305.1555, 157037.5663, 149022.9096, 141260.0972, 133747.8256, 126484.5818, 119468.6486, 112698.1098, 106170.8564, 99884.59218, 93836.83978, 88024.94696, 82446.09276, 77097.29398, 71975.41166, 67077.15765, 62399.10133, 57937.67636, 53689.18745, 49649.8173, 45815.63346, 42182.5953, 38746.56095, 35503.2943, 32448.472, 29577.69038, 26886.47245, 24370.27481, 22024.49452, 19844.47602, 17825.51783, 15962.87934, 14251.78746, 12687.44317, 11265.02803, 9979.710591, 8826.652627, 7801.015366, 6897.965524, 6112.681245, 5440.357896, 4876.213739, 4415.495441, 4053.483451, 3785.497207, 3606.900193, 3513.10483, 3499.57719, 3561.841544, 3695.484732, 3896.160348, 4159.592747, 4481.580859, 4858.001821, 5284.814412, 5758.0623, 6273.877092, 6828.481186, 7418.190437, 8039.416612, 8688.669662, 9362.559789, 10057.79932, 10771.20438, 11499.6964, 12240.30337, 12990.16096, 13746.51345, 14506.71442, 15268.22732, 16028.62581, 16785.59396, 17536.92622, 18280.52731, 19014.41182, 19736.70378, 20445.63595, 21139.54903, 21816.89069, 22476.21446, 23116.1785, 23735.54416, 24333.17452, 24908.03269, 25459.18011, 25985.7746, 26487.0684, 26962.40611, 27411.22242, 27833.0399, 28227.4666, 28594.19361, 28932.99249, 29243.71277, 29526.2792, 29780.68911, 30007.00958, 30205.37472, 30375.98275, 30519.09317, 30635.02385, 30724.14807, 30786.89164, 30823.72992, 30835.18486, 30821.82207, 30784.24788, 30723.10638, 30639.07653, 30532.86926, 30405.22463, 30256.90895, 30088.71201, 29901.44432, 29695.93443, 29473.02619, 29233.57622, 28978.45132, 28708.52598, 28424.67992, 28127.79581, 27818.75688, 27498.44476, 27167.7373, 26827.50653, 26478.61664, 26121.92209, 25758.26578, 25388.4773, 25013.37129, 24633.74586, 24250.38112, 23864.03778, 23475.45586, 23085.3535, 22694.42579, 22303.34378, 21912.75355, 21523.27532, 21135.50274, 20750.0022, 20367.31226, 19987.94311, 19612.37626, 19241.06411, 18874.4298, 18512.86699, 18156.73984, 17806.38295, 17462.1015, 17124.17136, 16792.83933, 16468.32345, 16150.81333, 15840.4706, 15537.4294, 15241.79691, 14953.65397, 14673.05573, 14400.0324, 14134.58993, 13876.71088, 13626.35526, 13383.46138, 13147.9468, 12919.70927, 12698.62773, 12484.56331, 12277.36037, 12076.84753, 11882.83881, 11695.13462, 11513.52294, 11337.7804, 11167.67338, 11002.95913, 10843.38692, 10688.69908, 10538.63219, 10392.9181, 10251.28508, 10113.45885, 9979.16366, 9848.1233, 9720.062152, 9594.706162, 9471.783812, 9351.027064, 9232.172271, 9114.961058, 8999.14117, 8884.467289, 8770.70181, 8657.615583, 8544.988618, 8432.610744, 8320.282239, 8207.814404, 8095.030106, 7981.764271, 7867.86434, 7753.190672, 7637.616911, 7521.030302, 7403.331964, 7284.437121, 7164.275283, 7042.790382, 6919.940873, 6795.699777, 6670.05469, 6543.007743, 6414.575529, 6284.788973, 6153.693177, 6021.347215, 5887.823892, 5753.209464, 5617.603326, 5481.117659, 5343.877046, 5206.018053, 5067.688781, 4929.048389, 4790.266585, 4651.523091, 4513.007089, 4374.916635, 4237.458059, 4100.845336, 3965.299451, 3831.047736, 3698.3232, 3567.363842, 3438.411955, 3311.713425, 3187.51701, 3066.07363, 2947.635642, 2832.456117, 2720.788114, 2612.883966, 2508.994554, 2409.368599, 2314.251955, 2223.886911, 2138.511506, 2058.358854, 1983.656482, 1914.625683, 1851.480886, 1794.429046, 1743.669046, 1699.39113, 1661.776346, 1630.996023, 1607.211262, 1590.572459, 1581.218851, 1579.278089, 1584.865839, 1598.085413, 1619.027424, 1647.769478, 1684.37589, 1728.897436, 1781.371132, 1841.820048, 1910.253149, 1986.665175, 2071.036547, 2163.333308, 2263.507098, 2371.495153, 2487.220349, 2610.591263, 2741.502281, 2879.833719, 3025.451991, 3178.209801, 3337.946356, 3504.487623, 3677.646606, 3857.223647, 4043.00676, 4234.771991, 4432.283797, 4635.295454, 4843.549487, 5056.778122, 5274.703756, 5497.039451, 5723.489446, 5953.749683, 6187.508355, 6424.446462, 6664.238388, 6906.552486, 7151.051676, 7397.394052, 7645.2335, 7894.220322, 8144.001862, 8394.223147, 8644.52752, 8894.557283, 9143.954338, 9392.360826, 9639.419769, 9884.7757, 10128.0753, 10368.96803, 10607.10673, 10842.14824, 11073.75402, 11301.59072, 11525.33075, 11744.65289, 11959.24279, 12168.79356, 12373.00625, 12571.5904, 12764.26448, 12950.7564, 13130.80397, 13304.15527, 13470.56915, 13629.81555, 13781.67589, 13925.94342, 14062.42357, 14190.93419, 14311.30585, 14423.38214, 14527.01982, 14622.08906, 14708.47362, 14786.07099, 14854.79251, 14914.56349, 14965.32327, 15007.02527, 15039.637, 15063.14009, 15077.53024, 15082.81718, 15079.02456, 15066.18989, 15044.36441, 15013.61292, 14974.01361, 14925.65789, 14868.65013, 14803.10748, 14729.15955, 14646.94818, 14556.62712, 14458.36168, 14352.32846, 14238.71494, 14117.71913, 13989.5492, 13854.42303, 13712.56784, 13564.21976, 13409.62334, 13249.03115, 13082.7033, 12910.90694, 12733.91581, 12552.00975, 12365.47416, 12174.59957, 11979.68105, 11781.01775, 11578.91239, 11373.67069, 11165.60092, 10955.01332, 10742.21962, 10527.53253, 10311.26518, 10093.73064, 9875.241444, 9656.109019, 9436.643249, 9217.151959, 8997.940443, 8779.310989, 8561.562416, 8344.989624, 8129.883145, 7916.528718, 7705.206867, 7496.192493, 7289.75448, 7086.155318, 6885.650733, 6688.489337, 6494.912294, 6305.152996, 6119.43676, 5937.98054, 5760.992654, 5588.672531, 5421.21047, 5258.787427, 5101.574803, 4949.734269, 4803.417592, 4662.766491, 4527.912503, 4398.976874, 4276.070461, 4159.293659, 4048.736342, 3944.477821, 3846.586821, 3755.121479, 3670.129354, 3591.647458, 3519.7023, 3454.30995, 3395.476123, 3343.196267, 3297.455678, 3258.229628, 3225.483503, 3199.172963, 3179.244107, 3165.63366, 3158.269169, 3157.069212, 3161.94362, 3172.793709, 3189.512526, 3211.985102, 3240.088718, 3273.693178, 3312.661094, 3356.848173, 3406.103524, 3460.269953, 3519.184288, 3582.677686, 3650.575964, 3722.699927, 3798.865698, 3878.885053, 3962.565766, 4049.711944, 4140.124375, 4233.600869, 4329.936603, 4428.924469, 4530.355414, 4634.018787, 4739.702678, 4847.194259, 4956.28012, 5066.746603, 5178.380131, 5290.967536, 5404.296379, 5518.155264, 5632.334153, 5746.624666, 5860.820385, 5974.71714, 6088.113298, 6200.810039, 6312.611625, 6423.325662, 6532.763354, 6640.739747, 6747.073963, 6851.589433, 6954.114105, 7054.48066, 7152.526706, 7248.094967, 7341.033462, 7431.195673, 7518.4407, 7602.633414, 7683.644589, 7761.351031, 7835.635696, 7906.387789, 7973.502867, 8036.882919, 8096.43644, 8152.078495, 8203.730775, 8251.321636, 8294.786132, 8334.066042, 8369.109875, 8399.872881, 8426.317037, 8448.411035, 8466.130251, 8479.456717, 8488.37907, 8492.892501, 8492.998695, 8488.705757, 8480.028139, 8466.986547, 8449.607853, 8427.92499, 8401.976841, 8371.808132, 8337.469297, 8299.016362, 8256.510799, 8210.019391, 8159.614086, 8105.371842, 8047.37447, 7985.708476, 7920.464891, 7851.739105, 7779.630686, 7704.243209, 7625.684073, 7544.064314, 7459.49842, 7372.104144, 7282.00231, 7189.316617, 7094.173451, 6996.70168, 6897.032466, 6795.299056, 6691.636594, 6586.181913, 6479.07334, 6370.450498, 6260.454103, 6149.225772, 6036.90782, 5923.643068, 5809.574649, 5694.845812, 5579.599734, 5463.979329, 5348.127061, 5232.184761, 5116.293446, 5000.593137, 4885.222683, 4770.319594, 4656.01986, 4542.457798, 4429.765878, 4318.07457, 4207.51219, 4098.204744, 3990.275784, 3883.846266, 3779.034412, 3675.955572, 3574.722102, 3475.443233, 3378.224954, 3283.169897, 3190.37723, 3099.942544, 3011.957764, 2926.511045, 2843.68669, 2763.56506, 2686.222499, 2611.731258, 2540.159431, 2471.570887, 2406.025217, 2343.577681, 2284.279161, 2228.176123, 2175.310578, 2125.720055, 2079.437578, 2036.491643, 1996.906211, 1960.700695, 1927.889961, 1898.48433, 1872.489588, 1849.906999, 1830.733325, 1814.96085, 1802.577413, 1793.566439, 1787.906982, 1785.57377, 1786.537257, 1790.763675, 1798.215098, 1808.849505, 1822.620852, 1839.479143, 1859.370514, 1882.237314, 1908.018193, 1936.648193, 1968.058849, 2002.178285, 2038.931321, 2078.239581, 2120.021604, 2164.19296, 2210.666372, 2259.351833, 2310.156738, 2362.986006, 2417.742219, 2474.32575, 2532.634904, 2592.566056, 2654.013792, 2716.871056, 2781.029293, 2846.378598, 2912.807865, 2980.204939, 3048.456766, 3117.44955, 3187.068903, 3257.200004, 3327.727752, 3398.536922, 3469.512323, 3540.538954, 3611.502158, 3682.287779, 3752.782319, 3822.873088, 3892.448363, 3961.397534, 4029.61126],
-                    [11671.71466, 11490.02408, 11330.66853, 11194.89784, 11083.82769, 10998.4327, 10939.54022, 10907.82508, 10903.80508, 10927.83745, 10980.11624, 11060.67058, 11169.36393, 11305.89426, 11469.79518, 11660.43798, 11877.03469, 12118.64198, 12384.16596, 12672.36792, 12981.87086, 13311.16682, 13658.62509, 14022.50098, 14400.94547, 14792.01535, 15193.684, 15603.85272, 16020.36248, 16441.00612, 16863.54088, 17285.70117, 17705.21159, 18119.80006, 18527.21106, 18925.21877, 19311.64023, 19684.34829, 20041.28434, 20380.47076, 20700.02299, 20998.16117, 21273.22124, 21523.66554, 21748.0927, 21945.24687, 22114.02618, 22253.49043, 22362.86788, 22441.56113, 22489.1521, 22505.40598, 22490.27417, 22443.89622, 22366.60063, 22258.90463, 22121.51283, 21955.3148, 21761.38149, 21540.96069, 21295.47124, 21026.49634, 20735.77574, 20425.19695, 20096.78553, 19752.6944, 19395.19232, 19026.65159, 18649.53495, 18266.38183, 17879.79399, 17492.4206, 17106.94294, 16726.05864, 16352.46572, 15988.84639, 15637.85079, 15302.0807, 14984.07341, 14686.28571, 14411.0782, 14160.70005, 13937.27418, 13742.78305, 13579.05517, 13447.7523, 13350.3576, 13288.16465, 13262.26757, 13273.55217, 13322.68829, 13410.12339, 13536.07741, 13700.53895, 13903.26286, 14143.76922, 14421.34374, 14735.03963, 15083.68092, 15465.86727, 15879.98014, 16324.19045, 16796.46763, 17294.59001, 17816.1565, 18358.59956, 18919.19927, 19495.09863, 20083.31976, 20680.78109, 21284.31539, 21890.68851, 22496.6187, 23098.79653, 23693.90507, 24278.64037, 24849.73213, 25403.96422, 25938.19518, 26449.37839, 26934.58184, 27391.00734, 27816.00911, 28207.11148, 28562.0258, 28878.66615, 29155.16402, 29389.88168, 29581.42415, 29728.64981, 29830.67937, 29886.90334, 29896.98771, 29860.87798, 29778.80145, 29651.26762, 29479.06687, 29263.26726, 29005.20955, 28706.50042, 28369.00392, 27994.83122, 27586.32867, 27146.0643, 26676.81275, 26181.53885, 25663.37981, 25125.62622, 24571.70193, 24005.14303, 23429.57588, 22848.69458, 22266.23775, 21685.96509, 21111.6335, 20546.9733, 19995.66444, 19461.31293, 18947.42771, 18457.39809, 17994.47185, 17561.73419, 17162.08775, 16798.23367, 16472.65403, 16187.59555, 15945.05492, 15746.76561, 15594.18649, 15488.49212, 15430.56494, 15420.98938, 15460.04779, 15547.71848, 15683.67563, 15867.29122, 16097.63894, 16373.49999, 16693.37079, 17055.47261, 17457.76283, 17897.948, 18373.49849, 18881.66459, 19419.49408, 19983.85097, 20571.43546, 21178.80483, 21802.39523, 22438.54416, 23083.51345, 23733.51272, 24384.72298, 25033.32032, 25675.49959, 26307.49767, 26925.6165, 27526.24544, 28105.88298, 28661.15758, 29188.84755, 29685.89981, 30149.44746, 30576.82598, 30965.58803, 31313.51681, 31618.63768, 31879.22834, 32093.82716, 32261.23989, 32380.54457, 32451.0947, 32472.52069, 32444.72952, 32367.90273, 32242.49273, 32069.21754, 31849.05385, 31583.22878, 31273.2101, 30920.69518, 30527.59881, 30096.03977, 29628.32657, 29126.94217, 28594.5281, 28033.86777, 27447.86947, 26839.5488, 26212.01101, 25568.4331, 24912.04598, 24246.11666, 23573.93075, 22898.77526, 22223.92176, 21552.61024, 20888.03336, 20233.32163, 19591.52918, 18965.62045, 18358.45778, 17772.78983, 17211.24113, 16676.30246, 16170.32232, 15695.49943, 15253.87621, 14847.33327, 14477.58487, 14146.17538, 13854.47665, 13603.68623, 13394.8265, 13228.7445, 13106.11262, 13027.42984, 12993.02368, 13003.05267, 13057.50933, 13156.22357, 13298.86649, 13484.95445, 13713.85346, 13984.78368, 14296.82421, 14648.91782, 15039.87592, 15468.38341, 15933.00367, 16432.18342, 16964.25762, 17527.45433, 18119.89942, 18739.62141, 19384.55611, 20052.55136, 20741.37172, 21448.70318, 22172.15796, 22909.27941, 23657.54704, 24414.38169, 25177.15094, 25943.17485, 26709.73189, 27474.06529, 28233.38979, 28984.89878, 29725.77193, 30453.18332, 31164.31009, 31856.34163, 32526.48929, 33171.99676, 33790.15088, 34378.29305, 34933.8312, 35454.25221, 35937.13478, 36380.16275, 36781.13872, 37137.99796, 37448.82253, 37711.85547, 37925.51503, 38088.40882, 38199.34766, 38257.35921, 38261.70106, 38211.87328, 38107.63022, 37948.99145, 37736.25173, 37469.98984, 37151.0761, 36780.67853, 36360.2675, 35891.6187, 35376.81433, 34818.24249, 34218.59455, 33580.86053, 32908.32234, 32204.5449, 31473.36502, 30718.8781, 29945.42261, 29157.56239, 28360.0667, 27557.88829, 26756.13933, 25960.06546, 25175.01799, 24406.42441, 23659.75735, 22940.50223, 22254.12366, 21606.03093, 21001.54267, 20445.8511, 19943.98588, 19500.77812, 19120.82444, 18808.45171, 18567.68254, 18402.20184, 18315.32478, 18309.96629, 18388.61264, 18553.29503, 18805.56568, 19146.4766, 19576.56125, 20095.81929, 20703.70465, 21399.11706, 22180.39721, 23045.32568, 23991.12562, 25014.46943, 26111.48933, 27277.79188, 28508.47647, 29798.15761, 31140.99107, 32530.70367, 33960.62652, 35423.73173, 36912.67206, 38419.82366, 39937.33124, 41457.15567, 42971.12353, 44470.97839, 45948.4333, 47395.22432, 48803.1645, 50164.19805, 51470.45429, 52714.30082, 53888.39572, 54985.73821, 55999.71739, 56924.15873, 57753.36791, 58482.17157, 59105.95474, 59620.69458, 60022.99006, 60310.08746, 60479.90138, 60531.03102, 60462.7716, 60275.12089, 59968.78058, 59545.15259, 59006.33026, 58355.08446, 57594.84472, 56729.6755, 55764.24775, 54703.80592, 53554.13087, 52321.49862, 51012.63563, 49634.67066, 48195.0838, 46701.65296, 45162.3983, 43585.52507, 41979.36529, 40352.31879, 38712.79409, 37069.1496, 35429.63569, 33802.33807, 32195.12294, 30615.5845, 29070.99508, 27568.25858, 26113.86729, 24713.86279, 23373.80103, 22098.72202, 20893.12433, 19760.9446, 18705.54236, 17729.69006, 16835.56856, 16024.76806, 15298.29439, 14656.58064, 14099.50391, 13626.40712, 13236.12556, 12927.01787, 12697.00124, 12543.59036, 12463.93972, 12454.88888, 12513.01017, 12634.65834, 12816.02165, 13053.1738, 13342.12618, 13678.87994, 14059.47713, 14480.05056, 14936.87166, 15426.39591, 15945.30521, 16490.54687, 17059.36852, 17649.34876, 18258.423, 18884.90417, 19527.49817, 20185.31356, 20857.86555, 21545.0741, 22247.25598, 22965.11095, 23699.70207, 24452.43022, 25225.00316, 26019.39929, 26837.82649, 27682.67648, 28556.47502, 29461.82861, 30401.36811, 31377.68998, 32393.29574, 33450.53031, 34551.51997, 35698.11062, 36891.80716, 38133.71466, 39424.4821, 40764.24938, 42152.59851, 43588.50933, 45070.32084, 46595.69849, 48161.60811, 49764.29703, 51399.28287, 53061.35042, 54744.55684, 56442.2456, 58147.06931, 59851.02136, 61545.47666, 63221.24113, 64868.60995, 66477.43417, 68037.19538, 69537.08799, 70966.10844, 72313.15094, 73567.1087, 74716.98018, 75751.97913, 76661.64783, 77435.97218, 78065.49786, 78541.44619, 78855.82883, 79001.55989, 78972.56442, 78763.88205, 78371.76462, 77793.76658, 77028.82713, 76077.34289, 74941.23019, 73623.97592, 72130.67607, 70468.06121, 68644.50806, 66670.03676, 64556.29313, 62316.51568, 59965.48714, 57519.47035, 54996.12858, 52414.43046, 49794.5399, 47157.69144, 44526.05156, 41922.56702, 39370.8008, 36894.75698, 34518.6956, 32266.93888, 30163.6703, 28232.72796, 26497.39407, 24980.18205, 23702.62341, 22685.05593, 21946.41529, 21504.03205, 21373.43594, 21568.16935, 22099.6121, 22976.81927, 24206.37396, 25792.25676, 27735.73362, 30035.26356, 32686.42778, 35681.88143, 39011.32903, 42661.52467, 46616.29758, 50856.60374, 55360.60382, 60103.7675, 65059.00426, 70196.82002, 75485.49927, 80891.3118, 86378.74287, 91910.74563, 97449.01429, 102954.276, 108386.6, 113705.7211, 118871.3756, 123843.6476, 128583.3212, 133052.2381, 137213.6555, 141032.6025, 144476.2314, 147514.1606, 150118.8059, 152265.6969, 153933.7759, 155105.6747, 155767.9679, 155911.3986, 155531.074, 154626.6284, 153202.3512, 151267.2769, 148835.2368, 145924.8687, 142559.5848, 138767.4961, 134581.2922, 130038.0773, 125179.161, 120049.8057, 114698.9299, 109178.7702, 103544.5022, 97853.82333, 92166.49926, 86543.8771, 81048.36852, 75742.90619, 70690.37755, 65953.04003, 61591.9223, 57666.21635, 54232.66545, 51344.95315, 49053.09896, 47402.86614, 46435.18729, 46185.61362, 46683.79349, 47952.98609, 50009.61586, 52862.87315, 56514.36656, 60957.83211, 66178.90394, 72154.95144, 78854.98665, 86239.64603, 94261.24982, 102863.9418, 111983.9122, 121549.7047, 131482.6099, 141697.1448, 152101.6191, 162598.7867, 173086.5815, 183458.9361, 193606.6793, 203418.5095, 212782.0406, 221584.9139, 229715.9723, 237066.489, 243531.4456, 249010.8503, 253411.0895, 256646.3048, 258639.7842, 259325.3609, 258648.8079, 256569.2193, 253060.3674, 248112.0258, 241731.247, 233943.5841, 224794.2465, 214349.1779, 202696.0474, 189945.1416, 176230.1509, 161708.837, 146563.5751, 131001.7617, 115256.0791, 99584.61116, 84270.80272, 69623.25717, 55975.36787, 43684.77937, 33132.67554, 24722.89284, 18880.85804, 16052.3505, 16702.09076, 21312.15758, 30380.23753, 44417.71166, 63947.5854, 89502.26875, 121621.2149, 160848.4267, 207729.8412, 262810.6039, 326632.2442, 399729.7666, 482628.6705, 575841.9142, 679866.8377, 795182.0617, 922244.3786, 1061485.653, 1213309.747, 1378089.494, 1556163.732, 1747834.415, 1953363.826, 2172971.905, 2406833.708, 2655077.014, 2917780.104, 3194969.716, 3486619.201, 3792646.885, 4112914.658, 4447226.806, 4795329.078, 5156908.021, 5531590.577, 5918943.958, 6318475.793, 6729634.572, 7151810.362, 7584335.829, 8026487.533, 8477487.524, 8936505.216, 9402659.536, 9875021.357, 10352616.19, 10834427.12, 11319398.02, 11806436.95, 12294419.84, 12782194.28, 13268583.6, 13752391.03, 14232404.12, 14707399.13, 15176145.69, 15637411.47, 16089966.89, 16532589.95, 16964071.02, 17383217.68, 17788859.43, 18179852.51, 18555084.49, 18913478.87, 19253999.5, 19575654.91, 19877502.4, 20158652.05, 20418270.41, 20655584.08, 20869882.94, 21060523.21, 21226930.18, 21368600.67, 21485105.19, 21576089.81, 21641277.63, 21680470.01, 21693547.44, 21693547.44, 21680470.01, 21641277.63, 21576089.81, 21485105.19, 21368600.67, 21226930.18, 21060523.21, 20869882.94, 20655584.08, 20418270.41, 20158652.05, 19877502.4, 19575654.91, 19253999.5, 18913478.87, 18555084.49, 18179852.51, 17788859.43, 17383217.68, 16964071.02, 16532589.95, 16089966.89, 15637411.47, 15176145.69, 14707399.13, 14232404.12, 13752391.03, 13268583.6, 12782194.28, 12294419.84, 11806436.95, 11319398.02, 10834427.12, 10352616.19, 9875021.357, 9402659.536, 8936505.216, 8477487.524, 8026487.533, 7584335.829, 7151810.362, 6729634.572, 6318475.793, 5918943.958, 5531590.577, 5156908.021, 4795329.078, 4447226.806, 4112914.658, 3792646.885, 3486619.201, 3194969.716, 2917780.104, 2655077.014, 2406833.708, 2172971.905, 1953363.826, 1747834.415, 1556163.732, 1378089.494, 1213309.747, 1061485.653, 922244.3786, 795182.0617, 679866.8377, 575841.9142, 482628.6705, 399729.7666, 326632.2442, 262810.6039, 207729.8412, 160848.4267, 121621.2149, 89502.26875, 63947.5854, 44417.71166, 30380.23753, 21312.15758, 16702.09076, 16052.3505, 18880.85804, 24722.89284, 33132.67554, 43684.77937, 55975.36787, 69623.25717, 84270.80272, 99584.61116, 115256.0791, 131001.7617, 146563.5751, 161708.837, 176230.1509, 189945.1416, 202696.0474, 214349.1779, 224794.2465, 233943.5841, 241731.247, 248112.0258, 253060.3674, 256569.2193, 258648.8079, 259325.3609, 258639.7842, 256646.3048, 253411.0895, 249010.8503, 243531.4456, 237066.489, 229715.9723, 221584.9139, 212782.0406, 203418.5095, 193606.6793, 183458.9361, 173086.5815, 162598.7867, 152101.6191, 141697.1448, 131482.6099, 121549.7047, 111983.9122, 102863.9418, 94261.24982, 86239.64603, 78854.98665, 72154.95144, 66178.90394, 60957.83211, 56514.36656, 52862.87315, 50009.61586, 47952.98609, 46683.79349, 46185.61362, 46435.18729, 47402.86614, 49053.09896, 51344.95315, 54232.66545, 57666.21635, 61591.9223, 65953.04003, 70690.37755, 75742.90619, 81048.36852, 86543.8771, 92166.49926, 97853.82333, 103544.5022, 109178.7702, 114698.9299, 120049.8057, 125179.161, 130038.0773, 134581.2922, 138767.4961, 142559.5848, 145924.8687, 148835.2368, 151267.2769, 153202.3512, 154626.6284, 155531.074, 155911.3986, 155767.9679, 155105.6747, 153933.7759, 152265.6969, 150118.8059, 147514.1606, 144476.2314, 141032.6025, 137213.6555, 133052.2381, 128583.3212, 123843.6476, 118871.3756, 113705.7211, 108386.6, 102954.276, 97449.01429, 91910.74563, 86378.74287, 80891.3118, 75485.49927, 70196.82002, 65059.00426, 60103.7675, 55360.60382, 50856.60374, 46616.29758, 42661.52467, 39011.32903, 35681.88143, 32686.42778, 30035.26356, 27735.73362, 25792.25676, 24206.37396, 22976.81927, 22099.6121, 21568.16935, 21373.43594, 21504.03205, 21946.41529, 22685.05593, 23702.62341, 24980.18205, 26497.39407, 28232.72796, 30163.6703, 32266.93888, 34518.6956, 36894.75698, 39370.8008, 41922.56702, 44526.05156, 47157.69144, 49794.5399, 52414.43046, 54996.12858, 57519.47035, 59965.48714, 62316.51568, 64556.29313, 66670.03676, 68644.50806, 70468.06121, 72130.67607, 73623.97592, 74941.23019, 76077.34289, 77028.82713, 77793.76658, 78371.76462, 78763.88205, 78972.56442, 79001.55989, 78855.82883, 78541.44619, 78065.49786, 77435.97218, 76661.64783, 75751.97913, 74716.98018, 73567.1087, 72313.15094, 70966.10844, 69537.08799, 68037.19538, 66477.43417, 64868.60995, 63221.24113, 61545.47666, 59851.02136, 58147.06931, 56442.2456, 54744.55684, 53061.35042, 51399.28287, 49764.29703, 48161.60811, 46595.69849, 45070.32084, 43588.50933, 42152.59851, 40764.24938, 39424.4821, 38133.71466, 36891.80716, 35698.11062, 34551.51997, 33450.53031, 32393.29574, 31377.68998, 30401.36811, 29461.82861, 28556.47502, 27682.67648, 26837.82649, 26019.39929, 25225.00316, 24452.43022, 23699.70207, 22965.11095, 22247.25598, 21545.0741, 20857.86555, 20185.31356, 19527.49817, 18884.90417, 18258.423, 17649.34876, 17059.36852, 16490.54687, 15945.30521, 15426.39591, 14936.87166, 14480.05056, 14059.47713, 13678.87994, 13342.12618, 13053.1738, 12816.02165, 12634.65834, 12513.01017, 12454.88888, 12463.93972, 12543.59036, 12697.00124, 12927.01787, 13236.12556, 13626.40712, 14099.50391, 14656.58064, 15298.29439, 16024.76806, 16835.56856, 17729.69006, 18705.54236, 19760.9446, 20893.12433, 22098.72202, 23373.80103, 24713.86279, 26113.86729, 27568.25858, 29070.99508, 30615.5845, 32195.12294, 33802.33807, 35429.63569, 37069.1496, 38712.79409, 40352.31879, 41979.36529, 43585.52507, 45162.3983, 46701.65296, 48195.0838, 49634.67066, 51012.63563, 52321.49862, 53554.13087, 54703.80592, 55764.24775, 56729.6755, 57594.84472, 58355.08446, 59006.33026, 59545.15259, 59968.78058, 60275.12089, 60462.7716, 60531.03102, 60479.90138, 60310.08746, 60022.99006, 59620.69458, 59105.95474, 58482.17157, 57753.36791, 56924.15873, 55999.71739, 54985.73821, 53888.39572, 52714.30082, 51470.45429, 50164.19805, 48803.1645, 47395.22432, 45948.4333, 44470.97839, 42971.12353, 41457.15567, 39937.33124, 38419.82366, 36912.67206, 35423.73173, 33960.62652, 32530.70367, 31140.99107, 29798.15761, 28508.47647, 27277.79188, 26111.48933, 25014.46943, 23991.12562, 23045.32568, 22180.39721, 21399.11706, 20703.70465, 20095.81929, 19576.56125, 19146.4766, 18805.56568, 18553.29503, 18388.61264, 18309.96629, 18315.32478, 18402.20184, 18567.68254, 18808.45171, 19120.82444, 19500.77812, 19943.98588, 20445.8511, 21001.54267, 21606.03093, 22254.12366, 22940.50223, 23659.75735, 24406.42441, 25175.01799, 25960.06546, 26756.13933, 27557.88829, 28360.0667, 29157.56239, 29945.42261, 30718.8781, 31473.36502, 32204.5449, 32908.32234, 33580.86053, 34218.59455, 34818.24249, 35376.81433, 35891.6187, 36360.2675, 36780.67853, 37151.0761, 37469.98984, 37736.25173, 37948.99145, 38107.63022, 38211.87328, 38261.70106, 38257.35921, 38199.34766, 38088.40882, 37925.51503, 37711.85547, 37448.82253, 37137.99796, 36781.13872, 36380.16275, 35937.13478, 35454.25221, 34933.8312, 34378.29305, 33790.15088, 33171.99676, 32526.48929, 31856.34163, 31164.31009, 30453.18332, 29725.77193, 28984.89878, 28233.38979, 27474.06529, 26709.73189, 25943.17485, 25177.15094, 24414.38169, 23657.54704, 22909.27941, 22172.15796, 21448.70318, 20741.37172, 20052.55136, 19384.55611, 18739.62141, 18119.89942, 17527.45433, 16964.25762, 16432.18342, 15933.00367, 15468.38341, 15039.87592, 14648.91782, 14296.82421, 13984.78368, 13713.85346, 13484.95445, 13298.86649, 13156.22357, 13057.50933, 13003.05267, 12993.02368, 13027.42984, 13106.11262, 13228.7445, 13394.8265, 13603.68623, 13854.47665, 14146.17538, 14477.58487, 14847.33327, 15253.87621, 15695.49943, 16170.32232, 16676.30246, 17211.24113, 17772.78983, 18358.45778, 18965.62045, 19591.52918, 20233.32163, 20888.03336, 21552.61024, 22223.92176, 22898.77526, 23573.93075, 24246.11666, 24912.04598, 25568.4331, 26212.01101, 26839.5488, 27447.86947, 28033.86777, 28594.5281, 29126.94217, 29628.32657, 30096.03977, 30527.59881, 30920.69518, 31273.2101, 31583.22878, 31849.05385, 32069.21754, 32242.49273, 32367.90273, 32444.72952, 32472.52069, 32451.0947, 32380.54457, 32261.23989, 32093.82716, 31879.22834, 31618.63768, 31313.51681, 30965.58803, 30576.82598, 30149.44746, 29685.89981, 29188.84755, 28661.15758, 28105.88298, 27526.24544, 26925.6165, 26307.49767, 25675.49959, 25033.32032, 24384.72298, 23733.51272, 23083.51345, 22438.54416, 21802.39523, 21178.80483, 20571.43546, 19983.85097, 19419.49408, 18881.66459, 18373.49849, 17897.948, 17457.76283, 17055.47261, 16693.37079, 16373.49999, 16097.63894, 15867.29122, 15683.67563, 15547.71848, 15460.04779, 15420.98938, 15430.56494, 15488.49212, 15594.18649, 15746.76561, 15945.05492, 16187.59555, 16472.65403, 16798.23367, 17162.08775, 17561.73419, 17994.47185, 18457.39809, 18947.42771, 19461.31293, 19995.66444, 20546.9733, 21111.6335, 21685.96509, 22266.23775, 22848.69458, 23429.57588, 24005.14303, 24571.70193, 25125.62622, 25663.37981, 26181.53885, 26676.81275, 27146.0643, 27586.32867, 27994.83122, 28369.00392, 28706.50042, 29005.20955, 29263.26726, 29479.06687, 29651.26762, 29778.80145, 29860.87798, 29896.98771, 29886.90334, 29830.67937, 29728.64981, 29581.42415, 29389.88168, 29155.16402, 28878.66615, 28562.0258, 28207.11148, 27816.00911, 27391.00734, 26934.58184, 26449.37839, 25938.19518, 25403.96422, 24849.73213, 24278.64037, 23693.90507, 23098.79653, 22496.6187, 21890.68851, 21284.31539, 20680.78109, 20083.31976, 19495.09863, 18919.19927, 18358.59956, 17816.1565, 17294.59001, 16796.46763, 16324.19045, 15879.98014, 15465.86727, 15083.68092, 14735.03963, 14421.34374, 14143.76922, 13903.26286, 13700.53895, 13536.07741, 13410.12339, 13322.68829, 13273.55217, 13262.26757, 13288.16465, 13350.3576, 13447.7523, 13579.05517, 13742.78305, 13937.27418, 14160.70005, 14411.0782, 14686.28571, 14984.07341, 15302.0807, 15637.85079, 15988.84639, 16352.46572, 16726.05864, 17106.94294, 17492.4206, 17879.79399, 18266.38183, 18649.53495, 19026.65159, 19395.19232, 19752.6944, 20096.78553, 20425.19695, 20735.77574, 21026.49634, 21295.47124, 21540.96069, 21761.38149, 21955.3148, 22121.51283, 22258.90463, 22366.60063, 22443.89622, 22490.27417, 22505.40598, 22489.1521, 22441.56113, 22362.86788, 22253.49043, 22114.02618, 21945.24687, 21748.0927, 21523.66554, 21273.22124, 20998.16117, 20700.02299, 20380.47076, 20041.28434, 19684.34829, 19311.64023, 18925.21877, 18527.21106, 18119.80006, 17705.21159, 17285.70117, 16863.54088, 16441.00612, 16020.36248, 15603.85272, 15193.684, 14792.01535, 14400.94547, 14022.50098, 13658.62509, 13311.16682, 12981.87086, 12672.36792, 12384.16596, 12118.64198, 11877.03469, 11660.43798, 11469.79518, 11305.89426, 11169.36393, 11060.67058, 10980.11624, 10927.83745, 10903.80508, 10907.82508, 10939.54022, 10998.4327, 11083.82769, 11194.89784, 11330.66853, 11490.02408, 11671.71466]
-                    ]
+    normalized_theoretical_data = normalize_data(theoretical_data)
 
-theoretical_data = [[math.log(element) for element in sub_array] for sub_array in theoretical_data]
-
-normalized_theoretical_data = normalize_data(theoretical_data)
-
-#coherence(normalized_theoretical_data, normalized_sanitised_data)
-#cross_correlation(normalized_theoretical_data, normalized_sanitised_data)
-#dynamic_time_warping(normalized_theoretical_data, normalized_sanitised_data)
-#fourier_transform(normalized_theoretical_data, "fourier_theoretical_results.txt")
-#fourier_transform(normalized_sanitised_data, "fourier_experimental_results.txt")
-#wavelet_transform(normalized_theoretical_data, "wavelet_theoretical_results.txt")
-#wavelet_transform(normalized_sanitised_data, "wavelet_experimental_results.txt")
-#kmeans_clustering(normalized_theoretical_data, normalized_sanitised_data)
-#kolmogorov_smirnov_test(normalized_theoretical_data, normalized_sanitised_data)
-rsquared(normalized_theoretical_data, normalized_sanitised_data)
-#pearsoncalc(normalized_theoretical_data, normalized_sanitised_data)
\ No newline at end of file
+    #coherence(normalized_theoretical_data, normalized_sanitised_data)
+    #cross_correlation(normalized_theoretical_data, normalized_sanitised_data)
+    #dynamic_time_warping(normalized_theoretical_data, normalized_sanitised_data)
+    #fourier_transform(normalized_theoretical_data, "fourier_theoretical_results.txt")
+    #fourier_transform(normalized_sanitised_data, "fourier_experimental_results.txt")
+    #wavelet_transform(normalized_theoretical_data, "wavelet_theoretical_results.npz")
+    #wavelet_transform(normalized_sanitised_data, "wavelet_experimental_results.npz")
+    #kmeans_clustering(normalized_theoretical_data, normalized_sanitised_data)
+    #kolmogorov_smirnov_test(normalized_theoretical_data, normalized_sanitised_data)
+    rsquared(normalized_theoretical_data, normalized_sanitised_data)
+    #pearsoncalc(normalized_theoretical_data, normalized_sanitised_data)
\ No newline at end of file
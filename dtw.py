@@ -0,0 +1,201 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from sample_set import LabelledMatrix, as_sample_set
+
+# DTW with a Sakoe-Chiba band on the squared point difference. Distances are the square root of the cheapest
+# warping path cost, so a band of 0 gives the plain Euclidean distance.
+DEFAULT_BAND_FRACTION = 0.1  # Band width as a fraction of the profile length when none is given
+
+# Best templates of every sample (k x samples) and how many full DTW computations the pruning left
+NearestTemplates = namedtuple("NearestTemplates", ["indices", "distances", "labels", "evaluated"])
+
+
+def default_band(num_points):
+    return max(1, int(round(num_points * DEFAULT_BAND_FRACTION)))
+
+
+def dtw_batch(queries, candidates, band, abandon_above=np.inf):
+    # DTW of queries[b] against candidates[b] for a whole batch at once, one anti-diagonal of the cost
+    # matrix per step (every cell on it only needs the two previous anti-diagonals). A pair is abandoned,
+    # and given inf, as soon as every warping path through the current cells costs more than abandon_above
+    # (a squared distance). Returns the (not squared) distances.
+    queries = np.atleast_2d(np.asarray(queries, dtype=np.float64))
+    candidates = np.atleast_2d(np.asarray(candidates, dtype=np.float64))
+    num_pairs, num_points = queries.shape
+    if candidates.shape != queries.shape:
+        raise ValueError("DTW needs profiles of equal length, got %s and %s" % (queries.shape, candidates.shape))
+
+    distances = np.full(num_pairs, np.inf)
+    active = np.arange(num_pairs)
+    thresholds = np.broadcast_to(np.asarray(abandon_above, dtype=np.float64), (num_pairs,)).copy()
+
+    # Three rolling anti-diagonals indexed by row i + 1, the padding columns stay inf
+    previous2 = np.full((num_pairs, num_points + 2), np.inf)
+    previous1 = np.full((num_pairs, num_points + 2), np.inf)
+    current = np.full((num_pairs, num_points + 2), np.inf)
+    previous_minimum = np.full(num_pairs, np.inf)
+
+    for diagonal in range(2 * num_points - 1):
+        first = max(0, diagonal - num_points + 1, (diagonal - band + 1) // 2)
+        last = min(diagonal, num_points - 1, (diagonal + band) // 2)
+        rows = np.arange(first, last + 1)
+
+        cost = (queries[:, rows] - candidates[:, diagonal - rows]) ** 2
+        if diagonal == 0:
+            cells = cost
+        else:
+            cells = cost + np.minimum(np.minimum(previous2[:, rows], previous1[:, rows]), previous1[:, rows + 1])
+
+        current[:, first + 1:last + 2] = cells
+        current[:, first] = np.inf
+        if last + 2 < num_points + 2:
+            current[:, last + 2] = np.inf
+
+        # Every path crosses this anti-diagonal or the previous one, and costs only grow along a path
+        minimum = cells.min(axis=1, initial=np.inf)
+        abandoned = np.minimum(minimum, previous_minimum) > thresholds
+        previous_minimum = minimum
+
+        if abandoned.any():
+            keep = ~abandoned
+            active, thresholds, previous_minimum = active[keep], thresholds[keep], previous_minimum[keep]
+            queries, candidates = queries[keep], candidates[keep]
+            previous2, previous1, current = previous2[keep], previous1[keep], current[keep]
+            if len(active) == 0:
+                return distances
+
+        previous2, previous1, current = previous1, current, previous2
+
+    distances[active] = np.sqrt(previous1[:, num_points])
+
+    return distances
+
+
+def envelopes(profiles, band):
+    # Upper and lower LB_Keogh envelopes: running max and min over a window of band points on each side
+    profiles = np.asarray(profiles, dtype=np.float64)
+    size = 2 * band + 1
+    from scipy.ndimage import maximum_filter1d, minimum_filter1d
+
+    return (maximum_filter1d(profiles, size, axis=1, mode="nearest"),
+            minimum_filter1d(profiles, size, axis=1, mode="nearest"))
+
+
+def lower_bounds(query, templates, upper, lower):
+    # max(LB_Kim, LB_Keogh) of one query against every template, as squared distances
+    first_last = (query[0] - templates[:, 0]) ** 2 + (query[-1] - templates[:, -1]) ** 2
+    above = np.maximum(query - upper, 0)
+    below = np.maximum(lower - query, 0)
+    keogh = np.einsum("ij,ij->i", above, above) + np.einsum("ij,ij->i", below, below)
+
+    return np.maximum(first_last, keogh)
+
+
+_worker_templates = None
+
+
+def _initialise_worker(templates, upper, lower):
+    # Templates and envelopes are sent to every worker process once, not with each task
+    global _worker_templates
+    _worker_templates = (templates, upper, lower)
+
+
+def _nearest_for_queries(queries, band, k, batch_size):
+    templates, upper, lower = _worker_templates
+    results = []
+
+    for query in queries:
+        bounds = lower_bounds(query, templates, upper, lower)
+        order = np.argsort(bounds, kind="stable")
+        best_indices = np.empty(0, dtype=np.int64)
+        best_costs = np.empty(0)
+        evaluated = 0
+
+        for start in range(0, len(order), batch_size):
+            threshold = best_costs[k - 1] if len(best_costs) >= k else np.inf
+            candidates = order[start:start + batch_size]
+            candidates = candidates[bounds[candidates] < threshold]
+            if len(candidates) == 0:
+                break  # Candidates are sorted by lower bound, none of the rest can do better
+
+            distances = dtw_batch(np.broadcast_to(query, (len(candidates), len(query))), templates[candidates],
+                                  band, threshold)
+            evaluated += len(candidates)
+
+            best_indices = np.concatenate((best_indices, candidates))
+            best_costs = np.concatenate((best_costs, distances ** 2))
+            keep = np.argsort(best_costs, kind="stable")[:k]
+            best_indices, best_costs = best_indices[keep], best_costs[keep]
+
+        results.append((best_indices, np.sqrt(best_costs), evaluated))
+
+    return results
+
+
+def _matrix_for_queries(queries, band, batch_size):
+    # Every query x template pair of the chunk goes through dtw_batch together, batch_size pairs per call
+    templates = _worker_templates[0]
+    num_templates = len(templates)
+    distances = np.empty(len(queries) * num_templates)  # Query-major order of the pairs
+
+    for start in range(0, len(distances), batch_size):
+        pairs = np.arange(start, min(start + batch_size, len(distances)))
+        distances[pairs] = dtw_batch(queries[pairs // num_templates], templates[pairs % num_templates], band)
+
+    return distances.reshape(len(queries), num_templates).T
+
+
+def _run_parallel(function, theoretical, experimental, band, workers, chunk_size, *arguments):
+    # Samples are split into chunks and spread over a process pool, every worker holds the templates once
+    upper, lower = envelopes(theoretical, band)
+    chunks = [experimental[start:start + chunk_size] for start in range(0, len(experimental), chunk_size)]
+
+    if workers == 1 or len(chunks) <= 1:
+        _initialise_worker(theoretical, upper, lower)
+        return [function(chunk, band, *arguments) for chunk in chunks]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialise_worker,
+                             initargs=(theoretical, upper, lower)) as executor:
+        futures = [executor.submit(function, chunk, band, *arguments) for chunk in chunks]
+        return [future.result() for future in futures]
+
+
+def dtw_matrix(theoretical_data, experimental_data, band=None, workers=None, batch_size=256, chunk_size=16):
+    # Full theoretical x experimental DTW distance matrix, samples processed in parallel
+    theoretical_data = as_sample_set(theoretical_data)
+    experimental_data = as_sample_set(experimental_data)
+    theoretical = np.asarray(theoretical_data.values, dtype=np.float64)
+    experimental = np.asarray(experimental_data.values, dtype=np.float64)
+    band = default_band(theoretical.shape[1]) if band is None else band
+
+    blocks = _run_parallel(_matrix_for_queries, theoretical, experimental, band, workers, chunk_size, batch_size)
+    distances = np.concatenate(blocks, axis=1) if blocks else np.empty((len(theoretical), 0))
+
+    return LabelledMatrix(distances, theoretical_data.names, experimental_data.names, "dtw", False)
+
+
+def nearest_templates(theoretical_data, experimental_data, k=1, band=None, workers=None, batch_size=16,
+                      chunk_size=16):
+    # The k closest templates of every sample by DTW. Templates are tried in order of their LB_Kim/LB_Keogh
+    # lower bound, any template whose bound is above the current k-th best distance is skipped and DTW
+    # computations are abandoned early once they cannot beat it.
+    theoretical_data = as_sample_set(theoretical_data)
+    experimental_data = as_sample_set(experimental_data)
+    theoretical = np.asarray(theoretical_data.values, dtype=np.float64)
+    experimental = np.asarray(experimental_data.values, dtype=np.float64)
+    band = default_band(theoretical.shape[1]) if band is None else band
+    k = min(k, len(theoretical))
+
+    results = [result for chunk in _run_parallel(_nearest_for_queries, theoretical, experimental, band, workers,
+                                                 chunk_size, k, batch_size) for result in chunk]
+
+    indices = np.array([result[0] for result in results], dtype=np.int64).reshape(-1, k).T
+    distances = np.array([result[1] for result in results]).reshape(-1, k).T
+    labels = {name: [(theoretical_data.names[i], distance) for i, distance in zip(indices[:, j].tolist(),
+                                                                                  distances[:, j].tolist())]
+              for j, name in enumerate(experimental_data.names)}
+
+    return NearestTemplates(indices, distances, labels, np.array([result[2] for result in results]))
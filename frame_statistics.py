@@ -0,0 +1,118 @@
+import os
+from collections import namedtuple
+
+import numpy as np
+
+from generate_sanitised_data import iter_frame_chunks, MAX_READING
+from instrumentation import stage, result_rows
+from sample_set import SampleSet, DERIVED_DTYPE
+
+# Per-pixel repeatability statistics of one capture, spread is the max-min relative error (max - min) / max
+FrameStatistics = namedtuple("FrameStatistics",
+                             ["frames", "mean", "variance", "minimum", "maximum", "median", "spread"])
+
+
+class FrameAggregator:
+    # Collects per-pixel statistics over any number of frames fed in chunks, in a single pass.
+    # Mean and variance are merged chunk by chunk, the median comes from a per-pixel histogram whose
+    # size does not depend on the number of frames. With the default one bin per integer reading the
+    # median of raw captures is exact, fewer bins trade accuracy for memory.
+
+    def __init__(self, pixels=1500, value_range=(0, MAX_READING), bins=None, track_median=True):
+        low, high = value_range
+        self.pixels = pixels
+        self.low = low
+        self.bins = bins or int(high - low) + 1
+        self.bin_width = (high - low) / (self.bins - 1)
+
+        self.count = 0
+        self.mean = np.zeros(pixels)
+        self.m2 = np.zeros(pixels)  # Sum of squared differences from the mean
+        self.minimum = np.full(pixels, np.inf)
+        self.maximum = np.full(pixels, -np.inf)
+        self.histogram = np.zeros((pixels, self.bins), dtype=np.int32) if track_median else None
+
+    def update(self, chunk):
+        # chunk is a (frames x pixels) array
+        chunk = np.asarray(chunk, dtype=np.float64)
+        num_frames = len(chunk)
+        if num_frames == 0:
+            return
+
+        chunk_mean = chunk.mean(axis=0)
+        chunk_m2 = ((chunk - chunk_mean) ** 2).sum(axis=0)
+        self._merge_moments(num_frames, chunk_mean, chunk_m2)
+
+        np.minimum(self.minimum, chunk.min(axis=0), out=self.minimum)
+        np.maximum(self.maximum, chunk.max(axis=0), out=self.maximum)
+
+        if self.histogram is not None:
+            bins = np.clip(np.rint((chunk - self.low) / self.bin_width), 0, self.bins - 1).astype(np.int64)
+            bins += np.arange(self.pixels) * self.bins
+            np.add.at(self.histogram.reshape(-1), bins.ravel(), 1)
+
+    def merge(self, other):
+        # Combine with an aggregator that saw other frames, e.g. one from another process
+        if other.count == 0:
+            return
+        self._merge_moments(other.count, other.mean, other.m2)
+
+        np.minimum(self.minimum, other.minimum, out=self.minimum)
+        np.maximum(self.maximum, other.maximum, out=self.maximum)
+
+        if self.histogram is not None:
+            self.histogram += other.histogram
+
+    def _merge_moments(self, count, mean, m2):
+        # Pairwise update of mean and squared differences (Chan, Golub and LeVeque)
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    def median(self):
+        if self.histogram is None or self.count == 0:
+            return None
+
+        # The two middle ranks are found from the running counts, their average is the median
+        cumulative = np.cumsum(self.histogram, axis=1, dtype=np.int64)
+        lower = (cumulative <= (self.count - 1) // 2).sum(axis=1)
+        upper = (cumulative <= self.count // 2).sum(axis=1)
+
+        return self.low + (lower + upper) / 2 * self.bin_width
+
+    def result(self, ddof=1):
+        variance = self.m2 / (self.count - ddof) if self.count > ddof else np.full(self.pixels, np.nan)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spread = (self.maximum - self.minimum) / self.maximum
+
+        return FrameStatistics(self.count, self.mean, variance, self.minimum, self.maximum, self.median(), spread)
+
+
+def aggregate_capture(file_path, pixels=1500, chunk_frames=256, bins=None, track_median=True):
+    aggregator = FrameAggregator(pixels, bins=bins, track_median=track_median)
+
+    for chunk in iter_frame_chunks(file_path, pixels, chunk_frames):
+        aggregator.update(chunk)
+
+    return aggregator.result()
+
+
+@stage(items=result_rows)
+def streaming_element_averages(text_files, pixels=1500, statistic="mean", chunk_frames=256):
+    # Same rows as calculate_element_averages(split_data_into_arrays(...)) without holding whole captures
+    # in memory. statistic can be any FrameStatistics field that is per pixel, e.g. "median" or "spread".
+    rows = []
+    names = []
+
+    for file_path in text_files:
+        statistics = aggregate_capture(file_path, pixels, chunk_frames, track_median=statistic == "median")
+        if statistics.frames == 0:
+            continue
+
+        rows.append(getattr(statistics, statistic))
+        names.append(os.path.basename(file_path))
+
+    return SampleSet(np.array(rows, dtype=DERIVED_DTYPE).reshape(-1, pixels), names)
@@ -1,102 +1,276 @@
-import os
-import glob
-
-
-def read_text_files(path):
-    data = {}  # Create a dictionary to store file contents with file names as keys
-
-    # Use the glob module to get a list of all text files in the directory
-    text_files = sorted(glob.glob(os.path.join(path, '*.txt')))
-
-    # Iterate through each text file and read its contents
-    for file_path in text_files:
-        file_name = os.path.basename(file_path)  # Get the file name without the directory
-        with open(file_path, 'r') as file:
-            lines = file.readlines()
-
-            # Extract numbers from the 6th line onward
-            numbers = []
-            for line in lines[4:]:  # Start from the 6th line
-                line = line.strip()
-                if line.isdigit() and 0 <= int(line) <= 4096:
-                    if file_name.startswith("Sappho_"):
-                        flipped_number = 4096 - int(line)  # Flips the data from Sappho_XXXXX.txt signals
-                        numbers.append(flipped_number)
-                    else:
-                        numbers.append(int(line))
-
-            data[file_name] = numbers  # Store extracted numbers in the dictionary with file name as key
-
-    return data
-
-
-def split_data_into_arrays(data):
-    split_arrays = {}  # Create a dictionary to store split arrays
-
-    for file_name, file_data in data.items():
-        array_size = 1500
-        num_arrays = len(file_data) // array_size
-
-        split_arrays[file_name] = []
-
-        for i in range(num_arrays):
-            start_idx = i * array_size
-            end_idx = (i + 1) * array_size
-            split_array = file_data[start_idx:end_idx]
-            split_arrays[file_name].append(split_array)
-
-    return split_arrays
-
-
-def calculate_element_averages(split_arrays):
-    element_averages = {}  # Create a dictionary to store the element averages per file
-
-    for file_name, sublists in split_arrays.items():
-        num_elements = len(sublists[0])  # Assuming all sublists have the same length
-
-        # Initialize a list for each element's average
-        averages_per_element = [0] * num_elements
-
-        # Calculate the average for each element across all sublists
-        for sublist in sublists:
-            for i, value in enumerate(sublist):
-                averages_per_element[i] += value
-
-        # Divide the summed values by the number of sublists to get the average
-        averages_per_element = [avg / len(sublists) for avg in averages_per_element]
-
-        element_averages[file_name] = averages_per_element
-
-    return element_averages
-
-
-def moving_average_filter(arr):
-    window_size = 3
-    moving_averages = []
-
-    for i in range(len(arr)):
-        if i < window_size - 1:
-            moving_averages.append(arr[i])
-        else:
-            window = arr[i - window_size + 1:i + 1]
-            average = sum(window) / window_size
-            moving_averages.append(average)
-
-    return moving_averages
-
-
-def write_averages_to_file(element_averages, output_file="sanitised_data.txt"):
-    with open(output_file, 'w') as file:
-        for average_list in element_averages.values():
-            # Filter the avarage list
-            #average_list = moving_average_filter(average_list)
-
-            # Write each average list as a string
-            file.write(str(average_list) + "\n")
-
-
-directory_path = "./Samples"  # Replace with actual path
-file_contents = read_text_files(directory_path)
-split_data = split_data_into_arrays(file_contents)
-averages = calculate_element_averages(split_data)
-write_averages_to_file(averages)
+import os
+import argparse
+import glob
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import instrumentation
+from instrumentation import stage, rows, result_rows
+from sample_set import SampleSet, RAW_DTYPE, DERIVED_DTYPE
+from sanitised_store import is_binary_file, write_sanitised_binary, append_sanitised_binary
+
+HEADER_LINES = 4  # Number of text lines at the top of every capture file
+MAX_READING = 4096  # Upper limit of a valid reading, Sappho_ signals are flipped against it
+CACHE_DIRECTORY = ".sample_cache"  # Binary copies of already parsed capture files
+
+WHITESPACE = np.frombuffer(b" \t\r\x0b\x0c", dtype=np.uint8)
+
+
+def parse_readings(raw):
+    # raw is a uint8 array of whole text lines, one reading per line
+    if len(raw) == 0:
+        return np.empty(0, dtype=RAW_DTYPE)
+    if raw[-1] != ord("\n"):
+        raw = np.append(raw, np.uint8(ord("\n")))
+
+    # Label every byte with the line it belongs to
+    is_newline = raw == ord("\n")
+    line_ids = np.cumsum(is_newline) - is_newline
+    num_lines = int(is_newline.sum())
+
+    # A line holds a reading only if, once stripped, it is a single run of digits (same as str.isdigit)
+    is_digit = (raw >= ord("0")) & (raw <= ord("9"))
+    is_other = ~(is_digit | is_newline | np.isin(raw, WHITESPACE))
+    run_starts = is_digit & ~np.concatenate(([False], is_digit[:-1]))
+    digit_runs = np.bincount(line_ids, weights=run_starts, minlength=num_lines)
+    other_chars = np.bincount(line_ids, weights=is_other, minlength=num_lines)
+    valid = (digit_runs == 1) & (other_chars == 0)
+
+    # Turn the digits of every line into a number in one go
+    digit_positions = np.flatnonzero(is_digit)
+    digit_lines = line_ids[digit_positions]
+    last_digit = np.zeros(num_lines, dtype=np.int64)
+    line_ends = np.flatnonzero(np.diff(digit_lines, append=-1) != 0)
+    last_digit[digit_lines[line_ends]] = digit_positions[line_ends]
+
+    # Anything with a non-zero digit past the 10^4 place is out of range anyway, so the exponent is capped
+    exponents = np.minimum(last_digit[digit_lines] - digit_positions, 5)
+    digit_values = (raw[digit_positions] - ord("0")) * 10.0 ** exponents
+    values = np.bincount(digit_lines, weights=digit_values, minlength=num_lines)
+
+    return values[valid & (values <= MAX_READING)].astype(RAW_DTYPE)
+
+
+def parse_sample_file(file_path):
+    file_name = os.path.basename(file_path)
+
+    with open(file_path, 'rb') as file:
+        raw = np.frombuffer(file.read(), dtype=np.uint8)
+
+    # Skip the header lines, everything after them is one reading per line
+    newlines = np.flatnonzero(raw == ord("\n"))
+    if len(newlines) < HEADER_LINES:
+        return np.empty(0, dtype=RAW_DTYPE)
+    numbers = parse_readings(raw[newlines[HEADER_LINES - 1] + 1:])
+
+    if file_name.startswith("Sappho_"):
+        numbers = MAX_READING - numbers  # Flips the data from Sappho_XXXXX.txt signals
+
+    return numbers
+
+
+class ReadingParser:
+    # parse_readings for a capture read a block at a time, e.g. a long file or one that is still being written.
+    # Skips the header lines and keeps a line cut by the end of a block until the next block completes it.
+
+    def __init__(self, flip=False, header_lines=HEADER_LINES):
+        self.flip = flip  # Flip the readings like the Sappho_XXXXX.txt signals
+        self.header_lines = header_lines  # Header lines still to skip
+        self.leftover = b""
+
+    def feed(self, block, final=False):
+        # Readings of every line block completes. With final the file is done and an unterminated last line
+        # is complete after all.
+        text = self.leftover + block
+        cut = len(text) if final else text.rfind(b"\n") + 1
+        raw = np.frombuffer(text[:cut], dtype=np.uint8)
+        self.leftover = text[cut:]
+
+        if self.header_lines:
+            newlines = np.flatnonzero(raw == ord("\n"))
+            skipped = min(self.header_lines, len(newlines))
+            self.header_lines -= skipped
+            raw = raw[newlines[skipped - 1] + 1:] if skipped and not self.header_lines else raw[:0]
+
+        numbers = parse_readings(raw)
+        if self.flip:
+            numbers = MAX_READING - numbers
+
+        return numbers
+
+
+def iter_frame_chunks(file_path, array_size=1500, chunk_frames=256, block_size=1 << 20):
+    # Reads a capture a block at a time and yields (frames x pixels) arrays of at most chunk_frames rows,
+    # so memory stays bounded however long the capture is. A trailing partial frame is dropped like in
+    # split_data_into_arrays.
+    parser = ReadingParser(flip=os.path.basename(file_path).startswith("Sappho_"))
+    pending = np.empty(0, dtype=RAW_DTYPE)
+
+    with open(file_path, 'rb') as file:
+        while True:
+            block = file.read(block_size)
+            at_end = not block
+            pending = np.concatenate((pending, parser.feed(block, at_end)))
+
+            while len(pending) >= chunk_frames * array_size or (at_end and len(pending) >= array_size):
+                num_frames = min(len(pending) // array_size, chunk_frames)
+                yield pending[:num_frames * array_size].reshape(num_frames, array_size)
+                pending = pending[num_frames * array_size:]
+
+            if at_end:
+                break
+
+
+def cache_file_path(file_path, cache_dir=CACHE_DIRECTORY):
+    # The cache entry is keyed by path, size and modification time so edited files are parsed again
+    stat = os.stat(file_path)
+    key = "%s|%d|%d" % (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+    return os.path.join(cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".npy")
+
+
+def cache_sample_file(file_path, cache_path):
+    numbers = parse_sample_file(file_path)
+
+    # Write to a temporary file first so an interrupted run never leaves a half written entry
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    temporary_path = "%s.%d.tmp" % (cache_path, os.getpid())
+    with open(temporary_path, 'wb') as file:
+        np.save(file, numbers)
+    os.replace(temporary_path, cache_path)
+
+
+@stage(items=result_rows)
+def read_text_files(path, workers=None, cache_dir=CACHE_DIRECTORY):
+    data = {}  # Create a dictionary to store file contents with file names as keys
+
+    # Use the glob module to get a list of all text files in the directory
+    text_files = sorted(glob.glob(os.path.join(path, '*.txt')))
+
+    if cache_dir is None:
+        # No cache, the parsed arrays are sent back from the workers
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = executor.map(parse_sample_file, text_files, chunksize=8)
+            for file_path, numbers in zip(text_files, parsed):
+                data[os.path.basename(file_path)] = numbers
+
+        return data
+
+    # Only the files that changed since the last run are parsed, spread over a process pool
+    cache_paths = [cache_file_path(file_path, cache_dir) for file_path in text_files]
+    missing = [(file_path, cache_path) for file_path, cache_path in zip(text_files, cache_paths)
+               if not os.path.exists(cache_path)]
+
+    if len(missing) == 1:
+        cache_sample_file(*missing[0])
+    elif missing:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(cache_sample_file, *zip(*missing), chunksize=8))
+
+    for file_path, cache_path in zip(text_files, cache_paths):
+        # Memory-map the cached arrays, pages are only read when the data is used
+        data[os.path.basename(file_path)] = np.load(cache_path, mmap_mode='r')
+
+    return data
+
+
+@stage(items=result_rows)
+def split_data_into_arrays(data, array_size=1500):
+    frames = []  # Every file is reshaped to a (frames x pixels) block without copying element by element
+    names = []
+
+    for file_name, file_data in data.items():
+        num_arrays = len(file_data) // array_size
+
+        frames.append(np.asarray(file_data[:num_arrays * array_size], dtype=RAW_DTYPE).reshape(num_arrays, array_size))
+        names.extend([file_name] * num_arrays)
+
+    if not frames:
+        return SampleSet(np.empty((0, array_size), dtype=RAW_DTYPE), names)
+
+    return SampleSet(np.concatenate(frames), names)
+
+
+@stage(items=rows)
+def calculate_element_averages(split_arrays):
+    if len(split_arrays) == 0:
+        return SampleSet(np.empty((0, split_arrays.shape[1]), dtype=DERIVED_DTYPE), [])
+
+    # Frames of the same file are next to each other, so every file is one contiguous block of rows
+    names = np.array(split_arrays.names, dtype=object)
+    starts = np.flatnonzero(np.concatenate(([True], names[1:] != names[:-1])))
+    counts = np.diff(np.append(starts, len(names)))
+
+    # Sum every block in float64 so uint16 readings cannot overflow, then store the averages as float32
+    sums = np.add.reduceat(split_arrays.values, starts, axis=0, dtype=np.float64)
+    averages = (sums / counts[:, None]).astype(DERIVED_DTYPE)
+
+    return SampleSet(averages, names[starts].tolist(), split_arrays.pixels[starts],
+                     [split_arrays.geometries[i] for i in starts])
+
+
+def moving_average_filter(arr):
+    window_size = 3
+    moving_averages = []
+
+    for i in range(len(arr)):
+        if i < window_size - 1:
+            moving_averages.append(arr[i])
+        else:
+            window = arr[i - window_size + 1:i + 1]
+            average = sum(window) / window_size
+            moving_averages.append(average)
+
+    return moving_averages
+
+
+@stage(items=rows)
+def write_averages_to_file(element_averages, output_file="sanitised_data.bin", append=False):
+    if is_binary_file(output_file):
+        # Binary matrix plus row index, see sanitised_store.py
+        if append:
+            append_sanitised_binary(element_averages, output_file)
+        else:
+            write_sanitised_binary(element_averages, output_file)
+        return
+
+    with open(output_file, 'a' if append else 'w') as file:
+        for average_list in element_averages:
+            # Filter the avarage list
+            #average_list = moving_average_filter(average_list)
+
+            # Write each average list as a string
+            file.write(str(average_list.tolist()) + "\n")
+
+
+if __name__ == "__main__":
+    # The guard keeps the process pool workers from running the script again when they import it
+    parser = argparse.ArgumentParser(description="Average every capture in a Samples directory into sanitised data")
+    parser.add_argument("directory", nargs="?", default="./Samples", help="directory with the capture .txt files")
+    parser.add_argument("-o", "--output", default="sanitised_data.bin", help="output file (.bin or .txt)")
+    parser.add_argument("--pixels", type=int, default=1500, help="pixels per frame")
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (default: all cores)")
+    parser.add_argument("--append", action="store_true", help="append to an existing output file")
+    parser.add_argument("--streaming", action="store_true",
+                        help="read every capture in chunks of frames instead of whole, for captures that do not fit "
+                             "in memory (no process pool or cache)")
+    parser.add_argument("--profile", nargs="?", const=instrumentation.TRACE_FILE, default=None, metavar="TRACE_FILE",
+                        help="time every stage and write a JSON trace (default: %s)" % instrumentation.TRACE_FILE)
+    args = parser.parse_args()
+
+    if args.profile:
+        instrumentation.enable(args.profile)
+
+    if args.streaming:
+        from frame_statistics import streaming_element_averages  # It reads captures through this module
+
+        text_files = sorted(glob.glob(os.path.join(args.directory, '*.txt')))
+        averages = streaming_element_averages(text_files, args.pixels)
+    else:
+        file_contents = read_text_files(args.directory, args.workers)
+        split_data = split_data_into_arrays(file_contents, args.pixels)
+        averages = calculate_element_averages(split_data)
+
+    write_averages_to_file(averages, args.output, args.append)
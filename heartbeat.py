@@ -0,0 +1,170 @@
+import time
+import argparse
+
+import numpy as np
+from scipy.signal import find_peaks
+
+from generate_sanitised_data import ReadingParser
+from sample_set import RAW_DTYPE
+
+FRAME_PERIOD = 0.0666  # Seconds between frames, the frstep of heartbeat.m
+RATE_RANGE = (40.0, 200.0)  # Beats per minute that are accepted as a heart rate
+
+
+def follow_frames(file_path, pixels=1500, poll_interval=0.05, idle_timeout=None, block_size=1 << 20, flip=False):
+    # Follows a capture that is still being written, like tail -f, and yields (frames x pixels) arrays of
+    # every frame completed since the last read. Only an incomplete line and an incomplete frame are kept
+    # between reads, so memory does not grow with the capture. Stops once the file has not grown for
+    # idle_timeout seconds, or at the end of the file if idle_timeout is 0; None follows it forever.
+    # The readings are kept as recorded like in heartbeat.m, which leaves its inverting commented out, so
+    # the peak detector finds the brightness maxima; flip gives the flipped signal of the sanitised data.
+    parser = ReadingParser(flip)
+    pending = np.empty(0, dtype=RAW_DTYPE)
+    last_growth = time.monotonic()
+
+    with open(file_path, 'rb') as file:
+        while True:
+            block = file.read(block_size)
+            finished = False
+
+            if not block:
+                if idle_timeout is None or time.monotonic() - last_growth < idle_timeout:
+                    time.sleep(poll_interval)
+                    continue
+                # The writer is done
+                finished = True
+            else:
+                last_growth = time.monotonic()
+
+            pending = np.concatenate((pending, parser.feed(block, finished)))
+
+            num_frames = len(pending) // pixels
+            if num_frames:
+                yield pending[:num_frames * pixels].reshape(num_frames, pixels)
+                pending = pending[num_frames * pixels:]
+
+            if finished:
+                break
+
+
+class HeartRateEstimator:
+    # Keeps the brightness of the last window seconds in a ring buffer and estimates the heart rate from it.
+    # Every estimate costs the same whatever the capture length: one FFT of a fixed size for the spectral
+    # detector, one peak search over the window for the peak detector.
+
+    def __init__(self, frame_period=FRAME_PERIOD, window=10.0, rate_range=RATE_RANGE, min_fill=0.5):
+        self.frame_period = frame_period
+        self.window_frames = max(int(round(window / frame_period)), 4)
+        self.min_frames = max(int(self.window_frames * min_fill), 4)
+        self.rate_range = rate_range
+
+        self.buffer = np.zeros(self.window_frames)
+        self.position = 0  # Next slot to write
+        self.count = 0  # Frames seen so far
+
+        # Zero padding gives a finer grid to read the peak from, parabolic interpolation refines it further
+        self.nfft = 4 * (1 << int(np.ceil(np.log2(self.window_frames))))
+        frequencies = np.fft.rfftfreq(self.nfft, frame_period) * 60
+        self.band = np.flatnonzero((frequencies >= rate_range[0]) & (frequencies <= rate_range[1]))
+        self.bin_width = frequencies[1]
+
+    def update(self, brightness):
+        brightness = np.atleast_1d(np.asarray(brightness, dtype=np.float64))[-self.window_frames:]
+        slots = (self.position + np.arange(len(brightness))) % self.window_frames
+        self.buffer[slots] = brightness
+
+        self.position = (self.position + len(brightness)) % self.window_frames
+        self.count += len(brightness)
+
+    def window(self):
+        # The buffered samples, oldest first
+        filled = min(self.count, self.window_frames)
+        return np.roll(self.buffer, -self.position)[self.window_frames - filled:]
+
+    def _detrended(self):
+        samples = self.window()
+        t = np.arange(len(samples))
+
+        # Slow drift of the overall brightness would otherwise dominate the low end of the spectrum
+        slope, intercept = np.polyfit(t, samples, 1)
+        return samples - (slope * t + intercept)
+
+    def estimate(self, method="spectral"):
+        # Heart rate in beats per minute, nan until enough of the window is filled
+        if self.count < self.min_frames:
+            return np.nan
+
+        samples = self._detrended()
+        if method == "peaks":
+            return self._peak_rate(samples)
+
+        power = np.abs(np.fft.rfft(samples * np.hanning(len(samples)), self.nfft)) ** 2
+        band_power = power[self.band]
+        if not band_power.any():
+            return np.nan
+
+        peak = int(np.argmax(band_power))
+        offset = 0.0
+        if 0 < peak < len(band_power) - 1:
+            # Parabola through the log power of the peak and its neighbours
+            left, centre, right = np.log(band_power[peak - 1:peak + 2] + np.finfo(float).tiny)
+            denominator = left - 2 * centre + right
+            if denominator != 0:
+                offset = 0.5 * (left - right) / denominator
+
+        return (self.band[peak] + offset) * self.bin_width
+
+    def _peak_rate(self, samples):
+        # Median interval between beats, peaks closer than the highest accepted rate allows are merged
+        min_distance = max(int(60.0 / self.rate_range[1] / self.frame_period), 1)
+        peaks, _ = find_peaks(samples, distance=min_distance, prominence=samples.std() * 0.5)
+        if len(peaks) < 2:
+            return np.nan
+
+        rate = 60.0 / (np.median(np.diff(peaks)) * self.frame_period)
+        return rate if self.rate_range[0] <= rate <= self.rate_range[1] else np.nan
+
+
+def monitor(file_path, pixels=1500, frame_period=FRAME_PERIOD, window=10.0, method="spectral",
+            update_every=1, poll_interval=0.05, idle_timeout=None, flip=False):
+    # Yields (time, brightness, heart rate) for every frame as soon as it is written. The rate is
+    # refreshed every update_every frames and repeated in between.
+    estimator = HeartRateEstimator(frame_period, window)
+    rate = np.nan
+
+    for frames in follow_frames(file_path, pixels, poll_interval, idle_timeout, flip=flip):
+        # Mean brightness of every frame, the temp array of heartbeat.m
+        brightness = frames.mean(axis=1)
+
+        for value in brightness:
+            estimator.update(value)
+            if estimator.count % update_every == 0:
+                rate = estimator.estimate(method)
+
+            yield estimator.count * frame_period, value, rate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Follow a Sappho capture and estimate the heart rate while it is recorded")
+    parser.add_argument("file", help="capture file, e.g. Samples/Sappho_00131.txt")
+    parser.add_argument("--pixels", type=int, default=1500, help="pixels per frame")
+    parser.add_argument("--frame-period", type=float, default=FRAME_PERIOD, help="seconds between frames")
+    parser.add_argument("--window", type=float, default=10.0, help="seconds of brightness used for each estimate")
+    parser.add_argument("--method", choices=("spectral", "peaks"), default="spectral", help="heart rate detector")
+    parser.add_argument("--update-every", type=int, default=1, help="frames between heart rate estimates")
+    parser.add_argument("--idle-timeout", type=float, default=None,
+                        help="stop after the file has not grown for this many seconds (0 for a finished capture)")
+    parser.add_argument("--flip", action="store_true", help="flip the readings like the sanitised Sappho_ data")
+    args = parser.parse_args(argv)
+
+    try:
+        for seconds, brightness, rate in monitor(args.file, args.pixels, args.frame_period, args.window,
+                                                 args.method, args.update_every, idle_timeout=args.idle_timeout,
+                                                 flip=args.flip):
+            print("%8.3f s  brightness %9.2f  heart rate %6.1f bpm" % (seconds, brightness, rate), flush=True)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
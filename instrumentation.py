@@ -0,0 +1,198 @@
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+import functools
+import tracemalloc
+
+PROFILE_VARIABLE = "SAPPHO_PROFILE"  # Set to a trace file name (or 1) to profile any script without changing it
+TRACE_FILE = "profile_trace.json"
+
+# Stages are functions decorated with @stage. While profiling is off the wrapper only checks one flag
+# before calling the function. While it is on every call records wall time, CPU time, the peak traced
+# allocation above what was allocated when it started (numpy arrays included), the number of items it
+# processed and the resulting throughput. Nested stages are kept as children of the calling stage.
+# Work done inside process pool workers is counted in the wall time of the calling stage only.
+
+
+class _State:
+    enabled = False
+    trace_file = None
+    events = []
+    started = None
+    local = threading.local()
+
+
+def enable(trace_file=TRACE_FILE, print_summary=True):
+    # Starts collecting. The trace and the summary are written when the process exits or on report()
+    if _State.enabled:
+        return
+
+    _State.enabled = True
+    _State.trace_file = trace_file
+    _State.events = []
+    _State.started = time.perf_counter()
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    atexit.register(report, print_summary)
+
+
+def disable():
+    _State.enabled = False
+
+
+def is_enabled():
+    return _State.enabled
+
+
+def rows(args, kwargs, result):
+    # Items of a stage that takes a batch of profiles as its first argument
+    return len(args[0])
+
+
+def result_rows(args, kwargs, result):
+    return len(result)
+
+
+def pairs(args, kwargs, result):
+    # Items of a metric: every theoretical x experimental pair
+    return len(args[0]) * len(args[1])
+
+
+def _frames():
+    if not hasattr(_State.local, "frames"):
+        _State.local.frames = []
+    return _State.local.frames
+
+
+def stage(name=None, items=None):
+    # Decorator: @stage() or @stage("name", items=rows). items(args, kwargs, result) counts what was processed.
+    def decorator(function):
+        stage_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _State.enabled:
+                return function(*args, **kwargs)
+
+            return _run_stage(stage_name, items, function, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _run_stage(stage_name, items, function, args, kwargs):
+    frames = _frames()
+    traced_start, outer_peak = tracemalloc.get_traced_memory()
+    if frames:
+        # The peak so far belongs to the caller, keep it before the counter is reset for this stage
+        frames[-1]["child_peak"] = max(frames[-1]["child_peak"], outer_peak)
+    tracemalloc.reset_peak()
+
+    frame = {"child_peak": 0}
+    frames.append(frame)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    try:
+        result = function(*args, **kwargs)
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        frames.pop()
+
+        peak = max(tracemalloc.get_traced_memory()[1], frame["child_peak"])
+        if frames:
+            frames[-1]["child_peak"] = max(frames[-1]["child_peak"], peak)
+
+    try:
+        count = items(args, kwargs, result) if items else None
+    except (TypeError, IndexError):
+        count = None
+
+    _State.events.append({
+        "name": stage_name,
+        "start": wall_start - _State.started,
+        "wall_seconds": wall,
+        "cpu_seconds": cpu,
+        "peak_bytes": max(peak - traced_start, 0),
+        "items": count,
+        "items_per_second": count / wall if count is not None and wall > 0 else None,
+        "depth": len(frames),
+        "thread": threading.get_ident(),
+    })
+
+    return result
+
+
+def summary():
+    # {stage: totals} over all calls, sorted by total wall time
+    totals = {}
+    for event in _State.events:
+        total = totals.setdefault(event["name"], {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0,
+                                                  "peak_bytes": 0, "items": None})
+        total["calls"] += 1
+        total["wall_seconds"] += event["wall_seconds"]
+        total["cpu_seconds"] += event["cpu_seconds"]
+        total["peak_bytes"] = max(total["peak_bytes"], event["peak_bytes"])
+        if event["items"] is not None:
+            total["items"] = (total["items"] or 0) + event["items"]
+
+    for total in totals.values():
+        total["items_per_second"] = total["items"] / total["wall_seconds"] \
+            if total["items"] is not None and total["wall_seconds"] > 0 else None
+
+    return dict(sorted(totals.items(), key=lambda item: -item[1]["wall_seconds"]))
+
+
+def write_trace(trace_file=None):
+    # Chrome trace event format, so the file opens in chrome://tracing or Perfetto as a timeline.
+    # The per-stage totals are stored next to the events.
+    trace_file = trace_file or _State.trace_file or TRACE_FILE
+    trace_events = [{"name": event["name"], "ph": "X", "pid": os.getpid(), "tid": event["thread"],
+                     "ts": event["start"] * 1e6, "dur": event["wall_seconds"] * 1e6,
+                     "args": {key: event[key] for key in ("cpu_seconds", "peak_bytes", "items", "items_per_second")}}
+                    for event in _State.events]
+
+    with open(trace_file, "w") as file:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms", "summary": summary()}, file, indent=1)
+
+    return trace_file
+
+
+def format_summary():
+    lines = ["%-28s %6s %11s %11s %12s %12s %14s" % ("stage", "calls", "wall s", "cpu s", "peak MB", "items", "items/s")]
+    for name, total in summary().items():
+        lines.append("%-28s %6d %11.4f %11.4f %12.2f %12s %14s" % (
+            name, total["calls"], total["wall_seconds"], total["cpu_seconds"], total["peak_bytes"] / 2 ** 20,
+            "-" if total["items"] is None else total["items"],
+            "-" if total["items_per_second"] is None else "%.1f" % total["items_per_second"]))
+
+    return "\n".join(lines)
+
+
+def report(print_summary=True):
+    # Writes the trace and prints the summary once, later calls (e.g. the atexit one) do nothing
+    if not _State.events:
+        return None
+
+    trace_file = write_trace()
+    if print_summary:
+        print(format_summary(), file=sys.stderr)
+        print("Profile trace written to %s" % trace_file, file=sys.stderr)
+
+    _State.events = []
+    return trace_file
+
+
+def enable_from_environment():
+    value = os.environ.get(PROFILE_VARIABLE)
+    if value:
+        enable(TRACE_FILE if value in ("1", "true", "yes") else value)
+
+
+enable_from_environment()
@@ -0,0 +1,293 @@
+import os
+import glob
+import pickle
+import hashlib
+import argparse
+
+import data_analysis
+import instrumentation
+import data_analysis_sap
+from generate_sanitised_data import read_text_files, split_data_into_arrays, calculate_element_averages
+from resampling import resample_to_common_grid
+from results_store import StoredRunMismatch
+from sample_set import SampleSet
+from sanitised_store import load_sanitised_data, index_file_path, is_binary_file
+from template_bank import read_templates, is_prepared_templates, read_prepared_templates
+
+PIPELINE_CACHE_DIRECTORY = ".pipeline_cache"  # Stage outputs, named by the hash of their inputs and parameters
+CACHE_VERSION = 1  # Bump to invalidate every cached output when stage code changes meaning
+
+
+class Pipeline:
+    # Stages form a dependency graph. A stage's cache key hashes its name, its parameters and the keys of the
+    # stages it reads, so a change anywhere upstream changes every key below it and nothing else.
+
+    def __init__(self, cache_dir=PIPELINE_CACHE_DIRECTORY, use_cache=True):
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        self.stages = {}
+        self.outputs = {}
+        self.keys = {}
+        self.computed = []
+
+    def add(self, name, function, inputs=(), params=None, persist=True):
+        # function(*input outputs, **params). persist=False stages are recomputed each run but still keyed
+        self.stages[name] = (function, tuple(inputs), params or {}, persist)
+
+    def key(self, name):
+        if name not in self.keys:
+            function, inputs, params, _ = self.stages[name]
+            description = repr((CACHE_VERSION, name, sorted(params.items()), [self.key(stage) for stage in inputs]))
+            self.keys[name] = hashlib.sha1(description.encode()).hexdigest()
+
+        return self.keys[name]
+
+    def _cache_path(self, name):
+        return os.path.join(self.cache_dir, "%s-%s.pkl" % (name, self.key(name)))
+
+    def run_stage(self, name):
+        # Outputs are shared in memory, every stage runs at most once per process
+        if name in self.outputs:
+            return self.outputs[name]
+
+        function, inputs, params, persist = self.stages[name]
+        cache_path = self._cache_path(name)
+
+        if self.use_cache and persist and os.path.exists(cache_path):
+            with open(cache_path, "rb") as file:
+                output = pickle.load(file)
+        else:
+            output = function(*[self.run_stage(stage) for stage in inputs], **params)
+            self.computed.append(name)
+
+            if self.use_cache and persist:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                temporary_path = "%s.%d.tmp" % (cache_path, os.getpid())
+                with open(temporary_path, "wb") as file:
+                    pickle.dump(output, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temporary_path, cache_path)
+
+        self.outputs[name] = output
+        return output
+
+    def run(self, targets):
+        return {target: self.run_stage(target) for target in targets}
+
+
+def file_signature(paths):
+    # Content address of input files without reading them: path, size and modification time
+    return [(os.path.abspath(path), os.stat(path).st_size, os.stat(path).st_mtime_ns) for path in sorted(paths)]
+
+
+def ingest(directory, pixels, signature):
+    return split_data_into_arrays(read_text_files(directory), pixels)
+
+
+def load_samples(file_path, signature):
+    return load_sanitised_data(file_path).copy()
+
+
+def load_templates(template_set, source=None, signature=None):
+    if template_set == "default":
+        return SampleSet.from_rows(data_analysis.THEORETICAL_DATA, names=data_analysis.THEORETICAL_NAMES)
+    if template_set == "sap":
+        return SampleSet.from_rows(data_analysis_sap.THEORETICAL_DATA, names=data_analysis_sap.THEORETICAL_NAMES)
+
+    return read_templates(source).copy()
+
+
+def prepare_templates(templates, log_scale):
+    templates = templates.copy()
+    if log_scale:
+        # Turn linear to logarithmic data because of extreme peaks in the middle
+        templates = data_analysis.log_transform(templates)
+
+    return data_analysis.normalize_data(templates)
+
+
+def load_prepared(source, signature=None):
+    # Curves of a template bank, already log-transformed (if it was built so) and normalized
+    return read_prepared_templates(source).copy()
+
+
+def load_prepared_templates(template_set, log_scale=True):
+    # Templates ready to compare: a template bank's curves as they are stored, anything else prepared here
+    if is_prepared_templates(template_set):
+        return load_prepared(template_set)
+
+    return prepare_templates(load_templates(template_set, template_set), log_scale)
+
+
+def template_files(source):
+    # Files the templates are read from, for the cache key
+    if os.path.isdir(source):
+        pattern = "*" if is_prepared_templates(source) else "*.txt"
+        return glob.glob(os.path.join(source, pattern))
+
+    return [source] + ([index_file_path(source)] if is_binary_file(source) else [])
+
+
+def prepare_samples(samples):
+    return data_analysis.normalize_data(samples.copy())
+
+
+def align(templates, samples):
+    # Both sides on one angle grid when their pixel counts differ
+    if templates.shape[1] == samples.shape[1]:
+        return templates, samples
+
+    _, (templates, samples) = resample_to_common_grid([templates, samples])
+    return templates, samples
+
+
+# Metric stages, each one called with (templates, samples) and writing its results/ files. The functions are
+# taken from data_analysis_sap for the sap templates, so its defaults (seeds, segment length) apply to them.
+METRICS = {
+    "coherence": "coherence",
+    "xcorr": "cross_correlation",
+    "rsquared": "rsquared",
+    "pearson": "pearsoncalc",
+    "dtw": "dynamic_time_warping",
+    "ks": "kolmogorov_smirnov_test",
+    "kmeans": "kmeans_clustering",
+    "wavelet": "wavelet_transform",
+    "fourier": "fourier_transform",
+}
+
+# Transforms run on templates and samples separately, each side written to its own file
+TRANSFORM_FILES = {
+    "wavelet": ("wavelet_theoretical_results.npz", "wavelet_experimental_results.npz"),
+    "fourier": ("fourier_theoretical_results.txt", "fourier_experimental_results.txt"),
+}
+
+
+def analysis_module(template_set):
+    return data_analysis_sap if template_set == "sap" else data_analysis
+
+
+# Metrics whose matrices go to a results store, see results_store.py
+STORED_METRICS = ("coherence", "xcorr", "rsquared", "pearson", "dtw", "ks")
+
+
+def results_store_directory(template_set, log_scale=True, parameters=None):
+    # Every template set has its own store, their template columns differ. Linear templates and parameters
+    # other than the defaults give other values for the same columns, so they are kept in stores of their own
+    # instead of clashing with the stored run.
+    if template_set == "default":
+        directory = data_analysis.RESULTS_STORE
+    elif template_set == "sap":
+        directory = data_analysis_sap.RESULTS_STORE
+    else:
+        name = os.path.splitext(os.path.basename(template_set.rstrip("/\\")))[0]
+        directory = os.path.join("results", "store_" + name)
+
+    suffixes = ([] if log_scale else ["linear"]) + ["%s%s" % item for item in sorted((parameters or {}).items())]
+    return "_".join([directory] + suffixes)
+
+
+def run_metric(aligned, metric, template_set="default", **params):
+    templates, samples = aligned
+    function = getattr(analysis_module(template_set), METRICS[metric])
+
+    if metric in TRANSFORM_FILES:
+        theoretical_file, experimental_file = TRANSFORM_FILES[metric]
+        return function(templates, theoretical_file, **params), function(samples, experimental_file, **params)
+
+    return function(templates, samples, **params)
+
+
+def build_pipeline(args):
+    pipeline = Pipeline(args.cache_dir, not args.no_cache)
+
+    if args.sanitised:
+        pipeline.add("samples_raw", load_samples, params={"file_path": args.sanitised,
+                                                          "signature": file_signature([args.sanitised])})
+    else:
+        text_files = glob.glob(os.path.join(args.samples, "*.txt"))
+        # Ingest has its own per-file cache, only its key is needed here
+        pipeline.add("ingest", ingest, params={"directory": args.samples, "pixels": args.pixels,
+                                               "signature": file_signature(text_files)}, persist=False)
+        pipeline.add("samples_raw", calculate_element_averages, ["ingest"])
+
+    if args.templates in ("default", "sap"):
+        pipeline.add("templates_raw", load_templates, params={"template_set": args.templates}, persist=False)
+        pipeline.add("templates", prepare_templates, ["templates_raw"], {"log_scale": not args.linear_templates})
+    elif is_prepared_templates(args.templates):
+        # A template bank's curves are compared as they are stored
+        pipeline.add("templates", load_prepared, params={
+            "source": args.templates, "signature": file_signature(template_files(args.templates))}, persist=False)
+    else:
+        pipeline.add("templates_raw", load_templates, params={
+            "template_set": args.templates, "source": args.templates,
+            "signature": file_signature(template_files(args.templates))}, persist=False)
+        pipeline.add("templates", prepare_templates, ["templates_raw"], {"log_scale": not args.linear_templates})
+    pipeline.add("samples", prepare_samples, ["samples_raw"])
+    pipeline.add("aligned", align, ["templates", "samples"])
+
+    for metric in args.metrics:
+        params = {"metric": metric, "template_set": args.templates}
+        store_parameters = {}
+        if metric == "coherence":
+            default_nperseg = 750 if args.templates == "sap" else 64
+            params["nperseg"] = args.nperseg or default_nperseg
+            if params["nperseg"] != default_nperseg:
+                store_parameters["nperseg"] = params["nperseg"]
+        if metric in STORED_METRICS:
+            params["store"] = args.store or results_store_directory(args.templates, not args.linear_templates,
+                                                                    store_parameters)
+            params["replace"] = args.replace
+        if metric == "kmeans":
+            params["refit"] = args.refit_clusters
+            params["update"] = args.update_clusters
+        # Metrics write results/, the store and the cluster model, so they run every time instead of
+        # returning a cached output and leaving those files missing or stale. Their inputs stay cached.
+        pipeline.add(metric, run_metric, ["aligned"], params, persist=False)
+
+    return pipeline
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run any selection of metrics over Sappho captures in one process")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--samples", default="./Samples", help="directory with capture .txt files")
+    source.add_argument("--sanitised", help="existing sanitised data file (.bin or .txt) instead of captures")
+    parser.add_argument("--templates", default="default",
+                        help="'default' (128 point curves), 'sap' (1500 point curves), a template bank directory, "
+                             "a .bin file or a directory of text curves")
+    parser.add_argument("--linear-templates", action="store_true", help="do not log-transform the templates")
+    parser.add_argument("--metrics", nargs="+", default=["rsquared"], choices=sorted(METRICS), help="metrics to run")
+    parser.add_argument("--pixels", type=int, default=1500, help="pixels per frame of the captures")
+    parser.add_argument("--nperseg", type=int, default=None, help="coherence segment length")
+    parser.add_argument("--store", default=None,
+                        help="results store directory (default: one per template set, template scaling and "
+                             "coherence segment length)")
+    parser.add_argument("--replace", action="store_true",
+                        help="start the stored results of the metrics over, needed after changing their parameters")
+    clusters = parser.add_mutually_exclusive_group()
+    clusters.add_argument("--refit-clusters", action="store_true",
+                          help="fit the cluster model from the template seeds again instead of reusing the saved one")
+    clusters.add_argument("--update-clusters", action="store_true",
+                          help="move the saved cluster model's centroids towards the new captures")
+    parser.add_argument("--cache-dir", default=PIPELINE_CACHE_DIRECTORY, help="stage output cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="recompute every stage and do not store outputs")
+    parser.add_argument("--profile", nargs="?", const=instrumentation.TRACE_FILE, default=None, metavar="TRACE_FILE",
+                        help="time every stage and write a JSON trace (default: %s)" % instrumentation.TRACE_FILE)
+    args = parser.parse_args(argv)
+    if args.linear_templates and is_prepared_templates(args.templates):
+        parser.error("--linear-templates does not apply to a template bank, its curves are used as they were built")
+
+    if args.profile:
+        instrumentation.enable(args.profile)
+
+    pipeline = build_pipeline(args)
+    try:
+        pipeline.run(args.metrics)
+    except StoredRunMismatch as error:
+        parser.error("%s (--replace on the command line)" % error)
+
+    print("Computed: %s" % (", ".join(pipeline.computed) or "nothing, every result was cached"))
+    return pipeline
+
+
+if __name__ == "__main__":
+    main()
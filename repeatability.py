@@ -0,0 +1,142 @@
+import os
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.signal import lfilter
+
+from generate_sanitised_data import parse_sample_file, cache_file_path, cache_sample_file, CACHE_DIRECTORY
+from sample_set import capture_pixels
+
+FILTER_ORDER = 10  # Moving average length of sgk_analyser.m, singleSample.m and multiSampleTest.m
+
+# Per-pixel metrics of the report, in the order of the Octave figures
+PIXEL_METRICS = ["average", "median", "relative_error", "relative_error_filtered"]
+
+
+def load_capture(file_path, cache_dir=CACHE_DIRECTORY):
+    # Parsed readings of a capture, through the same cache as read_text_files
+    if cache_dir is None:
+        return parse_sample_file(file_path)
+
+    cache_path = cache_file_path(file_path, cache_dir)
+    if not os.path.exists(cache_path):
+        cache_sample_file(file_path, cache_path)
+
+    return np.load(cache_path, mmap_mode='r')
+
+
+def moving_average_frames(frames, order=FILTER_ORDER):
+    # Octave's filter(ones(n, 1)/n, 1, data) runs over the readings before they are reshaped, so it is one
+    # causal filter over the flattened frames and the first pixels of a frame see the end of the previous one
+    filtered = lfilter(np.ones(order) / order, 1, np.asarray(frames, dtype=np.float64).ravel())
+
+    return filtered.reshape(np.shape(frames))
+
+
+def relative_error(frames):
+    # Max-min relative error of every pixel over all frames, in percent
+    maximum = frames.max(axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (maximum - frames.min(axis=0)) / maximum * 100
+
+
+def repeatability_statistics(frames, order=FILTER_ORDER):
+    # frames is a (frames x pixels) matrix, every statistic is per pixel and computed over all frames at once
+    filtered = moving_average_frames(frames, order)
+
+    filtered_error = relative_error(filtered)
+    filtered_error[:order] = 0  # Ignore the first pixels because the filtering is quirky there
+
+    return {
+        "average": filtered.mean(axis=0),
+        "median": np.median(filtered, axis=0),
+        "relative_error": relative_error(np.asarray(frames, dtype=np.float64)),
+        "relative_error_filtered": filtered_error,
+    }
+
+
+def analyse_capture(file_path, pixels=None, order=FILTER_ORDER, cache_dir=CACHE_DIRECTORY):
+    pixels = pixels or capture_pixels(file_path)
+    readings = load_capture(file_path, cache_dir)
+
+    num_frames = len(readings) // pixels
+    if num_frames == 0:
+        return num_frames, pixels, None
+
+    frames = np.asarray(readings[:num_frames * pixels]).reshape(num_frames, pixels)
+    return num_frames, pixels, repeatability_statistics(frames, order)
+
+
+def _analyse(arguments):
+    return analyse_capture(*arguments)
+
+
+def batch_repeatability(path, pixels=None, order=FILTER_ORDER, workers=None, cache_dir=CACHE_DIRECTORY):
+    # Repeatability statistics of every capture in a directory, one capture per worker process.
+    # Returns the file names, frame and pixel counts and a (files x pixels) matrix per metric; rows of
+    # captures with fewer pixels than the widest one are padded with nan.
+    text_files = sorted(glob.glob(os.path.join(path, '*.txt')))
+    arguments = [(file_path, pixels, order, cache_dir) for file_path in text_files]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        analysed = list(executor.map(_analyse, arguments, chunksize=4))
+
+    kept = [(os.path.basename(file_path), result) for file_path, result in zip(text_files, analysed)
+            if result[2] is not None]
+    width = max([result[1] for _, result in kept], default=pixels or 0)
+
+    report = {
+        "names": np.array([name for name, _ in kept]),
+        "frames": np.array([result[0] for _, result in kept], dtype=np.int64),
+        "pixels": np.array([result[1] for _, result in kept], dtype=np.int64),
+    }
+    for metric in PIXEL_METRICS:
+        report[metric] = np.full((len(kept), width), np.nan)
+        for row, (_, (_, num_pixels, statistics)) in enumerate(kept):
+            report[metric][row, :num_pixels] = statistics[metric]
+
+    return report
+
+
+def summarise(report, order=FILTER_ORDER):
+    # One row per file: frames, pixels, mean and worst relative error unfiltered and filtered, mean brightness
+    with np.errstate(invalid='ignore'):
+        filtered = report["relative_error_filtered"][:, order:]
+
+        return np.column_stack([
+            report["frames"],
+            report["pixels"],
+            np.nanmean(report["relative_error"], axis=1),
+            np.nanmax(report["relative_error"], axis=1),
+            np.nanmean(filtered, axis=1),
+            np.nanmax(filtered, axis=1),
+            np.nanmean(report["average"], axis=1),
+        ]) if len(report["names"]) else np.empty((0, 7))
+
+
+def write_report(report, filename="repeatability", order=FILTER_ORDER):
+    # results/<filename>.npz keeps the per-pixel matrices, results/<filename>.txt the per-file table
+    os.makedirs("results", exist_ok=True)
+    np.savez(os.path.join("results", filename + ".npz"), **report)
+
+    with open(os.path.join("results", filename + ".txt"), 'w') as file:
+        file.write("%-20s %8s %7s %12s %12s %12s %12s %12s\n" % (
+            "file", "frames", "pixels", "err_mean%", "err_max%", "filt_mean%", "filt_max%", "brightness"))
+        for name, row in zip(report["names"], summarise(report, order)):
+            file.write("%-20s %8d %7d %12.4f %12.4f %12.4f %12.4f %12.2f\n" % ((name,) + tuple(row)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Repeatability statistics of every capture in a Samples directory")
+    parser.add_argument("directory", nargs="?", default="./Samples", help="directory with the capture .txt files")
+    parser.add_argument("--pixels", type=int, default=None,
+                        help="pixels per frame (default: 128 for Sample_ files, 1500 otherwise)")
+    parser.add_argument("--order", type=int, default=FILTER_ORDER, help="moving average filter length")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("-o", "--output", default="repeatability", help="report name inside results/")
+    args = parser.parse_args()
+
+    write_report(batch_repeatability(args.directory, args.pixels, args.order, args.workers), args.output, args.order)
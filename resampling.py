@@ -0,0 +1,86 @@
+import numpy as np
+
+from sample_set import SampleSet, AngleAxis, DERIVED_DTYPE
+
+_operators = {}  # Interpolation operators by (geometry, target grid), built once per process
+
+
+def sensor_angles(geometry):
+    # Angle (degrees) seen by every pixel, as in the Octave scripts:
+    # angleMax = atan(sensorLength / distanceFromPDA), angles = -(angleMax - step):step:angleMax
+    # Profiles with their own angle axis (e.g. exported Mie curves) are simply at those angles.
+    if isinstance(geometry, AngleAxis):
+        return np.asarray(geometry.angles, dtype=np.float64)
+
+    angle_max = np.degrees(np.arctan(geometry.sensor_length / geometry.distance))
+    step = 2 * angle_max / geometry.pixels
+
+    return -(angle_max - step) + step * np.arange(geometry.pixels)
+
+
+def common_grid(geometries, points=None):
+    # Angle range every geometry covers, sampled as finely as the finest sensor unless points is given
+    if None in geometries:
+        raise ValueError("A profile has neither a sensor geometry nor an angle axis, its angles are unknown")
+    angles = [sensor_angles(geometry) for geometry in set(geometries)]
+    start = max(angle[0] for angle in angles)
+    stop = min(angle[-1] for angle in angles)
+    if points is None:
+        step = min(angle[1] - angle[0] for angle in angles)
+        points = int(np.floor((stop - start) / step)) + 1
+
+    return np.linspace(start, stop, points)
+
+
+def interpolation_operator(geometry, target_grid):
+    # Sparse (target points x pixels) matrix of linear interpolation weights, two non-zeros per row.
+    # Targets outside the sensor's angles take the value of the nearest edge pixel.
+    target_grid = np.asarray(target_grid, dtype=np.float64)
+    key = (geometry, target_grid.tobytes())
+    if key in _operators:
+        return _operators[key]
+
+    angles = sensor_angles(geometry)
+    left = np.clip(np.searchsorted(angles, target_grid) - 1, 0, len(angles) - 2)
+    weights = np.clip((target_grid - angles[left]) / (angles[left + 1] - angles[left]), 0, 1)
+
+    rows = np.repeat(np.arange(len(target_grid)), 2)
+    columns = np.stack((left, left + 1), axis=1).ravel()
+    values = np.stack((1 - weights, weights), axis=1).ravel()
+    from scipy import sparse
+    operator = sparse.csr_matrix((values, (rows, columns)), shape=(len(target_grid), len(angles)))
+
+    _operators[key] = operator
+    return operator
+
+
+def resample(sample_set, target_grid, default_geometry=None):
+    # Map every row onto the common angle grid. Rows are grouped by geometry and every group is resampled
+    # with a single sparse matrix product. Rows without a geometry use default_geometry.
+    target_grid = np.asarray(target_grid, dtype=np.float64)
+    resampled = np.empty((len(sample_set), len(target_grid)), dtype=DERIVED_DTYPE)
+
+    geometries = [geometry or default_geometry for geometry in sample_set.geometries]
+    if None in geometries:
+        raise ValueError("Row %r has neither a sensor geometry nor an angle axis"
+                         % sample_set.names[geometries.index(None)])
+
+    for geometry in set(geometries):
+        rows = np.array([i for i, row_geometry in enumerate(geometries) if row_geometry == geometry])
+        values = np.asarray(sample_set.values[rows, :geometry.pixels], dtype=np.float64)
+        resampled[rows] = (interpolation_operator(geometry, target_grid) @ values.T).T
+
+    return SampleSet(resampled, sample_set.names, np.full(len(sample_set), len(target_grid)),
+                     [None] * len(sample_set))
+
+
+def resample_to_common_grid(sample_sets, points=None):
+    # Resample several sets (e.g. templates and captures from different sensors) onto one shared grid
+    for sample_set in sample_sets:
+        if None in sample_set.geometries:
+            raise ValueError("Row %r has neither a sensor geometry nor an angle axis"
+                             % sample_set.names[sample_set.geometries.index(None)])
+
+    grid = common_grid([geometry for sample_set in sample_sets for geometry in sample_set.geometries], points)
+
+    return grid, [resample(sample_set, grid) for sample_set in sample_sets]
@@ -0,0 +1,225 @@
+import os
+import glob
+import hashlib
+import argparse
+
+import numpy as np
+
+from instrumentation import stage
+from sample_set import SampleSet, LabelledMatrix, as_sample_set
+from sanitised_store import index_file_path, read_index, write_sanitised_binary, append_sanitised_binary, \
+    overwrite_sanitised_rows
+
+RESULTS_STORE_DIRECTORY = os.path.join("results", "store")
+RESULTS_DTYPE = np.float64  # Metric values keep full precision
+
+# Every metric is one file in the sanitised data format (see sanitised_store.py): a row-major matrix with
+# one row per experimental sample and one column per theoretical template, plus a JSON index that names
+# the rows. The index also holds the template labels, the run parameters and which end of the scale is
+# the best match. Samples are rows so that a new batch of captures is appended without rewriting the
+# results of earlier batches. When the profiles a matrix was computed from are given, the index also keeps a
+# fingerprint of the template values and of every sample row, so a sample whose profile changed under the
+# same name is rewritten instead of keeping its stale values.
+
+
+class StoredRunMismatch(ValueError):
+    # New results that cannot be merged with the stored ones: other templates or other run parameters
+    pass
+
+
+def _to_builtin(value):
+    # Run parameters go into the JSON index, numpy scalars and tuples are turned into plain values
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _to_builtin(item) for key, item in value.items()}
+
+    return value
+
+
+def fingerprint(values):
+    # Hash of the profile values as float64, the precision every metric computes in
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    digest = hashlib.sha1(repr(values.shape).encode())
+    digest.update(values.tobytes())
+
+    return digest.hexdigest()
+
+
+class ResultsStore:
+
+    def __init__(self, directory=RESULTS_STORE_DIRECTORY):
+        self.directory = directory
+
+    def metric_file(self, name):
+        return os.path.join(self.directory, name + ".bin")
+
+    def metrics(self):
+        return sorted(os.path.splitext(os.path.basename(path))[0]
+                      for path in glob.glob(os.path.join(self.directory, "*.json")))
+
+    def __contains__(self, name):
+        return os.path.exists(index_file_path(self.metric_file(name)))
+
+    def index(self, name):
+        return read_index(self.metric_file(name))
+
+    def samples(self, name):
+        return [row["name"] for row in self.index(name)["rows"]] if name in self else []
+
+    def missing(self, name, sample_names):
+        # Samples that still have to be computed for this metric
+        stored = set(self.samples(name))
+        return [sample for sample in sample_names if sample not in stored]
+
+    def write(self, name, matrix, parameters=None, replace=False, inputs=None):
+        # matrix is a theoretical x experimental LabelledMatrix and inputs the (theoretical, experimental)
+        # profiles it was computed from. Unless replace is set, new samples are appended to earlier results
+        # and stored samples are rewritten in place, except those whose profile fingerprint is unchanged.
+        # Without inputs every stored sample of the matrix is rewritten. Returns the number of rows written.
+        parameters = _to_builtin(parameters or {})
+        file_path = self.metric_file(name)
+
+        templates_fingerprint, row_fingerprints = None, [None] * matrix.shape[1]
+        if inputs is not None:
+            theoretical_data, experimental_data = (as_sample_set(data) for data in inputs)
+            templates_fingerprint = fingerprint(theoretical_data.values)
+            row_fingerprints = [fingerprint(row) for row in experimental_data.values]
+
+        if replace or name not in self:
+            os.makedirs(self.directory, exist_ok=True)
+            write_sanitised_binary(self._rows(matrix, range(matrix.shape[1])), file_path, RESULTS_DTYPE, {
+                "metric": matrix.metric or name,
+                "higher_is_better": None if matrix.higher_is_better is None else bool(matrix.higher_is_better),
+                "column_labels": [str(label) for label in matrix.row_labels],
+                "templates_fingerprint": templates_fingerprint,
+                "parameters": parameters,
+            }, [{"fingerprint": row} for row in row_fingerprints])
+            return matrix.shape[1]
+
+        index = self.index(name)
+        if [str(label) for label in matrix.row_labels] != index["column_labels"]:
+            raise StoredRunMismatch("Templates of %s do not match the stored ones, write it with replace=True" % name)
+        stored_fingerprint = index.get("templates_fingerprint")
+        if templates_fingerprint and stored_fingerprint and templates_fingerprint != stored_fingerprint:
+            raise StoredRunMismatch("Template values of %s differ from the stored run (e.g. log and linear templates), "
+                             "write it with replace=True" % name)
+        if parameters != index["parameters"]:
+            raise StoredRunMismatch("Parameters of %s (%s) differ from the stored run (%s), write it with replace=True"
+                             % (name, parameters, index["parameters"]))
+
+        # Latest stored row of every sample name
+        stored = {row["name"]: (position, row.get("fingerprint")) for position, row in enumerate(index["rows"])}
+        new_columns, changed_columns, changed_positions = [], [], []
+        for j, label in enumerate(matrix.column_labels):
+            if str(label) not in stored:
+                new_columns.append(j)
+                continue
+
+            position, stored_row = stored[str(label)]
+            if row_fingerprints[j] is None or row_fingerprints[j] != stored_row:
+                changed_columns.append(j)
+                changed_positions.append(position)
+
+        if changed_columns:
+            overwrite_sanitised_rows(self._rows(matrix, changed_columns), changed_positions, file_path,
+                                     [{"fingerprint": row_fingerprints[j]} for j in changed_columns])
+        if new_columns:
+            append_sanitised_binary(self._rows(matrix, new_columns), file_path,
+                                    [{"fingerprint": row_fingerprints[j]} for j in new_columns])
+
+        return len(new_columns) + len(changed_columns)
+
+    def _rows(self, matrix, columns):
+        columns = list(columns)
+        values = np.asarray(matrix.values)[:, columns].T
+
+        return SampleSet(values, [str(matrix.column_labels[j]) for j in columns], geometries=[None] * len(columns))
+
+    def load(self, name):
+        # Back as a theoretical x experimental LabelledMatrix, the values stay memory-mapped
+        index = self.index(name)
+        rows = index["rows"]
+        shape = (len(rows), index["columns"])
+
+        if len(rows) == 0:
+            values = np.empty(shape, dtype=index["dtype"])
+        else:
+            values = np.memmap(self.metric_file(name), dtype=index["dtype"], mode="r", shape=shape)
+
+        return LabelledMatrix(values.T, index["column_labels"], [row["name"] for row in rows],
+                              index["metric"], index["higher_is_better"])
+
+    def parameters(self, name):
+        return self.index(name)["parameters"]
+
+    def best_templates(self, name, k=1):
+        # {sample: [(template, value), ...]} with the k best templates of every stored sample
+        return self.load(name).best_matches(k)
+
+    def sample(self, sample_name, metrics=None):
+        # {metric: {template: value}} for one sample. A sample stored more than once gives its latest row.
+        results = {}
+
+        for name in metrics or self.metrics():
+            index = self.index(name)
+            names = [row["name"] for row in index["rows"]]
+            if sample_name not in names:
+                continue
+
+            row = len(names) - 1 - names[::-1].index(sample_name)
+            values = self.load(name).values[:, row]
+            results[name] = dict(zip(index["column_labels"], values.tolist()))
+
+        return results
+
+    def export_text(self, name, filename=None):
+        # The old results/<metric>_results.txt layout, one value per line in theoretical x experimental order
+        filename = filename or os.path.join("results", name + "_results.txt")
+        with open(filename, "w") as file:
+            for value in self.load(name).pairs().tolist():
+                file.write(str(value) + "\n")
+
+        return filename
+
+
+@stage()
+def store_results(name, matrix, parameters=None, replace=False, directory=RESULTS_STORE_DIRECTORY, inputs=None):
+    return ResultsStore(directory).write(name, matrix, parameters, replace, inputs)
+
+
+if __name__ == "__main__":
+    # Usage: python results_store.py [--store DIRECTORY] [best METRIC | sample NAME | export METRIC]
+    parser = argparse.ArgumentParser(description="List and query the stored analysis results")
+    parser.add_argument("--store", default=RESULTS_STORE_DIRECTORY, help="results store directory")
+    commands = parser.add_subparsers(dest="command")
+    best = commands.add_parser("best", help="best template of every sample")
+    best.add_argument("metric")
+    best.add_argument("-k", type=int, default=1, help="number of templates per sample")
+    sample = commands.add_parser("sample", help="every stored metric of one sample")
+    sample.add_argument("name")
+    export = commands.add_parser("export", help="write a metric in the old one value per line text layout")
+    export.add_argument("metric")
+    args = parser.parse_args()
+
+    store = ResultsStore(args.store)
+
+    if args.command == "best":
+        try:
+            best = store.best_templates(args.metric, args.k)
+        except ValueError as error:
+            parser.error(str(error))
+        for sample_name, matches in best.items():
+            print("%s: %s" % (sample_name, ", ".join("%s (%g)" % match for match in matches)))
+    elif args.command == "sample":
+        for name, values in store.sample(args.name).items():
+            print(name)
+            for template, value in values.items():
+                print("    %-20s %g" % (template, value))
+    elif args.command == "export":
+        print(store.export_text(args.metric))
+    else:
+        for name in store.metrics():
+            print("%-20s %6d samples  %s" % (name, len(store.samples(name)), store.parameters(name)))
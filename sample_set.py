@@ -0,0 +1,198 @@
+import os
+from collections import namedtuple
+
+import numpy as np
+
+# Sensor setup a profile was captured with: pixel count, sensor length and distance from the object in centimetres
+SensorGeometry = namedtuple("SensorGeometry", ["pixels", "sensor_length", "distance"])
+
+SAPPHO_GEOMETRY = SensorGeometry(1500, 1.1, 3.5)  # Sappho_XXXXX.txt captures
+SAMPLE_GEOMETRY = SensorGeometry(128, 0.812, 3.5)  # Sample_XXXXX.txt captures
+
+
+class AngleAxis(namedtuple("AngleAxis", ["angles"])):
+    # Angle (degrees) of every point of a profile that does not come from a known sensor, e.g. a Mie curve
+    # exported with its scattering angles. Takes the place of a SensorGeometry in a row's metadata.
+    __slots__ = ()
+
+    @property
+    def pixels(self):
+        return len(self.angles)
+
+
+RAW_DTYPE = np.uint16  # Readings straight from the sensor
+DERIVED_DTYPE = np.float32  # Averaged, normalized and transformed profiles
+
+
+def geometry_for_pixels(pixels):
+    # Best guess of the setup when only the pixel count is known
+    for geometry in (SAPPHO_GEOMETRY, SAMPLE_GEOMETRY):
+        if geometry.pixels == pixels:
+            return geometry
+
+    return None
+
+
+def capture_pixels(file_path):
+    # Sample_XXXXX.txt captures come from the 128 pixel sensor, everything else from the Sappho one
+    if os.path.basename(file_path).startswith("Sample_"):
+        return SAMPLE_GEOMETRY.pixels
+
+    return SAPPHO_GEOMETRY.pixels
+
+
+class SampleSet:
+    # A batch of profiles kept as one 2D array (one row per frame or profile) plus per-row metadata
+
+    def __init__(self, values, names=None, pixels=None, geometries=None):
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values.reshape(1, -1)
+
+        num_rows, num_columns = values.shape
+        if names is None:
+            names = [str(i) for i in range(num_rows)]
+        if pixels is None:
+            pixels = np.full(num_rows, num_columns)
+        if geometries is None:
+            geometries = [geometry_for_pixels(pixel_count) for pixel_count in np.asarray(pixels).tolist()]
+
+        if not len(names) == len(pixels) == len(geometries) == num_rows:
+            raise ValueError("Metadata length does not match the number of rows (%d)" % num_rows)
+
+        self.values = values
+        self.names = list(names)
+        self.pixels = np.asarray(pixels, dtype=np.int32)
+        self.geometries = list(geometries)
+
+    @classmethod
+    def from_rows(cls, rows, names=None, dtype=DERIVED_DTYPE, geometries=None):
+        # Build a set from equally long rows, e.g. the hard-coded Mie curves
+        return cls(np.array(rows, dtype=dtype), names=names, geometries=geometries)
+
+    @classmethod
+    def concatenate(cls, sample_sets):
+        sample_sets = list(sample_sets)
+        names = [name for sample_set in sample_sets for name in sample_set.names]
+        geometries = [geometry for sample_set in sample_sets for geometry in sample_set.geometries]
+
+        return cls(np.concatenate([sample_set.values for sample_set in sample_sets]), names,
+                   np.concatenate([sample_set.pixels for sample_set in sample_sets]), geometries)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __getitem__(self, index):
+        # An integer gives a single row, anything else (slice, mask, index list) gives a smaller set
+        if isinstance(index, (int, np.integer)):
+            return self.values[index]
+
+        rows = np.arange(len(self))[index]
+        return SampleSet(self.values[rows], [self.names[i] for i in rows], self.pixels[rows],
+                         [self.geometries[i] for i in rows])
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.values
+        return self.values.astype(dtype, copy=False)
+
+    def __repr__(self):
+        return "SampleSet(%d rows x %d columns, %s)" % (self.shape[0], self.shape[1], self.dtype)
+
+    def writable(self):
+        # Derived data is always float32 and owned by the set so it can be changed in place
+        if self.values.dtype != DERIVED_DTYPE or not self.values.flags.writeable:
+            self.values = np.array(self.values, dtype=DERIVED_DTYPE)
+
+        return self.values
+
+    def copy(self):
+        return SampleSet(self.values.copy(), list(self.names), self.pixels.copy(), list(self.geometries))
+
+
+def as_sample_set(data, names=None):
+    # Lets every stage also take plain nested lists. float64 arrays keep their precision, so the float64
+    # engines see exactly the values they were given; lists and other arrays become DERIVED_DTYPE.
+    if isinstance(data, SampleSet):
+        return data
+
+    dtype = np.float64 if isinstance(data, np.ndarray) and data.dtype == np.float64 else DERIVED_DTYPE
+    return SampleSet.from_rows(data, names=names, dtype=dtype)
+
+
+class LabelledMatrix:
+    # Result of comparing every theoretical profile (rows) with every experimental profile (columns).
+    # higher_is_better tells which end of the scale is the best match (True for R², False for distances), None
+    # marks values that describe a pair without ranking it, like the lag of the cross-correlation peak.
+
+    def __init__(self, values, row_labels, column_labels, metric=None, higher_is_better=True):
+        values = np.asarray(values)
+        if values.shape != (len(row_labels), len(column_labels)):
+            raise ValueError("Matrix shape %s does not match %d x %d labels"
+                             % (values.shape, len(row_labels), len(column_labels)))
+
+        self.values = values
+        self.row_labels = list(row_labels)
+        self.column_labels = list(column_labels)
+        self.metric = metric
+        self.higher_is_better = higher_is_better
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.values
+        return self.values.astype(dtype, copy=False)
+
+    def __repr__(self):
+        return "LabelledMatrix(%s, %d x %d)" % (self.metric, self.shape[0], self.shape[1])
+
+    def row(self, label):
+        return self.values[self.row_labels.index(label)]
+
+    def column(self, label):
+        return self.values[:, self.column_labels.index(label)]
+
+    def pairs(self):
+        # Flat values in the order of the old theoretical x experimental double loops
+        return self.values.ravel()
+
+    def top_k(self, k=1):
+        # Indices and values of the k best matching rows for every column, best first: both (k x columns)
+        if self.higher_is_better is None:
+            raise ValueError("%s does not rank templates" % (self.metric or "This matrix"))
+
+        k = min(k, self.shape[0])
+        scores = -self.values if self.higher_is_better else self.values
+        scores = np.where(np.isnan(scores), np.inf, scores)
+
+        candidates = np.argpartition(scores, k - 1, axis=0)[:k] if k < self.shape[0] else \
+            np.broadcast_to(np.arange(self.shape[0])[:, None], self.shape)
+        order = np.argsort(np.take_along_axis(scores, candidates, axis=0), axis=0, kind="stable")
+        indices = np.take_along_axis(candidates, order, axis=0)
+
+        return indices, np.take_along_axis(self.values, indices, axis=0)
+
+    def best_matches(self, k=1):
+        # {column label: [(row label, value), ...]} with the k best rows per column
+        indices, values = self.top_k(k)
+
+        return {label: [(self.row_labels[i], value) for i, value in zip(indices[:, j].tolist(), values[:, j].tolist())]
+                for j, label in enumerate(self.column_labels)}
@@ -0,0 +1,173 @@
+import os
+import sys
+import json
+
+import numpy as np
+
+from sample_set import SampleSet, SensorGeometry, AngleAxis, DERIVED_DTYPE
+
+# A sanitised data file is a plain row-major matrix of averaged profiles (float32 or float64) next to a
+# small JSON index with the same name that describes it: dtype, row length and one entry per row with the
+# source file name, pixel count and sensor geometry (or angle axis). New rows are appended to the end of
+# the matrix and the index is rewritten, earlier rows are only ever rewritten in place by
+# overwrite_sanitised_rows.
+FORMAT_NAME = "sappho-sanitised"
+FORMAT_VERSION = 1
+BINARY_EXTENSION = ".bin"
+
+
+def index_file_path(file_path):
+    return os.path.splitext(file_path)[0] + ".json"
+
+
+def is_binary_file(file_path):
+    return os.path.splitext(file_path)[1] == BINARY_EXTENSION
+
+
+def _row_entries(sample_set, row_metadata=None):
+    # row_metadata holds extra entries for every row, like metadata does for the whole index
+    entries = []
+    for name, pixels, geometry in zip(sample_set.names, sample_set.pixels, sample_set.geometries):
+        entry = {"name": name, "pixels": int(pixels), "geometry": None}
+        if isinstance(geometry, AngleAxis):
+            entry["angles"] = [float(angle) for angle in geometry.angles]
+        elif geometry:
+            entry["geometry"] = list(geometry)
+        entries.append(entry)
+    for entry, extra in zip(entries, row_metadata or []):
+        entry.update(extra)
+
+    return entries
+
+
+def read_index(file_path):
+    with open(index_file_path(file_path), "r") as file:
+        index = json.load(file)
+
+    if index.get("format") != FORMAT_NAME:
+        raise ValueError("%s is not a sanitised data index" % index_file_path(file_path))
+    if index["version"] > FORMAT_VERSION:
+        raise ValueError("%s was written by a newer version (%d)" % (file_path, index["version"]))
+
+    return index
+
+
+def _write_index(file_path, index):
+    # The index is replaced in one step, rows appended by an interrupted run are simply not listed
+    temporary_path = index_file_path(file_path) + ".tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(index, file)
+    os.replace(temporary_path, index_file_path(file_path))
+
+
+def write_sanitised_binary(sample_set, output_file="sanitised_data.bin", dtype=DERIVED_DTYPE, metadata=None,
+                           row_metadata=None):
+    # metadata holds extra index entries of files that reuse the format, e.g. the results store
+    dtype = np.dtype(dtype)
+
+    with open(output_file, "wb") as file:
+        file.write(np.ascontiguousarray(sample_set.values, dtype=dtype).tobytes())
+
+    index = dict(metadata or {})
+    index.update({"format": FORMAT_NAME, "version": FORMAT_VERSION, "dtype": dtype.str,
+                  "columns": int(sample_set.shape[1]), "rows": _row_entries(sample_set, row_metadata)})
+    _write_index(output_file, index)
+
+
+def append_sanitised_binary(sample_set, output_file="sanitised_data.bin", row_metadata=None):
+    if not os.path.exists(output_file):
+        write_sanitised_binary(sample_set, output_file, row_metadata=row_metadata)
+        return
+
+    index = read_index(output_file)
+    if sample_set.shape[1] != index["columns"]:
+        raise ValueError("Cannot append rows of %d columns to %s (%d columns)"
+                         % (sample_set.shape[1], output_file, index["columns"]))
+
+    # Drop anything past the indexed rows (left by an interrupted append) before adding the new ones
+    row_bytes = np.dtype(index["dtype"]).itemsize * index["columns"]
+    with open(output_file, "r+b") as file:
+        file.truncate(len(index["rows"]) * row_bytes)
+        file.seek(0, os.SEEK_END)
+        file.write(np.ascontiguousarray(sample_set.values, dtype=index["dtype"]).tobytes())
+
+    index["rows"].extend(_row_entries(sample_set, row_metadata))
+    _write_index(output_file, index)
+
+
+def overwrite_sanitised_rows(sample_set, positions, output_file="sanitised_data.bin", row_metadata=None):
+    # Replaces the stored rows at positions with the rows of sample_set, the rest of the file is untouched
+    index = read_index(output_file)
+    if sample_set.shape[1] != index["columns"]:
+        raise ValueError("Cannot write rows of %d columns to %s (%d columns)"
+                         % (sample_set.shape[1], output_file, index["columns"]))
+
+    row_bytes = np.dtype(index["dtype"]).itemsize * index["columns"]
+    values = np.ascontiguousarray(sample_set.values, dtype=index["dtype"])
+    entries = _row_entries(sample_set, row_metadata)
+
+    with open(output_file, "r+b") as file:
+        for row, position in enumerate(positions):
+            file.seek(position * row_bytes)
+            file.write(values[row].tobytes())
+            index["rows"][position] = entries[row]
+
+    _write_index(output_file, index)
+
+
+def load_sanitised_binary(file_path="sanitised_data.bin"):
+    # The matrix is memory-mapped, only the rows an analysis actually uses are read from disk
+    index = read_index(file_path)
+    rows = index["rows"]
+    shape = (len(rows), index["columns"])
+
+    if len(rows) == 0:
+        values = np.empty(shape, dtype=index["dtype"])
+    else:
+        values = np.memmap(file_path, dtype=index["dtype"], mode="r", shape=shape)
+
+    geometries = [AngleAxis(tuple(row["angles"])) if row.get("angles") else
+                  SensorGeometry(*row["geometry"]) if row["geometry"] else None for row in rows]
+
+    return SampleSet(values, [row["name"] for row in rows], [row["pixels"] for row in rows], geometries)
+
+
+def read_sanitised_text(file_path="sanitised_data.txt"):
+    data = []
+
+    with open(file_path, "r") as file:
+        lines = file.readlines()
+
+    for line in lines:
+        # Remove leading/trailing whitespace and brackets
+        line = line.strip().strip("[]")
+        if not line:
+            continue
+        elements = line.split(", ")
+
+        # Convert the whole line to floats at once and append it to the data list
+        data.append(np.array(elements, dtype=np.float64))
+
+    return SampleSet(np.array(data, dtype=DERIVED_DTYPE).reshape(len(data), -1))
+
+
+def load_sanitised_data(file_path):
+    if is_binary_file(file_path):
+        return load_sanitised_binary(file_path)
+
+    return read_sanitised_text(file_path)
+
+
+def convert_text_to_binary(text_file="sanitised_data.txt", output_file="sanitised_data.bin", dtype=DERIVED_DTYPE):
+    # The text format has no file names, rows keep their line number as name
+    write_sanitised_binary(read_sanitised_text(text_file), output_file, dtype)
+
+
+if __name__ == "__main__":
+    # Usage: python sanitised_store.py sanitised_data.txt [sanitised_data.bin]
+    if len(sys.argv) < 2:
+        sys.exit("Usage: python sanitised_store.py TEXT_FILE [OUTPUT_FILE]")
+
+    text_file = sys.argv[1]
+    output_file = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(text_file)[0] + BINARY_EXTENSION
+    convert_text_to_binary(text_file, output_file)
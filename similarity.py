@@ -0,0 +1,139 @@
+import numpy as np
+
+from sample_set import LabelledMatrix, as_sample_set
+
+# Metrics computed by the batched engine and whether a higher value is a better match
+METRICS = {"r2": True, "pearson": True, "euclidean": False}
+
+
+def pairwise_similarity(theoretical_data, experimental_data, metrics=tuple(METRICS), block_size=1024,
+                        max_block_bytes=1 << 27):
+    # All theoretical x experimental values of every metric, a block of experimental profiles at a time.
+    # Pearson r comes from one matrix product per block. Squared distances (for r2 and euclidean) are summed
+    # from the differences themselves: the expanded form ss_t + ss_e - 2 * cross cancels catastrophically
+    # for nearly identical profiles, which are exactly the best matches. Temporary memory stays bounded by
+    # block_size and max_block_bytes.
+    # r2 follows sklearn's r2_score(theoretical, experimental), pearson is scipy's pearsonr r.
+    theoretical_data = as_sample_set(theoretical_data)
+    experimental_data = as_sample_set(experimental_data)
+    for metric in metrics:
+        if metric not in METRICS:
+            raise ValueError("Unknown metric %r, expected one of %s" % (metric, ", ".join(METRICS)))
+
+    theoretical = np.asarray(theoretical_data.values, dtype=np.float64)
+    num_points = theoretical.shape[1]
+    if experimental_data.shape[1] != num_points:
+        raise ValueError("Profiles have different lengths (%d and %d)" % (num_points, experimental_data.shape[1]))
+
+    theoretical_mean = theoretical.mean(axis=1)
+    theoretical_centered = theoretical - theoretical_mean[:, None]
+    theoretical_ss = np.einsum("ij,ij->i", theoretical_centered, theoretical_centered)
+
+    results = {metric: np.empty((len(theoretical_data), len(experimental_data))) for metric in metrics}
+
+    for start in range(0, len(experimental_data), block_size):
+        experimental = np.asarray(experimental_data.values[start:start + block_size], dtype=np.float64)
+        columns = slice(start, start + len(experimental))
+
+        if "r2" in results or "euclidean" in results:
+            squared_distance = _squared_distances(theoretical, experimental, max_block_bytes)
+
+        if "euclidean" in results:
+            results["euclidean"][:, columns] = np.sqrt(squared_distance)
+
+        if "r2" in results:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r2 = 1 - squared_distance / theoretical_ss[:, None]
+            # Constant theoretical profiles: sklearn gives 1 for a perfect fit and 0 otherwise
+            constant = theoretical_ss == 0
+            r2[constant] = np.where(squared_distance[constant] == 0, 1.0, 0.0)
+            results["r2"][:, columns] = r2
+
+        if "pearson" in results:
+            experimental_centered = experimental - experimental.mean(axis=1)[:, None]
+            experimental_ss = np.einsum("ij,ij->i", experimental_centered, experimental_centered)
+            cross = theoretical_centered @ experimental_centered.T
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r = cross / np.sqrt(np.outer(theoretical_ss, experimental_ss))
+            results["pearson"][:, columns] = np.clip(r, -1, 1)
+
+    return {metric: LabelledMatrix(values, theoretical_data.names, experimental_data.names, metric, METRICS[metric])
+            for metric, values in results.items()}
+
+
+def _squared_distances(theoretical, experimental, max_block_bytes):
+    # Sum of squared differences of every pair, as many templates at a time as fit max_block_bytes
+    distances = np.empty((len(theoretical), len(experimental)))
+    step = max(1, max_block_bytes // max(experimental.size * 8, 1))
+
+    for start in range(0, len(theoretical), step):
+        difference = theoretical[start:start + step, None, :] - experimental[None, :, :]
+        distances[start:start + step] = np.einsum("ijk,ijk->ij", difference, difference)
+
+    return distances
+
+
+def top_k_templates(theoretical_data, experimental_data, metric="r2", k=5, block_size=1024):
+    # The k best matching templates of every sample: {sample name: [(template name, value), ...]}
+    matrix = pairwise_similarity(theoretical_data, experimental_data, (metric,), block_size)[metric]
+
+    return matrix.best_matches(k)
+
+
+def ks_matrix(theoretical_data, experimental_data, pvalues=False, block_size=256):
+    # Two-sample Kolmogorov-Smirnov statistic of every theoretical x experimental pair, same value as
+    # scipy.stats.ks_2samp. Every profile is sorted once. Values are replaced by their rank among all
+    # values so a whole block of sorted experimental rows can be searched with one searchsorted call.
+    # With pvalues, ks_2samp is called once per distinct statistic value, since the (two-sided) p-value
+    # only depends on the statistic and the two profile lengths.
+    theoretical_data = as_sample_set(theoretical_data)
+    experimental_data = as_sample_set(experimental_data)
+    theoretical = np.asarray(theoretical_data.values, dtype=np.float64)
+    experimental = np.asarray(experimental_data.values, dtype=np.float64)
+    num_theoretical, theoretical_length = theoretical.shape
+    num_experimental, experimental_length = experimental.shape
+
+    _, ranks = np.unique(np.concatenate((theoretical.ravel(), experimental.ravel())), return_inverse=True)
+    num_ranks = int(ranks.max()) + 1 if len(ranks) else 1
+    theoretical_ranks = np.sort(ranks[:theoretical.size].reshape(theoretical.shape), axis=1)
+    experimental_ranks = np.sort(ranks[theoretical.size:].reshape(experimental.shape), axis=1)
+
+    # ECDF of every theoretical profile at its own points
+    theoretical_self = np.array([np.searchsorted(row, row, side="right") for row in theoretical_ranks])
+    theoretical_self = theoretical_self / theoretical_length
+
+    statistics = np.empty((num_theoretical, num_experimental))
+
+    for start in range(0, num_experimental, block_size):
+        block = experimental_ranks[start:start + block_size]
+        offsets = (np.arange(len(block)) * num_ranks)[:, None]
+        keys = (block + offsets).ravel()  # Rows stay sorted and never overlap once offset
+        starts = np.arange(len(block))[:, None] * experimental_length
+
+        # ECDF of every experimental profile at its own points
+        experimental_self = (np.searchsorted(keys, keys, side="right").reshape(block.shape) - starts) / \
+            experimental_length
+
+        for i, row in enumerate(theoretical_ranks):
+            # Theoretical ECDF at the experimental points and experimental ECDFs at the theoretical points
+            theoretical_at_experimental = np.searchsorted(row, block, side="right") / theoretical_length
+            experimental_at_theoretical = (np.searchsorted(keys, (row + offsets).ravel(), side="right")
+                                           .reshape(len(block), theoretical_length) - starts) / experimental_length
+
+            statistics[i, start:start + len(block)] = np.maximum(
+                np.abs(theoretical_at_experimental - experimental_self).max(axis=1),
+                np.abs(theoretical_self[i] - experimental_at_theoretical).max(axis=1))
+
+    names = theoretical_data.names, experimental_data.names
+    results = {"statistic": LabelledMatrix(statistics, *names, metric="ks_statistic", higher_is_better=False)}
+
+    if pvalues:
+        from scipy.stats import ks_2samp
+
+        distinct, first, inverse = np.unique(statistics, return_index=True, return_inverse=True)
+        representatives = zip(*np.unravel_index(first, statistics.shape))
+        distinct_pvalues = np.array([ks_2samp(theoretical[i], experimental[j]).pvalue for i, j in representatives])
+        results["pvalue"] = LabelledMatrix(distinct_pvalues[inverse].reshape(statistics.shape), *names,
+                                           metric="ks_pvalue", higher_is_better=True)
+
+    return results
@@ -0,0 +1,225 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from sample_set import LabelledMatrix, as_sample_set
+
+SPECTRA_CACHE_DIRECTORY = ".spectra_cache"  # Segment spectra of template sets, keyed by data and parameters
+MEMORY_CACHE_SIZE = 32  # Spectra sets kept in memory by a long running process
+
+_memory_cache = OrderedDict()
+_memory_lock = threading.Lock()  # The analysis worker serves requests from several threads
+
+
+def segment_parameters(num_points, nperseg, noverlap):
+    # Same adjustments as scipy.signal.csd: segments longer than the signal are shortened to it
+    nperseg = min(nperseg, num_points)
+    noverlap = nperseg // 2 if noverlap is None else noverlap
+    if noverlap >= nperseg:
+        raise ValueError("noverlap (%d) must be less than nperseg (%d)" % (noverlap, nperseg))
+
+    return nperseg, noverlap
+
+
+def segment_spectra(values, nperseg=256, window="hann", noverlap=None):
+    # Windowed FFT of every Welch segment of every row: (rows x segments x frequencies).
+    # Segments are mean-detrended like scipy.signal.csd's default.
+    values = np.asarray(values, dtype=np.float64)
+    nperseg, noverlap = segment_parameters(values.shape[1], nperseg, noverlap)
+    step = nperseg - noverlap
+
+    segments = np.lib.stride_tricks.sliding_window_view(values, nperseg, axis=1)[:, ::step]
+    segments = segments - segments.mean(axis=2, keepdims=True)
+    from scipy.signal import get_window
+    segments *= get_window(window, nperseg)
+
+    return np.fft.rfft(segments, axis=2)
+
+
+def _spectra_key(values, nperseg, window, noverlap):
+    digest = hashlib.sha1()
+    digest.update(repr((values.shape, values.dtype.str, nperseg, window, noverlap)).encode())
+    digest.update(np.ascontiguousarray(values).tobytes())
+
+    return digest.hexdigest()
+
+
+def cached_segment_spectra(values, nperseg=256, window="hann", noverlap=None, cache_dir=SPECTRA_CACHE_DIRECTORY):
+    # segment_spectra computed once per set of signals and parameters, then reused from memory or disk
+    values = np.asarray(values)
+    key = _spectra_key(values, nperseg, window, noverlap)
+
+    with _memory_lock:
+        if key in _memory_cache:
+            _memory_cache.move_to_end(key)
+            return _memory_cache[key]
+
+    cache_path = os.path.join(cache_dir, key + ".npy") if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        spectra = np.load(cache_path, mmap_mode="r")
+    else:
+        spectra = segment_spectra(values, nperseg, window, noverlap)
+        if cache_path:
+            os.makedirs(cache_dir, exist_ok=True)
+            temporary_path = "%s.%d.tmp" % (cache_path, os.getpid())
+            with open(temporary_path, "wb") as file:
+                np.save(file, spectra)
+            os.replace(temporary_path, cache_path)
+
+    with _memory_lock:
+        _memory_cache[key] = spectra
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+    return spectra
+
+
+def coherence_matrix(theoretical_data, experimental_data, nperseg=256, window="hann", noverlap=None,
+                     cache_dir=SPECTRA_CACHE_DIRECTORY, max_block_bytes=1 << 27):
+    # Mean magnitude squared coherence of every theoretical x experimental pair.
+    # The template spectra are computed once (and cached), each block of experimental signals then gets all
+    # its cross spectra from one batched matrix product per frequency. Equivalent to averaging
+    # |Pxy|^2 / (Pxx * Pyy) from scipy.signal.csd with the same nperseg, window and noverlap: when the
+    # lengths differ, Pxy is taken over both signals zero-padded to the longer one like csd does, while
+    # Pxx and Pyy are each taken over their own signal.
+    theoretical_data = as_sample_set(theoretical_data)
+    experimental_data = as_sample_set(experimental_data)
+    theoretical_length, experimental_length = theoretical_data.shape[1], experimental_data.shape[1]
+    num_points = max(theoretical_length, experimental_length)
+
+    # The auto and cross spectra must share their frequencies, so segments cannot be shortened for either side
+    cross_nperseg = segment_parameters(num_points, nperseg, noverlap)[0]
+    if min(theoretical_length, experimental_length) < cross_nperseg:
+        raise ValueError("Coherence of %d and %d point profiles needs nperseg <= %d, got %d"
+                         % (theoretical_length, experimental_length, min(theoretical_length, experimental_length),
+                            nperseg))
+
+    # Only the templates are cached: they are reused by every run and every request, while samples change
+    # from run to run and would make the caches grow without bound
+    theoretical = _zero_padded(theoretical_data.values, num_points)
+    theoretical_spectra = cached_segment_spectra(theoretical, nperseg, window, noverlap, cache_dir)
+    if theoretical_length != num_points:
+        theoretical_power = _mean_power(cached_segment_spectra(theoretical_data.values, nperseg, window, noverlap,
+                                                               cache_dir))
+    else:
+        theoretical_power = _mean_power(theoretical_spectra)
+
+    # (frequencies x theoretical x segments)
+    theoretical_by_frequency = np.conj(theoretical_spectra).transpose(2, 0, 1)
+    num_frequencies, num_theoretical, num_segments = theoretical_by_frequency.shape
+
+    coherences = np.empty((num_theoretical, len(experimental_data)))
+
+    # Samples are processed in blocks whose segments, spectra, cross spectra and coherences fit max_block_bytes,
+    # whatever the number of samples and the size of the template bank
+    segment_bytes = num_segments * (cross_nperseg * 8 + num_frequencies * 16)
+    if experimental_length != num_points:
+        segment_bytes *= 2  # The unpadded samples have their own segments for the auto spectra
+    block_size = max(1, max_block_bytes // (num_frequencies * num_theoretical * 24 + segment_bytes))
+    for start in range(0, len(experimental_data), block_size):
+        block = np.asarray(experimental_data.values[start:start + block_size], dtype=np.float64)
+        experimental_spectra = segment_spectra(_zero_padded(block, num_points), nperseg, window, noverlap)
+        if experimental_length != num_points:
+            experimental_power = _mean_power(segment_spectra(block, nperseg, window, noverlap))
+        else:
+            experimental_power = _mean_power(experimental_spectra)
+
+        cross = theoretical_by_frequency @ experimental_spectra.transpose(2, 1, 0) / num_segments
+        del experimental_spectra
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coherence = np.abs(cross) ** 2 / (theoretical_power[:, :, None] * experimental_power[:, None, :])
+
+        coherences[:, start:start + len(block)] = coherence.mean(axis=0)
+
+    return LabelledMatrix(coherences, theoretical_data.names, experimental_data.names, "coherence", True)
+
+
+def _zero_padded(values, num_points):
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[1] == num_points:
+        return values
+
+    return np.pad(values, ((0, 0), (0, num_points - values.shape[1])))
+
+
+def _mean_power(spectra):
+    # Welch average of the auto spectra, (frequencies x signals)
+    return (np.abs(spectra) ** 2).mean(axis=1).T
+
+
+def cross_correlation_summary(theoretical_data, experimental_data, normalize=False, max_lag=None,
+                              curves_file=None, max_block_bytes=1 << 27):
+    # Cross-correlation of every theoretical x experimental pair through one batched rfft product.
+    # Lags follow scipy.signal.correlate(theoretical, experimental, mode="full"): lag k compares
+    # theoretical[i + k] with experimental[i]. With normalize each profile is mean-centered and scaled to
+    # unit norm, so the zero-lag value is the Pearson r. max_lag keeps only lags in [-max_lag, max_lag].
+    # Returns {"peak", "lag", "zero_lag"} labelled matrices. With curves_file the kept part of every curve
+    # is also written to a (theoretical x experimental x lags) .npy file.
+    theoretical_data = as_sample_set(theoretical_data)
+    experimental_data = as_sample_set(experimental_data)
+
+    theoretical = np.asarray(theoretical_data.values, dtype=np.float64)
+    experimental = np.asarray(experimental_data.values, dtype=np.float64)
+    if normalize:
+        theoretical = _unit_centered(theoretical)
+        experimental = _unit_centered(experimental)
+
+    theoretical_length, experimental_length = theoretical.shape[1], experimental.shape[1]
+    first_lag, last_lag = -(experimental_length - 1), theoretical_length - 1
+    if max_lag is not None:
+        first_lag, last_lag = max(first_lag, -max_lag), min(last_lag, max_lag)
+    lags = np.arange(first_lag, last_lag + 1)
+
+    # Circular correlation is long enough to hold every linear lag, negative lags wrap to the end
+    from scipy.fft import next_fast_len
+    fft_length = next_fast_len(theoretical_length + experimental_length - 1, real=True)
+    lag_positions = lags % fft_length
+
+    theoretical_spectra = np.fft.rfft(theoretical, fft_length, axis=1)
+    experimental_spectra = np.conj(np.fft.rfft(experimental, fft_length, axis=1))
+
+    num_theoretical, num_experimental = len(theoretical), len(experimental)
+    peaks = np.empty((num_theoretical, num_experimental))
+    peak_lags = np.empty((num_theoretical, num_experimental), dtype=np.int64)
+    zero_lags = np.empty((num_theoretical, num_experimental))
+    zero_position = np.flatnonzero(lags == 0)
+
+    curves = None
+    if curves_file:
+        curves = np.lib.format.open_memmap(curves_file, mode="w+", dtype=np.float64,
+                                           shape=(num_theoretical, num_experimental, len(lags)))
+
+    # Experimental profiles are processed in blocks small enough that the curves of a block fit max_block_bytes
+    block_size = max(1, max_block_bytes // (num_theoretical * fft_length * 8))
+    for start in range(0, num_experimental, block_size):
+        columns = slice(start, start + block_size)
+
+        correlation = np.fft.irfft(theoretical_spectra[:, None, :] * experimental_spectra[None, columns, :],
+                                   fft_length, axis=2)[:, :, lag_positions]
+
+        peak_positions = correlation.argmax(axis=2)
+        peaks[:, columns] = np.take_along_axis(correlation, peak_positions[:, :, None], axis=2)[:, :, 0]
+        peak_lags[:, columns] = lags[peak_positions]
+        zero_lags[:, columns] = correlation[:, :, zero_position[0]] if len(zero_position) else np.nan
+
+        if curves is not None:
+            curves[:, columns] = correlation
+
+    if curves is not None:
+        curves.flush()
+
+    names = theoretical_data.names, experimental_data.names
+    return {"peak": LabelledMatrix(peaks, *names, metric="xcorr_peak", higher_is_better=True),
+            "lag": LabelledMatrix(peak_lags, *names, metric="xcorr_lag", higher_is_better=None),
+            "zero_lag": LabelledMatrix(zero_lags, *names, metric="xcorr_zero_lag", higher_is_better=True)}
+
+
+def _unit_centered(values):
+    centered = values - values.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(centered, axis=1, keepdims=True)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return centered / norms
@@ -0,0 +1,80 @@
+import os
+import argparse
+
+import numpy as np
+
+from generate_sanitised_data import HEADER_LINES, MAX_READING
+from sample_set import SAPPHO_GEOMETRY, SAMPLE_GEOMETRY
+from heartbeat import FRAME_PERIOD
+
+
+def synthetic_profile(pixels, rng, peak_width=None, background=300.0, peak_height=None):
+    # Forward scattering profile: a bright central lobe with weaker side lobes over a flat background
+    x = np.linspace(-1, 1, pixels)
+    width = peak_width or rng.uniform(0.08, 0.25)
+    height = peak_height or rng.uniform(1500, 3000)
+    ripple = rng.uniform(0.05, 0.2) * np.cos(x * np.pi / width) ** 2
+
+    return background + height * np.exp(-0.5 * (x / width) ** 2) + height * ripple * np.exp(-np.abs(x))
+
+
+def synthetic_frames(pixels, frames, rng, heart_rate=None, noise=25.0, profile=None):
+    # (frames x pixels) readings in 0..MAX_READING: a fixed profile scaled by a pulse-like brightness
+    # variation from frame to frame, plus sensor noise
+    profile = synthetic_profile(pixels, rng) if profile is None else profile
+    heart_rate = heart_rate or rng.uniform(55, 110)
+
+    t = np.arange(frames) * FRAME_PERIOD
+    pulse = 1 + 0.03 * np.sin(2 * np.pi * heart_rate / 60 * t + rng.uniform(0, 2 * np.pi))
+    readings = profile * pulse[:, None] + rng.normal(0, noise, (frames, pixels))
+
+    return np.clip(np.rint(readings), 0, MAX_READING).astype(np.int64)
+
+
+def capture_header(file_name, pixels, frames):
+    lines = ["Synthetic capture %s" % file_name, "Pixels: %d" % pixels, "Frames: %d" % frames, "Readings:"]
+    return "\n".join((lines + [""] * HEADER_LINES)[:HEADER_LINES]) + "\n"
+
+
+def write_capture(file_path, frames):
+    # One reading per line after the header, like the sensor software. Sappho_ files hold the inverted
+    # signal, parse_sample_file flips it back.
+    file_name = os.path.basename(file_path)
+    readings = frames.ravel()
+    if file_name.startswith("Sappho_"):
+        readings = MAX_READING - readings
+
+    with open(file_path, "w") as file:
+        file.write(capture_header(file_name, frames.shape[1], len(frames)))
+        file.write("\n".join(map(str, readings.tolist())))
+        file.write("\n")
+
+
+def generate_captures(directory, files=10, frames=67, pixels=None, prefix="Sappho_", seed=0, start=0):
+    # Writes files captures of frames frames each (67 frames is the 4.47 s of heartbeat.m), returns the paths.
+    # The pixel count defaults to the sensor of the prefix.
+    rng = np.random.default_rng(seed)
+    if pixels is None:
+        pixels = SAMPLE_GEOMETRY.pixels if prefix == "Sample_" else SAPPHO_GEOMETRY.pixels
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for number in range(start, start + files):
+        file_path = os.path.join(directory, "%s%05d.txt" % (prefix, number))
+        write_capture(file_path, synthetic_frames(pixels, frames, rng))
+        paths.append(file_path)
+
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic Sappho_/Sample_ capture files")
+    parser.add_argument("directory", nargs="?", default="./SyntheticSamples", help="output directory")
+    parser.add_argument("--files", type=int, default=10, help="number of capture files")
+    parser.add_argument("--frames", type=int, default=67, help="frames per capture")
+    parser.add_argument("--pixels", type=int, default=None, help="pixels per frame (default: from the prefix)")
+    parser.add_argument("--prefix", choices=("Sappho_", "Sample_"), default="Sappho_", help="capture file prefix")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    generate_captures(args.directory, args.files, args.frames, args.pixels, args.prefix, args.seed)
@@ -0,0 +1,181 @@
+import os
+import sys
+import json
+import glob
+
+import numpy as np
+
+from data_analysis import log_transform, normalize_data
+from dtw import dtw_batch, default_band
+from sample_set import SampleSet, AngleAxis, as_sample_set, geometry_for_pixels
+from sanitised_store import index_file_path, is_binary_file, read_index, load_sanitised_binary, \
+    write_sanitised_binary
+from similarity import pairwise_similarity, METRICS
+
+# A template bank directory holds the log-transformed and normalized Mie curves (templates.bin/.json in the
+# sanitised data format), their PCA features (features.npz) and the settings they were built with (bank.json).
+# The index of templates.bin is marked prepared, so its curves are compared as they are and never
+# log-transformed or normalized again.
+BANK_FORMAT_VERSION = 1
+DEFAULT_COMPONENTS = 16
+DEFAULT_CANDIDATES = 32
+
+
+def read_template_text_files(directory, skip_rows=0):
+    # One curve per text file (e.g. MiePlot exports), the last column holds the intensity. With more than one
+    # column the first holds the angles, kept as the curve's angle axis so it is resampled by angle instead
+    # of by a sensor geometry guessed from its length.
+    rows = []
+    names = []
+    geometries = []
+
+    for file_path in sorted(glob.glob(os.path.join(directory, "*.txt"))):
+        curve = np.loadtxt(file_path, skiprows=skip_rows, ndmin=2)
+        if curve.shape[1] > 1:
+            curve = curve[np.argsort(curve[:, 0], kind="stable")]
+            geometries.append(AngleAxis(tuple(curve[:, 0].tolist())))
+        else:
+            geometries.append(geometry_for_pixels(len(curve)))
+        rows.append(curve[:, -1])
+        names.append(os.path.splitext(os.path.basename(file_path))[0])
+
+    return SampleSet.from_rows(rows, names=names, geometries=geometries)
+
+
+def is_prepared_templates(source):
+    # A template bank directory, or its templates.bin, holds curves that are ready to compare
+    if isinstance(source, SampleSet):
+        return False
+    if os.path.isdir(source):
+        return os.path.exists(os.path.join(source, "bank.json"))
+
+    return is_binary_file(source) and os.path.exists(index_file_path(source)) and \
+        read_index(source).get("prepared", False)
+
+
+def read_prepared_templates(source):
+    if os.path.isdir(source):
+        return TemplateBank.load(source).templates
+
+    return load_sanitised_binary(source)
+
+
+def read_templates(source):
+    if isinstance(source, SampleSet):
+        return source
+    if is_binary_file(source):
+        return load_sanitised_binary(source)
+
+    return read_template_text_files(source)
+
+
+class TemplateBank:
+
+    def __init__(self, templates, mean, components, features, log_scale=True):
+        self.templates = templates  # Log-transformed (if log_scale) and normalized curves
+        self.mean = mean
+        self.components = components  # PCA axes, one per row
+        self.features = features  # Every template projected on the components
+        self.log_scale = log_scale
+        self._index = None
+
+    @classmethod
+    def build(cls, source, n_components=DEFAULT_COMPONENTS, log_scale=True):
+        # source is a SampleSet of raw curves, a sanitised .bin file or a directory of text files
+        templates = read_templates(source).copy()
+        if log_scale:
+            # Turn linear to logarithmic data because of extreme peaks in the middle
+            templates = log_transform(templates)
+        templates = normalize_data(templates)
+
+        values = np.asarray(templates.values, dtype=np.float64)
+        mean = values.mean(axis=0)
+        n_components = min(n_components, *values.shape)
+        _, _, components = np.linalg.svd(values - mean, full_matrices=False)
+        components = components[:n_components]
+
+        return cls(templates, mean, components, (values - mean) @ components.T, log_scale)
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        write_sanitised_binary(self.templates, os.path.join(directory, "templates.bin"),
+                               metadata={"prepared": True, "log_scale": self.log_scale})
+        np.savez(os.path.join(directory, "features.npz"), mean=self.mean, components=self.components,
+                 features=self.features)
+
+        with open(os.path.join(directory, "bank.json"), "w") as file:
+            json.dump({"version": BANK_FORMAT_VERSION, "log_scale": self.log_scale,
+                       "components": len(self.components), "templates": len(self.templates)}, file)
+
+    @classmethod
+    def load(cls, directory):
+        with open(os.path.join(directory, "bank.json"), "r") as file:
+            settings = json.load(file)
+        if settings["version"] > BANK_FORMAT_VERSION:
+            raise ValueError("%s was written by a newer version (%d)" % (directory, settings["version"]))
+
+        # The curves stay memory-mapped, only the shortlisted ones are read when matching
+        templates = load_sanitised_binary(os.path.join(directory, "templates.bin"))
+        with np.load(os.path.join(directory, "features.npz")) as arrays:
+            return cls(templates, arrays["mean"], arrays["components"], arrays["features"], settings["log_scale"])
+
+    def __len__(self):
+        return len(self.templates)
+
+    @property
+    def names(self):
+        return self.templates.names
+
+    def project(self, samples):
+        # PCA features of normalized experimental profiles
+        values = np.asarray(as_sample_set(samples).values, dtype=np.float64)
+
+        return (values - self.mean) @ self.components.T
+
+    def index(self):
+        # k-d tree over the features, built on first use
+        if self._index is None:
+            from sklearn.neighbors import NearestNeighbors
+            self._index = NearestNeighbors(algorithm="kd_tree").fit(self.features)
+
+        return self._index
+
+    def candidates(self, samples, n_candidates=DEFAULT_CANDIDATES):
+        # Indices of the templates nearest to every sample in feature space: (samples x n_candidates)
+        n_candidates = min(n_candidates, len(self))
+        _, indices = self.index().kneighbors(self.project(samples), n_candidates)
+
+        return indices
+
+    def best_matches(self, samples, k=5, metric="r2", n_candidates=DEFAULT_CANDIDATES, band=None):
+        # {sample name: [(template name, value), ...]} with the k best templates of every sample. The exact
+        # metric (any similarity.METRICS entry or "dtw") is only computed on each sample's shortlist.
+        samples = as_sample_set(samples)
+        shortlists = self.candidates(samples, max(k, n_candidates))
+        higher_is_better = METRICS.get(metric, False)
+        matches = {}
+
+        for name, profile, shortlist in zip(samples.names, samples.values, shortlists):
+            shortlist = np.sort(shortlist)
+            templates = np.asarray(self.templates.values[shortlist], dtype=np.float64)
+
+            if metric == "dtw":
+                profile = np.asarray(profile, dtype=np.float64)
+                band = default_band(len(profile)) if band is None else band
+                scores = dtw_batch(np.broadcast_to(profile, templates.shape), templates, band)
+            else:
+                scores = pairwise_similarity(templates, profile, (metric,))[metric].values[:, 0]
+
+            order = np.argsort(-scores if higher_is_better else scores, kind="stable")[:k]
+            matches[name] = [(self.names[shortlist[i]], scores[i].item()) for i in order.tolist()]
+
+        return matches
+
+
+if __name__ == "__main__":
+    # Usage: python template_bank.py SOURCE BANK_DIRECTORY [COMPONENTS]
+    if len(sys.argv) < 3:
+        sys.exit("Usage: python template_bank.py SOURCE BANK_DIRECTORY [COMPONENTS]")
+
+    n_components = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_COMPONENTS
+    TemplateBank.build(sys.argv[1], n_components).save(sys.argv[2])
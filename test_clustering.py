@@ -0,0 +1,52 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+from sklearn.cluster import KMeans
+
+from clustering import ClusterModel, load_or_fit
+
+# The batched k-means against the KMeans fit it replaced
+
+
+def clustered_profiles(rows, seed):
+    rng = np.random.default_rng(seed)
+    centers = rng.random((4, 60)) * 3
+    return centers, centers[rng.integers(0, len(centers), rows)] + rng.normal(0, 0.5, (rows, 60))
+
+
+def test_fit_matches_kmeans_with_the_same_seeds():
+    centers, data = clustered_profiles(500, 0)
+    reference = KMeans(len(centers), init=centers, n_init=1).fit(data)
+
+    # One batch and several batches per pass give the same converged fit
+    for batch_size in (1024, 64):
+        model = ClusterModel(seeds=centers, batch_size=batch_size).fit(data)
+        assert_array_equal(model.predict(data), reference.labels_)
+        assert_allclose(model.centers, reference.cluster_centers_, rtol=1e-10)
+        assert_allclose(model.inertia, reference.inertia_, rtol=1e-10)
+
+
+def test_partial_fit_keeps_a_fitted_model():
+    centers, data = clustered_profiles(600, 1)
+    model = ClusterModel(seeds=centers).fit(data[:300])
+    labels = model.predict(data)
+
+    model.partial_fit(data[300:])
+    assert (model.predict(data) == labels).mean() > 0.95
+
+
+def test_load_or_fit_reuses_the_saved_model(tmp_path):
+    centers, data = clustered_profiles(300, 2)
+    model_file = str(tmp_path / "model.joblib")
+
+    fitted = load_or_fit(data, model_file, seeds=centers)
+    loaded = load_or_fit(data[:10], model_file, seeds=centers)
+    assert loaded is not fitted
+    assert_array_equal(loaded.centers, fitted.centers)
+    assert loaded.n_iter == fitted.n_iter
+
+    # New captures move the saved centroids, other seeds or refit start from the seeds again
+    updated = load_or_fit(data, model_file, seeds=centers, update=data[:50] + 0.1)
+    assert not np.array_equal(updated.centers, fitted.centers)
+    assert_array_equal(ClusterModel.load(model_file).centers, updated.centers)
+    assert_array_equal(load_or_fit(data, model_file, seeds=centers, refit=True).centers, fitted.centers)
+    assert load_or_fit(data, model_file, seeds=centers[:3]).n_clusters == 3
@@ -0,0 +1,38 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from dtw import dtw_matrix, nearest_templates
+
+# Banded DTW and the pruned search against a plain double loop
+
+
+def naive_dtw(query, candidate, band):
+    num_points = len(query)
+    cost = np.full((num_points + 1, num_points + 1), np.inf)
+    cost[0, 0] = 0
+
+    for i in range(1, num_points + 1):
+        for j in range(max(1, i - band), min(num_points, i + band) + 1):
+            cost[i, j] = (query[i - 1] - candidate[j - 1]) ** 2 + min(cost[i - 1, j], cost[i, j - 1], cost[i - 1, j - 1])
+
+    return np.sqrt(cost[num_points, num_points])
+
+
+def test_dtw_matrix_matches_naive_dtw(profiles):
+    theoretical, experimental = profiles(4, 30, 0), profiles(5, 30, 1)
+
+    for band in (0, 3, 30):
+        expected = [[naive_dtw(template, sample, band) for sample in experimental] for template in theoretical]
+        # Pairs batched across queries and templates, whatever the batch and chunk boundaries
+        for batch_size, chunk_size in ((256, 16), (3, 2), (1, 1)):
+            distances = dtw_matrix(theoretical, experimental, band, workers=1, batch_size=batch_size,
+                                   chunk_size=chunk_size)
+            assert_allclose(distances.values, expected, rtol=1e-10)
+
+
+def test_nearest_templates_matches_full_matrix(profiles):
+    theoretical, experimental = profiles(12, 30, 2), profiles(6, 30, 3)
+    distances = dtw_matrix(theoretical, experimental, 3, workers=1).values
+    nearest = nearest_templates(theoretical, experimental, k=3, band=3, workers=1)
+
+    assert_allclose(nearest.distances, np.sort(distances, axis=0)[:3], rtol=1e-10)
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from frame_statistics import FrameAggregator, aggregate_capture, streaming_element_averages
+from generate_sanitised_data import read_text_files, split_data_into_arrays, calculate_element_averages
+
+# The single-pass statistics against numpy over the whole frames matrix
+
+
+def frames(num_frames, pixels, seed):
+    return np.random.default_rng(seed).integers(0, 4097, (num_frames, pixels))
+
+
+def write_capture(file_path, readings):
+    lines = ["header"] * 4 + [str(value) for value in np.ravel(readings)]
+    file_path.write_text("\n".join(lines) + "\n")
+
+
+@pytest.mark.parametrize("chunk_frames", [1, 2, 5, 16, 101])
+@pytest.mark.parametrize("num_frames", [1, 2, 7, 100])
+def test_aggregator_matches_numpy_over_any_chunking(chunk_frames, num_frames):
+    values = frames(num_frames, 12, num_frames)
+    aggregator = FrameAggregator(12)
+    for start in range(0, num_frames, chunk_frames):
+        aggregator.update(values[start:start + chunk_frames])
+
+    statistics = aggregator.result()
+    assert statistics.frames == num_frames
+    assert_allclose(statistics.mean, np.mean(values, axis=0), rtol=1e-12)
+    assert_array_equal(statistics.minimum, values.min(axis=0))
+    assert_array_equal(statistics.maximum, values.max(axis=0))
+    assert_array_equal(statistics.median, np.median(values, axis=0))
+    if num_frames > 1:
+        assert_allclose(statistics.variance, np.var(values, axis=0, ddof=1), rtol=1e-10)
+    else:
+        assert np.isnan(statistics.variance).all()
+
+
+def test_merged_aggregators_match_one_pass():
+    values = frames(60, 9, 0)
+    whole, first, second = FrameAggregator(9), FrameAggregator(9), FrameAggregator(9)
+    whole.update(values)
+    first.update(values[:13])
+    second.update(values[13:])
+    first.merge(second)
+
+    for merged, reference in zip(first.result(), whole.result()):
+        assert_allclose(merged, reference, rtol=1e-10)
+
+
+@pytest.mark.parametrize("chunk_frames", [1, 3, 256])
+def test_streaming_averages_match_the_in_memory_path(tmp_path, chunk_frames):
+    for number, num_frames in enumerate((5, 8, 1)):
+        write_capture(tmp_path / ("Sappho_%05d.txt" % number), frames(num_frames, 6, number))
+    text_files = sorted(str(path) for path in tmp_path.glob("*.txt"))
+
+    streamed = streaming_element_averages(text_files, 6, chunk_frames=chunk_frames)
+    in_memory = calculate_element_averages(split_data_into_arrays(read_text_files(str(tmp_path), cache_dir=None), 6))
+
+    assert streamed.names == in_memory.names
+    assert_allclose(streamed.values, in_memory.values, rtol=1e-6)
+
+    median = aggregate_capture(text_files[0], 6, chunk_frames).median
+    assert_array_equal(median, np.median(4096 - frames(5, 6, 0), axis=0))
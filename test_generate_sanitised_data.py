@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from generate_sanitised_data import parse_sample_file, iter_frame_chunks, ReadingParser
+
+# The vectorised parser against the readlines/isdigit loop it replaced
+
+
+def reference_readings(file_path, file_name):
+    with open(file_path, 'r') as file:
+        lines = file.readlines()
+
+    numbers = []
+    for line in lines[4:]:
+        line = line.strip()
+        if line.isdigit() and 0 <= int(line) <= 4096:
+            numbers.append(4096 - int(line) if file_name.startswith("Sappho_") else int(line))
+
+    return numbers
+
+
+def capture_text(readings, newline="\n", final_newline=True, header_lines=4):
+    lines = ["header %d" % line for line in range(header_lines)] + readings
+    return newline.join(lines) + (newline if final_newline else "")
+
+
+READINGS = ["0", "17", "4096", "4097", "65536", "99999999999", "0042", "  12  ", "\t7", "1 2", "-5", "+5",
+            "3.0", "", "x9", "12a", "000000000000004", "4095", "100000", "123456789012345678901234567890"]
+
+
+@pytest.mark.parametrize("file_name", ["Sample_00001.txt", "Sappho_00001.txt"])
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("final_newline", [True, False])
+def test_parse_sample_file_matches_the_line_loop(tmp_path, file_name, newline, final_newline):
+    file_path = tmp_path / file_name
+    file_path.write_bytes(capture_text(READINGS, newline, final_newline).encode())
+
+    assert parse_sample_file(str(file_path)).tolist() == reference_readings(str(file_path), file_name)
+
+
+@pytest.mark.parametrize("header_lines", [0, 2, 3])
+def test_short_files_have_no_readings(tmp_path, header_lines):
+    file_path = tmp_path / "Sample_00001.txt"
+    file_path.write_bytes(capture_text([], header_lines=header_lines, final_newline=False).encode())
+
+    assert parse_sample_file(str(file_path)).tolist() == reference_readings(str(file_path), "Sample_00001.txt")
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 7, 64, 1 << 20])
+@pytest.mark.parametrize("file_name", ["Sample_00001.txt", "Sappho_00001.txt"])
+def test_frame_chunks_match_the_whole_file(tmp_path, block_size, file_name):
+    readings = [str(value) for value in np.random.default_rng(0).integers(0, 4200, 5 * 8 + 3)] + READINGS
+    file_path = tmp_path / file_name
+    file_path.write_bytes(capture_text(readings, "\r\n", final_newline=False).encode())
+
+    numbers = parse_sample_file(str(file_path))
+    expected = numbers[:len(numbers) // 8 * 8].reshape(-1, 8)
+    chunks = list(iter_frame_chunks(str(file_path), 8, chunk_frames=2, block_size=block_size))
+
+    assert all(len(chunk) <= 2 for chunk in chunks)
+    assert_array_equal(np.concatenate(chunks), expected)
+
+
+@pytest.mark.parametrize("file_name", ["Sample_00001.txt", "Sappho_00001.txt"])
+def test_reading_parser_fed_in_pieces_matches_the_whole_file(tmp_path, file_name):
+    file_path = tmp_path / file_name
+    text = capture_text(READINGS, "\r\n", final_newline=False).encode()
+    file_path.write_bytes(text)
+
+    parser = ReadingParser(flip=file_name.startswith("Sappho_"))
+    cuts = np.sort(np.random.default_rng(1).integers(0, len(text), 12)).tolist()
+    pieces = [text[start:stop] for start, stop in zip([0] + cuts, cuts + [len(text)])]
+    numbers = [parser.feed(piece) for piece in pieces] + [parser.feed(b"", final=True)]
+
+    assert np.concatenate(numbers).tolist() == reference_readings(str(file_path), file_name)
@@ -0,0 +1,18 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from generate_sanitised_data import parse_sample_file, MAX_READING
+from heartbeat import follow_frames
+
+
+def test_follow_frames_keeps_the_readings_as_recorded(tmp_path):
+    # Like heartbeat.m the signal is not flipped unless asked for
+    readings = np.random.default_rng(0).integers(0, MAX_READING, 3 * 5 + 2)
+    file_path = tmp_path / "Sappho_00001.txt"
+    file_path.write_bytes(("h\n" * 4 + "\n".join(map(str, readings)) + "\n").encode())
+
+    frames = np.concatenate(list(follow_frames(str(file_path), 5, idle_timeout=0, block_size=7)))
+    flipped = np.concatenate(list(follow_frames(str(file_path), 5, idle_timeout=0, flip=True)))
+
+    assert_array_equal(frames, readings[:15].reshape(3, 5))
+    assert_array_equal(flipped, parse_sample_file(str(file_path))[:15].reshape(3, 5))
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from resampling import resample_to_common_grid, sensor_angles
+from sample_set import SampleSet, AngleAxis, SAMPLE_GEOMETRY
+from sanitised_store import write_sanitised_binary, load_sanitised_binary
+from template_bank import read_template_text_files
+
+# Templates with their own angle axis against np.interp, and rows whose angles are unknown
+
+
+def test_angle_axis_templates_resample_like_interp(profiles):
+    angles = np.linspace(-20, 20, 200)
+    templates = SampleSet(profiles(3, 200, 0), ["a", "b", "c"], geometries=[AngleAxis(tuple(angles))] * 3)
+    captures = SampleSet(profiles(2, 128, 1), ["0", "1"], geometries=[SAMPLE_GEOMETRY] * 2)
+
+    grid, (resampled_templates, resampled_captures) = resample_to_common_grid([templates, captures])
+
+    sensor = sensor_angles(SAMPLE_GEOMETRY)
+    assert grid[0] == sensor[0] and grid[-1] == sensor[-1]
+    for row, template in enumerate(templates.values):
+        assert_allclose(resampled_templates.values[row], np.interp(grid, angles, template), rtol=1e-5)
+    for row, capture in enumerate(captures.values):
+        assert_allclose(resampled_captures.values[row], np.interp(grid, sensor, capture), rtol=1e-5)
+
+
+def test_rows_without_angles_are_rejected(profiles):
+    templates = SampleSet(profiles(2, 200, 0), ["a", "b"])  # 200 points match no known sensor
+    captures = SampleSet(profiles(2, 128, 1), ["0", "1"])
+
+    with pytest.raises(ValueError, match="'a'"):
+        resample_to_common_grid([templates, captures])
+
+
+def test_text_templates_keep_their_angle_column(tmp_path):
+    angles = np.linspace(20, -20, 50)  # Exports may list the angles in decreasing order
+    np.savetxt(str(tmp_path / "curve.txt"), np.c_[angles, np.cos(np.radians(angles))])
+
+    templates = read_template_text_files(str(tmp_path))
+    assert_allclose(templates.geometries[0].angles, angles[::-1])
+    assert_allclose(templates.values[0], np.cos(np.radians(angles[::-1])), rtol=1e-6)
+
+    write_sanitised_binary(templates, str(tmp_path / "templates.bin"))
+    assert load_sanitised_binary(str(tmp_path / "templates.bin")).geometries == templates.geometries
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from results_store import ResultsStore, StoredRunMismatch
+from sample_set import SampleSet
+from similarity import pairwise_similarity
+
+# Stored samples are rewritten when their profiles change under the same name
+
+
+def r2(templates, samples):
+    return pairwise_similarity(templates, samples, ("r2",))["r2"]
+
+
+def test_write_keeps_unchanged_rows_and_rewrites_changed_ones(tmp_path, profiles):
+    store = ResultsStore(str(tmp_path))
+    templates = SampleSet(profiles(3, 20, 0), ["a", "b", "c"])
+    samples = SampleSet(profiles(4, 20, 1), ["0", "1", "2", "3"])
+
+    assert store.write("r2", r2(templates, samples), inputs=(templates, samples)) == 4
+    assert store.write("r2", r2(templates, samples), inputs=(templates, samples)) == 0
+
+    # Text input names its rows by position, a new batch reuses the names of the previous one
+    changed = SampleSet(np.vstack((samples.values[:2], profiles(3, 20, 2))),
+                        ["0", "1", "2", "3", "4"])
+    assert store.write("r2", r2(templates, changed), inputs=(templates, changed)) == 3
+
+    stored = store.load("r2")
+    assert stored.column_labels == changed.names
+    assert_allclose(np.asarray(stored.values), r2(templates, changed).values)
+
+
+def test_write_refuses_other_templates_or_parameters_unless_replaced(tmp_path, profiles):
+    store = ResultsStore(str(tmp_path))
+    templates = SampleSet(profiles(3, 20, 0), ["a", "b", "c"])
+    samples = SampleSet(profiles(4, 20, 1), ["0", "1", "2", "3"])
+    store.write("r2", r2(templates, samples), {"band": 1}, inputs=(templates, samples))
+
+    linear = SampleSet(np.exp(templates.values), templates.names)
+    with pytest.raises(StoredRunMismatch):
+        store.write("r2", r2(linear, samples), {"band": 1}, inputs=(linear, samples))
+    with pytest.raises(StoredRunMismatch):
+        store.write("r2", r2(templates, samples), {"band": 2}, inputs=(templates, samples))
+
+    store.write("r2", r2(linear, samples), {"band": 2}, replace=True, inputs=(linear, samples))
+    assert store.parameters("r2") == {"band": 2}
+    assert_allclose(np.asarray(store.load("r2").values), r2(linear, samples).values)
@@ -0,0 +1,53 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from scipy.stats import pearsonr, ks_2samp
+from sklearn.metrics import r2_score
+
+from similarity import pairwise_similarity, ks_matrix
+
+# The batched engines against the per-pair scipy/sklearn calls they replaced
+
+
+def test_pairwise_similarity_matches_per_pair_references(profiles):
+    theoretical, experimental = profiles(4, 50, 0), profiles(7, 50, 1)
+    results = pairwise_similarity(theoretical, experimental, block_size=3, max_block_bytes=1)
+
+    for i, template in enumerate(theoretical):
+        for j, sample in enumerate(experimental):
+            assert_allclose(results["r2"].values[i, j], r2_score(template, sample), rtol=1e-10)
+            assert_allclose(results["pearson"].values[i, j], pearsonr(template, sample)[0], rtol=1e-10)
+            assert_allclose(results["euclidean"].values[i, j], np.linalg.norm(template - sample), rtol=1e-10)
+
+
+def test_float64_input_is_not_downcast():
+    theoretical = np.array([[0.0, 1.0, 1.0 + 1e-9]])
+    experimental = np.array([[0.0, 1.0, 1.0]])
+
+    distance = pairwise_similarity(theoretical, experimental, ("euclidean",))["euclidean"].values[0, 0]
+    assert_allclose(distance, theoretical[0, 2] - 1.0, rtol=1e-12)
+
+
+def test_nearly_identical_profiles_keep_their_distance(profiles):
+    # The best matches differ by far less than the profile scale
+    theoretical = profiles(2, 1500, 2) * 1000
+    for offset in (1e-6, 1e-9):
+        experimental = theoretical + offset
+        results = pairwise_similarity(theoretical, experimental, ("euclidean", "r2"))
+
+        for i in range(2):
+            expected = np.linalg.norm(theoretical[i] - experimental[i])
+            assert_allclose(results["euclidean"].values[i, i], expected, rtol=1e-6)
+            assert_allclose(results["r2"].values[i, i], r2_score(theoretical[i], experimental[i]), rtol=1e-12)
+
+
+def test_ks_matrix_matches_ks_2samp(profiles):
+    # Rounded values so ties between and within profiles are exercised
+    theoretical = np.round(profiles(3, 40, 2), 1)
+    experimental = np.round(profiles(5, 30, 3), 1)
+    results = ks_matrix(theoretical, experimental, pvalues=True, block_size=2)
+
+    for i, template in enumerate(theoretical):
+        for j, sample in enumerate(experimental):
+            reference = ks_2samp(template, sample)
+            assert_allclose(results["statistic"].values[i, j], reference.statistic, rtol=1e-12)
+            assert_allclose(results["pvalue"].values[i, j], reference.pvalue, rtol=1e-10)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from scipy.signal import csd, correlate
+
+from spectral import coherence_matrix, cross_correlation_summary
+
+# The batched spectral engines against per-pair scipy.signal calls
+
+
+def reference_coherence(template, sample, nperseg):
+    pxy = csd(template, sample, nperseg=nperseg)[1]
+    pxx = csd(template, template, nperseg=nperseg)[1].real
+    pyy = csd(sample, sample, nperseg=nperseg)[1].real
+
+    return np.mean(np.abs(pxy) ** 2 / (pxx * pyy))
+
+
+@pytest.mark.parametrize("lengths", [(128, 128), (128, 500), (500, 128)])
+def test_coherence_matrix_matches_csd(profiles, lengths):
+    # Templates and captures of different sensors: csd zero-pads the shorter signal for the cross spectrum
+    theoretical, experimental = profiles(3, lengths[0], 0), profiles(5, lengths[1], 1)
+    coherences = coherence_matrix(theoretical, experimental, nperseg=32, cache_dir=None, max_block_bytes=1)
+
+    for i, template in enumerate(theoretical):
+        for j, sample in enumerate(experimental):
+            assert_allclose(coherences.values[i, j], reference_coherence(template, sample, 32), rtol=1e-10)
+
+
+def test_coherence_matrix_rejects_segments_longer_than_a_profile(profiles):
+    with pytest.raises(ValueError, match="nperseg"):
+        coherence_matrix(profiles(2, 100, 0), profiles(2, 130, 1), nperseg=256, cache_dir=None)
+
+
+def test_cross_correlation_summary_matches_full_correlate(profiles):
+    theoretical, experimental = profiles(3, 40, 2), profiles(4, 25, 3)
+    summary = cross_correlation_summary(theoretical, experimental, max_block_bytes=1)
+    lags = np.arange(-(experimental.shape[1] - 1), theoretical.shape[1])
+
+    for i, template in enumerate(theoretical):
+        for j, sample in enumerate(experimental):
+            curve = correlate(template, sample, mode="full")
+            assert_allclose(summary["peak"].values[i, j], curve.max(), rtol=1e-10)
+            assert summary["lag"].values[i, j] == lags[curve.argmax()]
+            assert_allclose(summary["zero_lag"].values[i, j], curve[lags == 0][0], rtol=1e-10)
+
+
+def test_peak_lag_does_not_rank_templates(profiles):
+    summary = cross_correlation_summary(profiles(3, 40, 2), profiles(4, 25, 3))
+
+    assert len(summary["peak"].best_matches(1)) == 4
+    with pytest.raises(ValueError):
+        summary["lag"].best_matches(1)
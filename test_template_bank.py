@@ -0,0 +1,25 @@
+import os
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from pipeline import load_prepared_templates, prepare_templates
+from sample_set import SampleSet
+from template_bank import TemplateBank, is_prepared_templates
+
+# A saved bank is used as it is, its curves are never prepared a second time
+
+
+def test_saved_bank_templates_are_not_prepared_again(tmp_path, profiles):
+    curves = SampleSet(profiles(20, 64, 0) + 0.1, ["curve %d" % row for row in range(20)])
+    bank = TemplateBank.build(curves, 4)
+    bank.save(str(tmp_path))
+
+    for source in (str(tmp_path), os.path.join(str(tmp_path), "templates.bin")):
+        assert is_prepared_templates(source)
+        templates = load_prepared_templates(source)
+        assert templates.names == curves.names
+        assert_array_equal(templates.values, bank.templates.values)
+        assert np.isfinite(templates.values).all()
+
+    assert_array_equal(bank.templates.values, prepare_templates(curves, True).values)
@@ -0,0 +1,74 @@
+import numpy as np
+
+from sample_set import as_sample_set
+
+# Coefficient lists follow pywt.wavedec: [cA_level, cD_level, ..., cD1], every entry is a (rows x length) array
+
+
+def wavelet_decompose(data, wavelet="haar", level=1, mode="symmetric"):
+    # Multilevel DWT of every row of a batch in one call along the pixel axis
+    values = np.asarray(as_sample_set(data).values, dtype=np.float64)
+
+    import pywt
+    return pywt.wavedec(values, wavelet, mode=mode, level=level, axis=1)
+
+
+def universal_threshold(coefficients):
+    # VisuShrink threshold per row, the noise level is estimated from the finest detail coefficients
+    finest = coefficients[-1]
+    sigma = np.median(np.abs(finest), axis=1) / 0.6745
+    num_points = sum(level.shape[1] for level in coefficients)
+
+    return sigma * np.sqrt(2 * np.log(num_points))
+
+
+def threshold_coefficients(coefficients, threshold=None, mode="soft"):
+    # Shrink the detail coefficients of every row, the approximation is kept as is
+    if threshold is None:
+        threshold = universal_threshold(coefficients)
+    threshold = np.broadcast_to(np.asarray(threshold, dtype=np.float64), (len(coefficients[0]),))[:, None]
+
+    import pywt
+    return [coefficients[0]] + [pywt.threshold(detail, threshold, mode=mode) for detail in coefficients[1:]]
+
+
+def wavelet_denoise(data, wavelet="db4", level=3, threshold=None, mode="soft"):
+    # Denoised copy of every row: decompose, threshold the details, reconstruct
+    values = np.asarray(as_sample_set(data).values)
+    coefficients = threshold_coefficients(wavelet_decompose(data, wavelet, level), threshold, mode)
+
+    import pywt
+    return pywt.waverec(coefficients, wavelet, mode="symmetric", axis=1)[:, :values.shape[1]]
+
+
+def wavelet_features(coefficients, include_approximation=False):
+    # Share of every row's energy in each band (approximation first), optionally followed by the
+    # approximation coefficients themselves. Compact enough for matching and clustering.
+    energies = np.stack([np.einsum("ij,ij->i", level, level) for level in coefficients], axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        features = energies / energies.sum(axis=1, keepdims=True)
+
+    if include_approximation:
+        features = np.concatenate((features, coefficients[0]), axis=1)
+
+    return features
+
+
+def save_coefficients(coefficients, file_path, names=None, wavelet="haar"):
+    # One binary array per level: cA<level>, cD<level> ... cD1
+    level = len(coefficients) - 1
+    arrays = {"cA%d" % level: coefficients[0]}
+    arrays.update({"cD%d" % (level - i): detail for i, detail in enumerate(coefficients[1:])})
+    if names is not None:
+        arrays["names"] = np.array(names)
+
+    np.savez(file_path, wavelet=np.array(wavelet), level=np.array(level), **arrays)
+
+
+def load_coefficients(file_path):
+    with np.load(file_path) as arrays:
+        level = int(arrays["level"])
+        coefficients = [arrays["cA%d" % level]] + [arrays["cD%d" % i] for i in range(level, 0, -1)]
+        names = arrays["names"].tolist() if "names" in arrays else None
+
+        return coefficients, names, str(arrays["wavelet"])